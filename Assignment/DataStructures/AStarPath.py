@@ -0,0 +1,19 @@
+from .DSALinkedList import DSALinkedList
+
+
+class AStarPath:
+    """Container for A* pathfinding results."""
+    
+    def __init__(self, path=None, cost=0, expanded=None):
+        self.path = path if path is not None else DSALinkedList()
+        self.cost = cost
+        self.expanded = expanded  # vertices the search expanded, if it counted them
+    
+    def getPath(self):
+        return self.path
+    
+    def getCost(self):
+        return self.cost
+    
+    def getExpanded(self):
+        return self.expanded
@@ -0,0 +1,87 @@
+import numpy as np
+from .DSALinkedList import DSALinkedList
+from .AStarPath import AStarPath
+from .DSACSRGraph import DSACSRGraph
+
+
+class DSAAllPairsTable:
+    """
+    Precomputed all-pairs shortest-path table over a DSACSRGraph snapshot.
+
+    dist[i, j] is the shortest walking cost between vertex ids i and j, and
+    next_hop[i, j] is the first vertex after i on that shortest path, so any
+    route is recovered in O(path length). The snapshot is kept with the table
+    so a persisted table can be checked against the current graph.
+    """
+
+    def __init__(self, snapshot, dist, next_hop):
+        self.snapshot = snapshot
+        self.dist = dist
+        self.next_hop = next_hop
+
+    @classmethod
+    def fromSnapshot(cls, csr):
+        """Build the table with one Dijkstra run per source: O(V (V + E) log V)."""
+        vertex_count = csr.getVertexCount()
+        dist = np.full((vertex_count, vertex_count), np.inf)
+        next_hop = np.full((vertex_count, vertex_count), -1, dtype=np.int32)
+
+        for source in range(vertex_count):
+            source_dist, parent = csr.dijkstra(source)
+            dist[source] = source_dist
+            # In an undirected graph the parent of u in the tree rooted at source
+            # is the next hop from u towards source.
+            next_hop[:, source] = parent
+
+        return cls(csr, dist, next_hop)
+
+    def getVertexCount(self):
+        return self.snapshot.getVertexCount()
+
+    def getDistance(self, start_label, goal_label):
+        snapshot = self.snapshot
+        return snapshot.asCost(self.dist[snapshot.getId(start_label), snapshot.getId(goal_label)])
+
+    def getPath(self, start_label, goal_label):
+        """
+        Look up the shortest path by following next hops.
+
+        Returns:
+            AStarPath: Path as a DSALinkedList of labels and its total cost;
+            an empty path with infinite cost if the goal is unreachable.
+        """
+        snapshot = self.snapshot
+        start = snapshot.getId(start_label)
+        goal = snapshot.getId(goal_label)
+        if self.dist[start, goal] == np.inf:
+            return AStarPath(DSALinkedList(), float('inf'))
+
+        path = DSALinkedList()
+        current = start
+        path.insertLast(snapshot.labels[current])
+        while current != goal:
+            current = self.next_hop[current, goal]
+            path.insertLast(snapshot.labels[current])
+        return AStarPath(path, snapshot.asCost(self.dist[start, goal]))
+
+    def matchesSnapshot(self, csr):
+        """True if the table was computed from a graph identical to this snapshot."""
+        return self.snapshot.matches(csr)
+
+    def save(self, file_path):
+        """Persist the table (and the snapshot it was built from) to an .npz file."""
+        DSACSRGraph.writeArrays(file_path, compressed=True,
+                                labels=self.snapshot.labels.astype(str),
+                                dist=self.dist,
+                                next_hop=self.next_hop,
+                                offsets=self.snapshot.offsets,
+                                neighbors=self.snapshot.neighbors,
+                                weights=self.snapshot.weights)
+
+    @classmethod
+    def load(cls, file_path):
+        """Load a table written by save()."""
+        with np.load(file_path, allow_pickle=False) as data:
+            snapshot = DSACSRGraph(data["labels"].astype(object), data["offsets"],
+                                   data["neighbors"], data["weights"])
+            return cls(snapshot, data["dist"], data["next_hop"])
@@ -0,0 +1,575 @@
+import os
+import tempfile
+import numpy as np
+from .DSALinkedList import DSALinkedList
+from .DSAHeapMin import DSAHeapMin
+from .DSAIndexedHeapMin import DSAIndexedHeapMin
+from .DSAHashTable import DSAHashTable
+from .AStarPath import AStarPath
+
+
+class DSACSRGraph:
+    """
+    Read-only compressed sparse row (CSR) snapshot of a DSAWeightedGraph.
+
+    Vertex labels are interned to integer ids 0..V-1 (in vertex insertion order).
+    The neighbours of vertex u are neighbors[offsets[u]:offsets[u + 1]], with the
+    matching corridor weights in the same slice of weights. Each undirected edge
+    is stored once per direction, so len(neighbors) == 2 * |E|.
+
+    The snapshot never changes after construction; the mutable DSAWeightedGraph
+    remains the source of truth and rebuilds the snapshot on demand.
+    """
+
+    def __init__(self, labels, offsets, neighbors, weights, version=None):
+        self.labels = labels
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.version = version
+        self._index = DSAHashTable(capacity=2 * len(labels))
+        for vertex_id in range(len(labels)):
+            self._index.put(labels[vertex_id], vertex_id)
+
+    def __getstate__(self):
+        """Pickle only the arrays; the label index is rebuilt on load (keeps worker copies compact)."""
+        return {"labels": self.labels, "offsets": self.offsets, "neighbors": self.neighbors,
+                "weights": self.weights, "version": self.version}
+
+    def __setstate__(self, state):
+        self.__init__(state["labels"], state["offsets"], state["neighbors"],
+                      state["weights"], state["version"])
+
+    @classmethod
+    def fromGraph(cls, graph):
+        """Build a snapshot from a DSAWeightedGraph in O(V + E)."""
+        vertex_count = graph.getVertexCount()
+        labels = np.empty(vertex_count, dtype=object)
+        ids = DSAHashTable(capacity=2 * vertex_count)
+        degrees = np.zeros(vertex_count, dtype=np.int64)
+        integral = True
+
+        vertex_id = 0
+        for node in graph._vertices:
+            labels[vertex_id] = node.label
+            ids.put(node.label, vertex_id)
+            for edge in node.getAdjacent():
+                degrees[vertex_id] += 1
+                if not isinstance(edge.getWeight(), (int, np.integer)):
+                    integral = False
+            vertex_id += 1
+
+        offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        id_dtype = np.int32 if vertex_count < 2 ** 31 else np.int64
+        neighbors = np.empty(offsets[-1], dtype=id_dtype)
+        weights = np.empty(offsets[-1], dtype=np.int64 if integral else np.float64)
+
+        position = 0
+        for node in graph._vertices:
+            for edge in node.getAdjacent():
+                neighbors[position] = ids.get(edge.getDestination().label)
+                weights[position] = edge.getWeight()
+                position += 1
+
+        return cls(labels, offsets, neighbors, weights, graph.getVersion())
+
+    @staticmethod
+    def writeArrays(file_path, compressed=False, **arrays):
+        """
+        Write arrays to an .npz file atomically: they go to a temporary file in
+        the same directory, which then replaces file_path, so an interrupted
+        save leaves the previous file (or none) rather than a truncated one.
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
+        handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                if compressed:
+                    np.savez_compressed(file, **arrays)
+                else:
+                    np.savez(file, **arrays)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def getVertexCount(self):
+        return len(self.labels)
+
+    def getEdgeCount(self):
+        return len(self.neighbors) // 2
+
+    def hasVertex(self, label):
+        return self._index.hasKey(str(label))
+
+    def getId(self, label):
+        """Get the interned id of a label, raise ValueError if not found."""
+        try:
+            return self._index.get(str(label))
+        except KeyError:
+            raise ValueError(f"Vertex '{label}' not found")
+
+    def getLabel(self, vertex_id):
+        return self.labels[vertex_id]
+
+    def neighborsOf(self, vertex_id):
+        """Return (neighbor ids, weights) slices for a vertex."""
+        start = self.offsets[vertex_id]
+        end = self.offsets[vertex_id + 1]
+        return self.neighbors[start:end], self.weights[start:end]
+
+    def nbytes(self):
+        """Memory used by the adjacency arrays in bytes."""
+        return self.offsets.nbytes + self.neighbors.nbytes + self.weights.nbytes
+
+    def _gather_neighbors(self, frontier):
+        """Concatenate the neighbour slices of every vertex in frontier (vectorized)."""
+        starts = self.offsets[frontier]
+        counts = self.offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=self.neighbors.dtype)
+        # Position of each gathered slot = slice start + offset within its slice
+        slot_base = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self.neighbors[slot_base + np.arange(total)]
+
+    def asCost(self, value, integral=None):
+        """
+        Convert an accumulated cost back to the weight type of the snapshot:
+        int for integer weights, float otherwise, and float('inf') when
+        unreachable. integral overrides the type taken from the weights.
+        """
+        if value == float('inf'):
+            return float('inf')
+        if integral is None:
+            integral = np.issubdtype(self.weights.dtype, np.integer)
+        return int(value) if integral else float(value)
+
+    def matches(self, other):
+        """True if other is a snapshot of an identical graph (labels, corridors and weights)."""
+        return (self.getVertexCount() == other.getVertexCount()
+                and np.array_equal(self.labels.astype(str), other.labels.astype(str))
+                and np.array_equal(self.offsets, other.offsets)
+                and np.array_equal(self.neighbors, other.neighbors)
+                and np.array_equal(self.weights, other.weights))
+
+    def _build_path(self, parent, goal_id):
+        path = DSALinkedList()
+        current = goal_id
+        while current != -1:
+            path.insertFirst(self.labels[current])
+            current = parent[current]
+        return path
+
+    def breadthFirstSearch(self, source_label):
+        """
+        Level-by-level BFS over the snapshot.
+        Returns a DSALinkedList of levels, each a DSALinkedList of labels.
+        """
+        source = self.getId(source_label)
+        visited = np.zeros(self.getVertexCount(), dtype=bool)
+        visited[source] = True
+
+        levels = DSALinkedList()
+        frontier = np.array([source], dtype=np.int64)
+        while len(frontier) > 0:
+            level = DSALinkedList()
+            for vertex_id in frontier:
+                level.insertLast(self.labels[vertex_id])
+            levels.insertLast(level)
+
+            candidates = self._gather_neighbors(frontier)
+            candidates = candidates[~visited[candidates]]
+            # Keep first-discovery order, matching the queue-based traversal
+            _, first_seen = np.unique(candidates, return_index=True)
+            frontier = candidates[np.sort(first_seen)].astype(np.int64)
+            visited[frontier] = True
+
+        return levels
+
+    def depthFirstSearch(self, start_label):
+        """
+        Iterative DFS that returns a cycle through the start vertex as a
+        DSALinkedList of labels, or an empty list if no such cycle exists.
+        """
+        start = self.getId(start_label)
+        vertex_count = self.getVertexCount()
+        visited = np.zeros(vertex_count, dtype=bool)
+        parent = np.full(vertex_count, -1, dtype=np.int64)
+        next_slot = self.offsets[:-1].copy()
+
+        stack = np.empty(vertex_count, dtype=np.int64)
+        depth = 0
+        stack[0] = start
+        visited[start] = True
+
+        while depth >= 0:
+            current = stack[depth]
+            if next_slot[current] == self.offsets[current + 1]:
+                depth -= 1  # all neighbours explored, backtrack
+                continue
+            neighbor = self.neighbors[next_slot[current]]
+            next_slot[current] += 1
+
+            if neighbor == parent[current]:
+                continue
+            if neighbor == start and depth >= 2:
+                cycle = DSALinkedList()
+                for i in range(depth + 1):
+                    cycle.insertLast(self.labels[stack[i]])
+                return cycle
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                parent[neighbor] = current
+                depth += 1
+                stack[depth] = neighbor
+
+        return DSALinkedList()
+
+    def dijkstra(self, source, weights=None):
+        """
+        Single-source shortest paths from a vertex id.
+        weights optionally overrides the corridor weights (same slot layout).
+
+        Returns:
+            tuple: (dist, parent) arrays indexed by vertex id; unreachable vertices
+            have dist inf and parent -1, as does the source's parent.
+        """
+        if weights is None:
+            weights = self.weights
+        vertex_count = self.getVertexCount()
+        dist = np.full(vertex_count, np.inf)
+        parent = np.full(vertex_count, -1, dtype=np.int64)
+        settled = np.zeros(vertex_count, dtype=bool)
+        handles = np.empty(vertex_count, dtype=object)
+
+        dist[source] = 0
+        frontier = DSAIndexedHeapMin()
+        handles[source] = frontier.add(0, source)
+
+        while not frontier.isEmpty():
+            current = frontier.remove()
+            settled[current] = True
+            current_dist = dist[current]
+
+            start = self.offsets[current]
+            end = self.offsets[current + 1]
+            for slot in range(start, end):
+                neighbor = self.neighbors[slot]
+                if settled[neighbor]:
+                    continue
+                tentative = current_dist + weights[slot]
+                if tentative < dist[neighbor]:
+                    dist[neighbor] = tentative
+                    parent[neighbor] = current
+                    if handles[neighbor] is None:
+                        handles[neighbor] = frontier.add(tentative, neighbor)
+                    else:
+                        frontier.decrease_key(handles[neighbor], tentative)
+
+        return dist, parent
+
+    def shortestCycle(self, start_label, weighted=True):
+        """
+        Shortest simple cycle through a vertex in O((V + E) log V).
+
+        One Dijkstra run (unit weights if weighted is False) labels every vertex
+        with the branch of the tree it hangs from, i.e. the first vertex after
+        the start on its shortest path. An edge joining two different branches
+        closes the cycle start ~> u - v ~> start of cost d(u) + w + d(v), as does
+        a non-tree edge from the start; the cheapest such edge gives the answer.
+
+        Returns:
+            AStarPath: Cycle as a DSALinkedList of labels beginning with the start
+            (not repeated at the end) and its total cost; an empty path with
+            infinite cost if the start is on no cycle.
+        """
+        start = self.getId(start_label)
+        weights = self.weights if weighted else np.ones(len(self.weights), dtype=np.int64)
+        dist, parent = self.dijkstra(start, weights)
+
+        # Branch of each reachable vertex, filled in order of distance so that a
+        # parent is always labelled before its children
+        branch = np.full(self.getVertexCount(), -1, dtype=np.int64)
+        for vertex_id in np.argsort(dist, kind="stable"):
+            if dist[vertex_id] == np.inf:
+                break
+            if parent[vertex_id] == start:
+                branch[vertex_id] = vertex_id
+            elif parent[vertex_id] != -1:
+                branch[vertex_id] = branch[parent[vertex_id]]
+
+        tails = np.repeat(np.arange(self.getVertexCount()), np.diff(self.offsets))
+        heads = self.neighbors
+        reachable = (dist[tails] != np.inf) & (dist[heads] != np.inf)
+        crossing = (reachable & (tails != start) & (heads != start)
+                    & (branch[tails] != branch[heads]))
+        closing = reachable & (tails == start) & (parent[heads] != start)
+
+        costs = np.full(len(heads), np.inf)
+        costs[crossing] = dist[tails[crossing]] + weights[crossing] + dist[heads[crossing]]
+        costs[closing] = dist[heads[closing]] + weights[closing]
+        if len(costs) == 0 or costs.min() == np.inf:
+            return AStarPath(DSALinkedList(), float('inf'))
+
+        slot = int(np.argmin(costs))
+        cycle = self._build_path(parent, heads[slot])
+        if tails[slot] != start:
+            # Walk back down the other branch: v's path reversed, minus the start
+            current = tails[slot]
+            back = DSALinkedList()
+            while current != start:
+                back.insertLast(self.labels[current])
+                current = parent[current]
+            for label in back:
+                cycle.insertLast(label)
+        return AStarPath(cycle, self.asCost(costs[slot]) if weighted else int(costs[slot]))
+
+    def kShortestPaths(self, start_label, goal_label, k=3, tree=None):
+        """
+        Yen's k shortest loopless paths, cheapest first.
+
+        A single Dijkstra run from the goal gives the reverse shortest-path tree
+        (edges are undirected): the exact remaining cost to the goal from every
+        vertex, and a next hop towards it. A spur path follows that tree outright
+        when the tree route avoids the root path and the banned corridors;
+        otherwise it is an A* search with the tree distance as its heuristic,
+        which stays admissible and consistent once vertices are removed. Spur
+        results are cached per root path and only recomputed when a newly
+        accepted route bans their first corridor.
+
+        Args:
+            start_label: Label of the starting vertex
+            goal_label: Label of the destination vertex
+            k (int): Maximum number of routes
+            tree: Optional up-to-date DSAShortestPathTree rooted at the goal
+                  (same vertex ids), used instead of running Dijkstra again
+
+        Returns:
+            DSALinkedList: Up to k AStarPath objects in order of cost; empty if
+            the goal is unreachable from the start.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        start = self.getId(start_label)
+        goal = self.getId(goal_label)
+        routes = DSALinkedList()
+        if tree is None:
+            to_goal, next_hop = self.dijkstra(goal)
+        elif tree.source != goal:
+            raise ValueError(f"Shortest-path tree is not rooted at '{goal_label}'")
+        else:
+            to_goal, next_hop = tree.dist, tree.parent
+        if to_goal[start] == np.inf:
+            return routes
+
+        vertex_count = self.getVertexCount()
+        # Spur-search scratch arrays, allocated once and reset after every search
+        search = (np.full(vertex_count, np.inf), np.full(vertex_count, -1, dtype=np.int64),
+                  np.empty(vertex_count, dtype=object), np.zeros(vertex_count, dtype=np.int8))
+        blocked = np.zeros(vertex_count, dtype=bool)  # root path vertices before the spur
+        banned = np.zeros(vertex_count, dtype=bool)  # first hops already taken from the spur
+        spur_cache = DSAHashTable()
+        seen = DSAHashTable()
+        candidates = DSAHeapMin()
+        accepted = DSALinkedList()
+
+        ids, cum = self._tree_route(start, to_goal, next_hop)
+        seen.put(self._route_key(ids), ids)
+        while True:
+            accepted.insertLast((ids, cum))
+            routes.insertLast(AStarPath(self._label_path(ids), self.asCost(cum[-1])))
+            if routes.getCount() == k:
+                break
+
+            for i in range(len(ids) - 1):
+                spur = ids[i]
+                first_hops = DSALinkedList()
+                for other_ids, _ in accepted:
+                    if len(other_ids) > i + 1 and np.array_equal(other_ids[:i + 1], ids[:i + 1]):
+                        first_hops.insertLast(other_ids[i + 1])
+
+                root = ids[:i + 1]
+                root_key = self._route_key(root)
+                if spur_cache.hasKey(root_key) and np.array_equal(spur_cache.get(root_key)[0], root):
+                    cached = spur_cache.get(root_key)[1]
+                    # Still valid: its candidate is already queued or accepted
+                    if cached is None or cached[0][1] not in first_hops:
+                        continue
+
+                blocked[ids[:i]] = True
+                for hop in first_hops:
+                    banned[hop] = True
+                spur_route = self._spur_route(spur, goal, to_goal, next_hop, blocked, banned, search)
+                blocked[ids[:i]] = False
+                for hop in first_hops:
+                    banned[hop] = False
+
+                spur_cache.put(root_key, (root, spur_route))
+                if spur_route is None:
+                    continue
+                candidate_ids = np.concatenate((ids[:i], spur_route[0]))
+                candidate_key = self._route_key(candidate_ids)
+                if not (seen.hasKey(candidate_key) and np.array_equal(seen.get(candidate_key), candidate_ids)):
+                    seen.put(candidate_key, candidate_ids)
+                    candidate_cum = np.concatenate((cum[:i], cum[i] + spur_route[1]))
+                    candidates.add(candidate_cum[-1], (candidate_ids, candidate_cum))
+
+            if candidates.isEmpty():
+                break
+            ids, cum = candidates.remove()
+
+        return routes
+
+    def _tree_route(self, source, to_goal, next_hop):
+        """Route from source along the reverse tree: (vertex ids, cumulative costs)."""
+        hops = DSALinkedList()
+        current = source
+        while current != -1:
+            hops.insertLast(current)
+            current = next_hop[current]
+        ids = np.fromiter(hops, dtype=np.int64, count=hops.getCount())
+        return ids, to_goal[source] - to_goal[ids]
+
+    def _spur_route(self, spur, goal, to_goal, next_hop, blocked, banned, search):
+        """
+        Cheapest spur -> goal route avoiding blocked vertices and the banned
+        first hops, as (vertex ids, cumulative costs), or None if there is none.
+
+        The search stops at the first vertex it settles whose reverse-tree route
+        is still open: the heuristic is exact there, so no cheaper detour exists.
+        """
+        if not banned[next_hop[spur]]:
+            ids, cum = self._tree_route(spur, to_goal, next_hop)
+            if not blocked[ids].any():
+                return ids, cum
+
+        g_cost, parent, handles, status = search
+        touched = DSALinkedList()
+        open_set = DSAIndexedHeapMin()
+        blocked[spur] = True  # the route may not come back through the spur
+        g_cost[spur] = 0
+        handles[spur] = open_set.add(to_goal[spur], spur)
+        touched.insertLast(spur)
+
+        route = None
+        while not open_set.isEmpty():
+            current = open_set.remove()
+            if current != spur and self._tree_route_open(current, next_hop, blocked, status, touched):
+                hops = DSALinkedList()
+                vertex_id = current
+                while vertex_id != -1:
+                    hops.insertFirst(vertex_id)
+                    vertex_id = parent[vertex_id]
+                head = np.fromiter(hops, dtype=np.int64, count=hops.getCount())
+                tail, tail_cum = self._tree_route(current, to_goal, next_hop)
+                route = (np.concatenate((head[:-1], tail)),
+                         np.concatenate((g_cost[head[:-1]], g_cost[current] + tail_cum)))
+                break
+
+            start = self.offsets[current]
+            end = self.offsets[current + 1]
+            for slot in range(start, end):
+                neighbor = self.neighbors[slot]
+                if blocked[neighbor] or (current == spur and banned[neighbor]):
+                    continue
+                tentative = g_cost[current] + self.weights[slot]
+                if tentative < g_cost[neighbor]:
+                    if g_cost[neighbor] == np.inf:
+                        touched.insertLast(neighbor)
+                    g_cost[neighbor] = tentative
+                    parent[neighbor] = current
+                    priority = tentative + to_goal[neighbor]
+                    if handles[neighbor] is not None and handles[neighbor].is_queued():
+                        open_set.decrease_key(handles[neighbor], priority)
+                    else:
+                        handles[neighbor] = open_set.add(priority, neighbor)
+
+        blocked[spur] = False
+        for vertex_id in touched:
+            g_cost[vertex_id] = np.inf
+            parent[vertex_id] = -1
+            handles[vertex_id] = None
+            status[vertex_id] = 0
+        return route
+
+    @staticmethod
+    def _tree_route_open(vertex_id, next_hop, blocked, status, touched):
+        """
+        Whether the reverse-tree route from a vertex avoids every blocked vertex.
+        Answers are memoised in status (1 open, 2 closed) for the current search.
+        """
+        chain = DSALinkedList()
+        current = vertex_id
+        while current != -1 and status[current] == 0:
+            if blocked[current]:
+                status[current] = 2
+                touched.insertLast(current)
+                break
+            chain.insertLast(current)
+            current = next_hop[current]
+        is_open = current == -1 or status[current] == 1
+        for member in chain:
+            status[member] = 1 if is_open else 2
+            touched.insertLast(member)
+        return is_open
+
+    @staticmethod
+    def _route_key(ids):
+        """Integer hash key of an id route; callers compare the stored route on a hit."""
+        return hash(ids.tobytes())
+
+    def _label_path(self, ids):
+        path = DSALinkedList()
+        for vertex_id in ids:
+            path.insertLast(self.labels[vertex_id])
+        return path
+
+    def aStarPathfinding(self, start_label, goal_label, heuristic=None):
+        """
+        A* search over the snapshot.
+
+        Args:
+            start_label: Label of the starting vertex
+            goal_label: Label of the destination vertex
+            heuristic: Optional callable h(vertex_id, goal_id); defaults to 0 (Dijkstra)
+
+        Returns:
+            AStarPath: Object containing the path (as DSALinkedList of labels) and total cost
+        """
+        start = self.getId(start_label)
+        goal = self.getId(goal_label)
+
+        vertex_count = self.getVertexCount()
+        g_cost = np.full(vertex_count, np.inf)
+        parent = np.full(vertex_count, -1, dtype=np.int64)
+        closed = np.zeros(vertex_count, dtype=bool)
+        handles = np.empty(vertex_count, dtype=object)  # open set entry per vertex
+
+        g_cost[start] = 0
+        open_set = DSAIndexedHeapMin()
+        handles[start] = open_set.add(heuristic(start, goal) if heuristic else 0, start)
+
+        while not open_set.isEmpty():
+            current = open_set.remove()
+            if current == goal:
+                return AStarPath(self._build_path(parent, goal), self.asCost(g_cost[goal]))
+            closed[current] = True
+
+            neighbors, weights = self.neighborsOf(current)
+            for i in range(len(neighbors)):
+                neighbor = neighbors[i]
+                if closed[neighbor]:
+                    continue
+                tentative = g_cost[current] + weights[i]
+                if tentative < g_cost[neighbor]:
+                    h_cost = heuristic(neighbor, goal) if heuristic else 0
+                    parent[neighbor] = current
+                    if handles[neighbor] is None:
+                        handles[neighbor] = open_set.add(tentative + h_cost, neighbor)
+                    else:
+                        open_set.decrease_key(handles[neighbor], tentative + h_cost)
+                    g_cost[neighbor] = tentative
+
+        return AStarPath(DSALinkedList(), float('inf'))
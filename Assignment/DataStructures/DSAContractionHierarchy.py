@@ -0,0 +1,362 @@
+import numpy as np
+from .DSALinkedList import DSALinkedList
+from .DSAHeapMin import DSAHeapMin
+from .DSAHashTable import DSAHashTable
+from .AStarPath import AStarPath
+from .DSACSRGraph import DSACSRGraph
+
+
+class DSAContractionHierarchy:
+    """
+    Contraction hierarchy (CH) over a DSACSRGraph snapshot for fast point-to-point routing.
+
+    Preprocessing contracts vertices one at a time in order of importance (edge
+    difference with lazy updates). Contracting v adds a shortcut u-w with weight
+    w(u, v) + w(v, w) whenever no witness path avoiding v is at least as short.
+    Each vertex keeps only its "upward" edges, to neighbours contracted after it,
+    packed CSR-style into up_offsets/up_targets/up_weights/up_middle, where
+    up_middle is the contracted vertex a shortcut bypasses (-1 for a corridor).
+
+    A query is a bidirectional Dijkstra that only follows upward edges; shortcuts
+    on the resulting route are then unpacked back into original corridors.
+    """
+
+    WITNESS_SETTLE_LIMIT = 64  # bound on vertices settled per witness search
+    ESTIMATE_SETTLE_LIMIT = 8  # tighter bound when only estimating a priority
+
+    def __init__(self, snapshot, rank, up_offsets, up_targets, up_weights, up_middle):
+        # Snapshot the hierarchy was built from: labels, and validation of persisted files
+        self.snapshot = snapshot
+        self.rank = rank
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_middle = up_middle
+
+    # ------------------------------------------------------------------
+    # Preprocessing
+    # ------------------------------------------------------------------
+    @classmethod
+    def fromSnapshot(cls, csr):
+        """Contract every vertex of the snapshot and build the upward graph."""
+        vertex_count = csr.getVertexCount()
+
+        # Remaining (uncontracted) graph: neighbour id -> (weight, middle)
+        remaining = np.empty(vertex_count, dtype=object)
+        for vertex_id in range(vertex_count):
+            remaining[vertex_id] = DSAHashTable()
+        for vertex_id in range(vertex_count):
+            neighbors, weights = csr.neighborsOf(vertex_id)
+            for i in range(len(neighbors)):
+                neighbor = int(neighbors[i])
+                cls._keep_shorter(remaining, vertex_id, neighbor, weights[i].item(), -1)
+
+        workspace = cls._WitnessWorkspace(vertex_count)
+        deleted_neighbors = np.zeros(vertex_count, dtype=np.int64)
+        rank = np.full(vertex_count, -1, dtype=np.int64)
+        upward = np.empty(vertex_count, dtype=object)
+        # A queued priority stays current until one of the vertex's neighbours is contracted
+        stale = np.zeros(vertex_count, dtype=bool)
+
+        queue = DSAHeapMin()
+        for vertex_id in range(vertex_count):
+            queue.add(cls._priority(remaining, workspace, deleted_neighbors, vertex_id), vertex_id)
+
+        next_rank = 0
+        while not queue.isEmpty():
+            vertex_id = queue.remove()
+            # Lazy update: re-check a stale priority, postpone if it got worse
+            if stale[vertex_id]:
+                stale[vertex_id] = False
+                priority = cls._priority(remaining, workspace, deleted_neighbors, vertex_id)
+                if not queue.isEmpty() and priority > queue.peek_priority():
+                    queue.add(priority, vertex_id)
+                    continue
+
+            shortcuts = cls._shortcuts_for(remaining, workspace, vertex_id, cls.WITNESS_SETTLE_LIMIT)
+            upward[vertex_id] = DSALinkedList()
+            for neighbor, (weight, middle) in remaining[vertex_id].items():
+                upward[vertex_id].insertLast((neighbor, weight, middle))
+                remaining[neighbor].remove(vertex_id)
+                deleted_neighbors[neighbor] += 1
+                stale[neighbor] = True
+                # Shortcuts only join neighbours, so this also covers their new edges
+                workspace.edges[neighbor] = None
+            for first, second, weight in shortcuts:
+                cls._keep_shorter(remaining, first, second, weight, vertex_id)
+                cls._keep_shorter(remaining, second, first, weight, vertex_id)
+
+            rank[vertex_id] = next_rank
+            next_rank += 1
+
+        return cls._pack(csr, rank, upward)
+
+    @staticmethod
+    def _keep_shorter(remaining, source, target, weight, middle):
+        table = remaining[source]
+        if not table.hasKey(target) or weight < table.get(target)[0]:
+            table.put(target, (weight, middle))
+
+    @classmethod
+    def _priority(cls, remaining, workspace, deleted_neighbors, vertex_id):
+        """
+        Edge difference plus deleted neighbours, the usual CH importance measure.
+        The shortcut count comes from cheaper witness searches than contraction
+        uses; a missed witness only overestimates the priority.
+        """
+        shortcuts = cls._shortcuts_for(remaining, workspace, vertex_id, cls.ESTIMATE_SETTLE_LIMIT)
+        return shortcuts.getCount() - remaining[vertex_id].size() + deleted_neighbors[vertex_id]
+
+    @classmethod
+    def _shortcuts_for(cls, remaining, workspace, vertex_id, settle_limit):
+        """
+        Find the shortcuts needed to contract a vertex, settling at most
+        settle_limit vertices per witness search (a missed witness only adds
+        a redundant shortcut).
+        Returns a DSALinkedList of (u, w, weight); the graph is not modified here.
+        """
+        shortcuts = DSALinkedList()
+        neighbors = workspace.edgesOf(remaining, vertex_id)
+        for i in range(len(neighbors)):
+            source, (source_weight, _) = neighbors[i]
+            # Largest route through vertex_id we must find a witness for; the
+            # search may stop once every later neighbour is settled
+            limit = -1
+            workspace.target_generation += 1
+            for j in range(i + 1, len(neighbors)):
+                limit = max(limit, source_weight + neighbors[j][1][0])
+                workspace.target[neighbors[j][0]] = workspace.target_generation
+            if limit < 0:
+                continue
+            witness = cls._witness_search(remaining, workspace, source, vertex_id, limit,
+                                          len(neighbors) - i - 1, settle_limit)
+            for j in range(i + 1, len(neighbors)):
+                target, (target_weight, _) = neighbors[j]
+                via = source_weight + target_weight
+                if witness.distance(target) > via:
+                    shortcuts.insertLast((source, target, via))
+        return shortcuts
+
+    class _WitnessWorkspace:
+        """
+        Reusable arrays for witness searches. Entries are valid only when their
+        stamp equals the current search generation, so no O(V) reset is needed.
+        """
+        def __init__(self, vertex_count):
+            self.dist = np.zeros(vertex_count)
+            self.reached = np.zeros(vertex_count, dtype=np.int64)
+            self.settled = np.zeros(vertex_count, dtype=np.int64)
+            self.generation = 0
+            # Vertices whose witness distance is wanted, stamped per source
+            self.target = np.zeros(vertex_count, dtype=np.int64)
+            self.target_generation = 0
+            # items() of each remaining adjacency table, reset to None when it changes
+            self.edges = np.empty(vertex_count, dtype=object)
+
+        def edgesOf(self, remaining, vertex_id):
+            if self.edges[vertex_id] is None:
+                self.edges[vertex_id] = remaining[vertex_id].items()
+            return self.edges[vertex_id]
+
+        def distance(self, vertex_id):
+            if self.reached[vertex_id] == self.generation:
+                return self.dist[vertex_id]
+            return np.inf
+
+    @classmethod
+    def _witness_search(cls, remaining, workspace, source, excluded, limit, target_count, settle_limit):
+        """
+        Bounded Dijkstra in the remaining graph that avoids the vertex being
+        contracted. Vertices beyond the distance limit are never queued, and the
+        search stops once target_count vertices stamped as targets are settled
+        or after settle_limit vertices.
+        """
+        workspace.generation += 1
+        generation = workspace.generation
+        target_generation = workspace.target_generation
+        # Local names for the hot loop; a popped entry's priority is its distance
+        dist, reached, settled, target = workspace.dist, workspace.reached, workspace.settled, workspace.target
+        dist[source] = 0
+        reached[source] = generation
+        frontier = DSAHeapMin()
+        frontier.add(0.0, source)
+        settled_count = 0
+        while not frontier.isEmpty() and settled_count < settle_limit:
+            current_dist = frontier.peek_priority()
+            current = frontier.remove()
+            if settled[current] == generation:
+                continue
+            settled[current] = generation
+            settled_count += 1
+            if target[current] == target_generation:
+                target_count -= 1
+                if target_count == 0:
+                    break
+            for neighbor, (weight, _) in workspace.edgesOf(remaining, current):
+                if neighbor == excluded or settled[neighbor] == generation:
+                    continue
+                tentative = current_dist + weight
+                # Paths longer than the limit can never be witnesses, so never queue them
+                if tentative > limit:
+                    continue
+                if reached[neighbor] != generation or tentative < dist[neighbor]:
+                    dist[neighbor] = tentative
+                    reached[neighbor] = generation
+                    frontier.add(tentative, neighbor)
+        return workspace
+
+    @classmethod
+    def _pack(cls, csr, rank, upward):
+        vertex_count = csr.getVertexCount()
+        up_offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+        for vertex_id in range(vertex_count):
+            up_offsets[vertex_id + 1] = up_offsets[vertex_id] + upward[vertex_id].getCount()
+        total = up_offsets[-1]
+        up_targets = np.empty(total, dtype=csr.neighbors.dtype)
+        up_weights = np.empty(total, dtype=csr.weights.dtype)
+        up_middle = np.empty(total, dtype=np.int64)
+
+        slot = 0
+        for vertex_id in range(vertex_count):
+            for target, weight, middle in upward[vertex_id]:
+                up_targets[slot] = target
+                up_weights[slot] = weight
+                up_middle[slot] = middle
+                slot += 1
+
+        return cls(csr, rank, up_offsets, up_targets, up_weights, up_middle)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def getVertexCount(self):
+        return self.snapshot.getVertexCount()
+
+    def getShortcutCount(self):
+        return int(np.count_nonzero(self.up_middle != -1))
+
+    def query(self, start_label, goal_label):
+        """
+        Shortest path by bidirectional upward search.
+
+        Returns:
+            AStarPath: Path as a DSALinkedList of labels (shortcuts unpacked) and
+            its total cost; an empty path with infinite cost if unreachable.
+        """
+        start = self.snapshot.getId(start_label)
+        goal = self.snapshot.getId(goal_label)
+        vertex_count = self.getVertexCount()
+
+        # Per direction: distance, parent slot (upward edge used), settled flags, frontier
+        dist = (np.full(vertex_count, np.inf), np.full(vertex_count, np.inf))
+        parent_slot = (np.full(vertex_count, -1, dtype=np.int64), np.full(vertex_count, -1, dtype=np.int64))
+        parent = (np.full(vertex_count, -1, dtype=np.int64), np.full(vertex_count, -1, dtype=np.int64))
+        settled = (np.zeros(vertex_count, dtype=bool), np.zeros(vertex_count, dtype=bool))
+        frontiers = (DSAHeapMin(), DSAHeapMin())
+        for side, source in ((0, start), (1, goal)):
+            dist[side][source] = 0
+            frontiers[side].add(0, source)
+
+        best_cost = np.inf
+        meeting = -1
+        side = 0
+        while not (frontiers[0].isEmpty() and frontiers[1].isEmpty()):
+            # Alternate directions; a direction stops once its keys reach the best cost
+            if frontiers[side].isEmpty() or frontiers[side].peek_priority() >= best_cost:
+                if frontiers[1 - side].isEmpty() or frontiers[1 - side].peek_priority() >= best_cost:
+                    break
+                side = 1 - side
+            current = frontiers[side].remove()
+            if settled[side][current]:
+                side = 1 - side
+                continue
+            settled[side][current] = True
+            if dist[1 - side][current] + dist[side][current] < best_cost:
+                best_cost = dist[1 - side][current] + dist[side][current]
+                meeting = current
+
+            for slot in range(self.up_offsets[current], self.up_offsets[current + 1]):
+                neighbor = self.up_targets[slot]
+                tentative = dist[side][current] + self.up_weights[slot]
+                if tentative < dist[side][neighbor]:
+                    dist[side][neighbor] = tentative
+                    parent[side][neighbor] = current
+                    parent_slot[side][neighbor] = slot
+                    frontiers[side].add(tentative, neighbor)
+            side = 1 - side
+
+        if meeting == -1:
+            return AStarPath(DSALinkedList(), float('inf'))
+
+        path = DSALinkedList()
+        path.insertLast(self.snapshot.labels[meeting])
+        # Forward half: walk from the meeting vertex down to the start
+        current = meeting
+        while parent[0][current] != -1:
+            lower = parent[0][current]
+            self._unpack_into(path, current, lower, parent_slot[0][current], prepend=True)
+            current = lower
+        # Backward half: walk from the meeting vertex down to the goal
+        current = meeting
+        while parent[1][current] != -1:
+            lower = parent[1][current]
+            self._unpack_into(path, current, lower, parent_slot[1][current], prepend=False)
+            current = lower
+        return AStarPath(path, self.snapshot.asCost(best_cost))
+
+    def _find_slot(self, lower, higher):
+        """Slot of the upward edge lower -> higher."""
+        for slot in range(self.up_offsets[lower], self.up_offsets[lower + 1]):
+            if self.up_targets[slot] == higher:
+                return slot
+        raise ValueError("Contraction hierarchy is inconsistent")
+
+    def _unpack_into(self, path, from_id, to_id, slot, prepend):
+        """
+        Expand the edge from_id -> to_id (stored at slot) into original corridors
+        and extend the path with every vertex after from_id, ending at to_id.
+        Uses an explicit stack so long shortcut chains cannot hit the recursion limit.
+        """
+        stack = DSALinkedList()
+        stack.insertFirst((from_id, to_id, slot))
+        while not stack.isEmpty():
+            first, second, edge_slot = stack.removeFirst()
+            middle = self.up_middle[edge_slot]
+            if middle == -1:
+                if prepend:
+                    path.insertFirst(self.snapshot.labels[second])
+                else:
+                    path.insertLast(self.snapshot.labels[second])
+                continue
+            # The bypassed vertex ranks below both ends, so both halves are its upward edges
+            stack.insertFirst((middle, second, self._find_slot(middle, second)))
+            stack.insertFirst((first, middle, self._find_slot(middle, first)))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def matchesSnapshot(self, csr):
+        """True if the hierarchy was built from a graph identical to this snapshot."""
+        return self.snapshot.matches(csr)
+
+    def save(self, file_path):
+        """Serialize the hierarchy to an .npz file."""
+        DSACSRGraph.writeArrays(file_path, compressed=True,
+                                labels=self.snapshot.labels.astype(str),
+                                rank=self.rank,
+                                up_offsets=self.up_offsets,
+                                up_targets=self.up_targets,
+                                up_weights=self.up_weights,
+                                up_middle=self.up_middle,
+                                offsets=self.snapshot.offsets,
+                                neighbors=self.snapshot.neighbors,
+                                weights=self.snapshot.weights)
+
+    @classmethod
+    def load(cls, file_path):
+        """Load a hierarchy written by save()."""
+        with np.load(file_path, allow_pickle=False) as data:
+            snapshot = DSACSRGraph(data["labels"].astype(object), data["offsets"],
+                                   data["neighbors"], data["weights"])
+            return cls(snapshot, data["rank"], data["up_offsets"], data["up_targets"],
+                       data["up_weights"], data["up_middle"])
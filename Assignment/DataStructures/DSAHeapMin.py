@@ -47,6 +47,18 @@ class DSAHeapMin:
 
         return root_entry.get_value()
 
+    def peek(self):
+        """Return the value with the smallest priority without removing it."""
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+        return self.heap[0].get_value()
+
+    def peek_priority(self):
+        """Return the smallest priority without removing its entry."""
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+        return self.heap[0].get_priority()
+
     def display(self):
         print("[", end="")
         for i in range(self.count):
@@ -0,0 +1,122 @@
+import numpy as np
+
+class DSAIndexedHeapMin:
+    """
+    Indexed min-heap for A* and Dijkstra style searches.
+    Every entry remembers its current position in the heap array, so the handle
+    returned by add() supports decrease_key() in O(log n) without a full heapify.
+    """
+
+    class DSAHeapHandle:
+        def __init__(self, priority, value: object, position: int):
+            self._priority = priority
+            self._value = value
+            self._position = position
+        def get_priority(self):
+            return self._priority
+        def get_value(self):
+            return self._value
+        def is_queued(self):
+            """True while the entry is still in the heap."""
+            return self._position != -1
+
+    def __init__(self, capacity: int = 5):
+        self.heap = np.empty(capacity, dtype=object)
+        self.count = 0
+
+    def add(self, priority, value: object):
+        """Insert a value and return its handle for later decrease_key calls."""
+        if self.count == len(self.heap):
+            # grow capacity (double)
+            new_capacity = max(1, len(self.heap) * 2)
+            new_heap = np.empty(new_capacity, dtype=object)
+            for i in range(self.count):
+                new_heap[i] = self.heap[i]
+            self.heap = new_heap
+
+        handle = DSAIndexedHeapMin.DSAHeapHandle(priority, value, self.count)
+        self.heap[self.count] = handle
+        self.count += 1
+        self._trickle_up(self.count - 1)
+        return handle
+
+    def remove(self):
+        """Remove and return the value with the smallest priority."""
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+
+        root_entry = self.heap[0]
+        self.count -= 1
+        if self.count > 0:
+            self._place(self.heap[self.count], 0)
+            self.heap[self.count] = None
+            self._trickle_down(0, self.count)
+        else:
+            self.heap[0] = None
+
+        root_entry._position = -1
+        return root_entry.get_value()
+
+    def peek(self):
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+        return self.heap[0].get_value()
+
+    def decrease_key(self, handle, new_priority):
+        """Lower the priority of a queued entry and restore heap order in O(log n)."""
+        if not self.contains(handle):
+            raise ValueError("Handle is not in the heap")
+        if new_priority > handle.get_priority():
+            raise ValueError("New priority is greater than current priority")
+        handle._priority = new_priority
+        self._trickle_up(handle._position)
+
+    def contains(self, handle):
+        position = handle._position
+        return 0 <= position < self.count and self.heap[position] is handle
+
+    def _place(self, handle, index: int):
+        self.heap[index] = handle
+        handle._position = index
+
+    def _swap(self, i: int, j: int):
+        first = self.heap[i]
+        self._place(self.heap[j], i)
+        self._place(first, j)
+
+    def _trickle_up(self, index: int):
+        # Recursive trickle up to maintain min-heap property
+        if index == 0:
+            return
+        parent_idx = (index - 1) // 2
+        if self.heap[parent_idx].get_priority() > self.heap[index].get_priority():
+            self._swap(parent_idx, index)
+            self._trickle_up(parent_idx)
+
+    def _trickle_down(self, curIdx: int, numItems: int):
+        l_child_idx = (curIdx * 2) + 1
+        r_child_idx = l_child_idx + 1
+        if l_child_idx < numItems:
+            small_idx = l_child_idx
+            if r_child_idx < numItems:
+                if self.heap[r_child_idx].get_priority() < self.heap[l_child_idx].get_priority():
+                    small_idx = r_child_idx
+            if self.heap[small_idx].get_priority() < self.heap[curIdx].get_priority():
+                self._swap(small_idx, curIdx)
+                self._trickle_down(small_idx, numItems)
+
+    def isEmpty(self):
+        """Check if heap is empty."""
+        return self.count == 0
+
+    def is_empty(self):
+        """Check if heap is empty (alias)."""
+        return self.isEmpty()
+
+    def getCount(self):
+        """Get number of elements in heap."""
+        return self.count
+
+    def get_count(self):
+        """Get number of elements in heap (alias)."""
+        return self.getCount()
@@ -0,0 +1,118 @@
+from .DSAHashTable import DSAHashTable
+
+
+class DSALRUCache:
+    """
+    Bounded least-recently-used cache.
+    A DSAHashTable maps keys to nodes of a private doubly linked recency list,
+    so get, put and eviction are all O(1). Hit, miss and eviction counters are
+    kept for monitoring.
+    """
+
+    class _DSACacheNode:
+        """Private node of the recency list (most recent at the head)."""
+        def __init__(self, key, value):
+            self.key = key
+            self.value = value
+            self.next = None
+            self.prev = None
+
+    def __init__(self, capacity=16, on_evict=None):
+        """on_evict(key, value) is called for entries dropped to make room."""
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        self._capacity = int(capacity)
+        self._table = DSAHashTable(capacity=2 * self._capacity)
+        self._head = None
+        self._tail = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._on_evict = on_evict
+
+    def get(self, key):
+        """Return the cached value (marking it most recent), or None on a miss."""
+        if not self._table.hasKey(key):
+            self._misses += 1
+            return None
+        node = self._table.get(key)
+        self._move_to_front(node)
+        self._hits += 1
+        return node.value
+
+    def put(self, key, value):
+        """Insert or replace a value, evicting the least recently used entry if full."""
+        if self._table.hasKey(key):
+            node = self._table.get(key)
+            node.value = value
+            self._move_to_front(node)
+            return
+
+        if self._table.size() >= self._capacity:
+            oldest = self._tail
+            self._unlink(oldest)
+            self._table.remove(oldest.key)
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(oldest.key, oldest.value)
+
+        node = self._DSACacheNode(key, value)
+        self._link_front(node)
+        self._table.put(key, node)
+
+    def hasKey(self, key):
+        return self._table.hasKey(key)
+
+    def clear(self):
+        """Drop every entry; counters are preserved."""
+        self._table.clear()
+        self._head = None
+        self._tail = None
+
+    def getCount(self):
+        return self._table.size()
+
+    def getCapacity(self):
+        return self._capacity
+
+    def getHits(self):
+        return self._hits
+
+    def getMisses(self):
+        return self._misses
+
+    def getEvictions(self):
+        return self._evictions
+
+    def keys(self):
+        """Yield keys from most to least recently used."""
+        current = self._head
+        while current is not None:
+            yield current.key
+            current = current.next
+
+    def _link_front(self, node):
+        node.prev = None
+        node.next = self._head
+        if self._head is not None:
+            self._head.prev = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+
+    def _unlink(self, node):
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+        node.prev = None
+        node.next = None
+
+    def _move_to_front(self, node):
+        if node is not self._head:
+            self._unlink(node)
+            self._link_front(node)
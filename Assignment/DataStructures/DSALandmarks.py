@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class DSALandmarks:
+    """
+    Landmark distances for the ALT (A*, Landmarks, Triangle inequality) heuristic.
+
+    distances[i, v] is the shortest-path cost from landmark i to vertex id v of the
+    DSACSRGraph snapshot the landmarks were built from. By the triangle inequality
+    |d(L, t) - d(L, v)| <= d(v, t) for every landmark L, so the maximum over the
+    landmarks is an admissible (and consistent) lower bound for A*.
+    """
+
+    def __init__(self, snapshot, landmarks, distances):
+        self.snapshot = snapshot
+        self.landmarks = landmarks
+        self.distances = distances
+        self.version = snapshot.version
+
+    @classmethod
+    def fromSnapshot(cls, csr, count=4):
+        """
+        Pick landmarks by farthest-point selection: each new landmark is the vertex
+        farthest from all landmarks chosen so far (unreached components first).
+        """
+        vertex_count = csr.getVertexCount()
+        count = max(0, min(int(count), vertex_count))
+        landmarks = np.empty(count, dtype=np.int64)
+        distances = np.empty((count, vertex_count))
+        if count == 0:
+            return cls(csr, landmarks, distances)
+
+        # Seed with the vertex farthest from vertex 0 rather than vertex 0 itself
+        seed_dist, _ = csr.dijkstra(0)
+        closest = np.where(np.isinf(seed_dist), -1, seed_dist)
+        candidate = int(np.argmax(closest))
+
+        closest = np.full(vertex_count, np.inf)
+        for i in range(count):
+            landmarks[i] = candidate
+            distances[i], _ = csr.dijkstra(candidate)
+            closest = np.minimum(closest, distances[i])
+            closest[landmarks[:i + 1]] = -1  # never pick the same landmark twice
+            candidate = int(np.argmax(closest))
+
+        return cls(csr, landmarks, distances)
+
+    def getCount(self):
+        return len(self.landmarks)
+
+    def getLandmarkLabels(self):
+        return self.snapshot.labels[self.landmarks]
+
+    def getId(self, label):
+        return self.snapshot.getId(label)
+
+    def estimate(self, vertex_id, goal_id):
+        """ALT lower bound on the cost from vertex_id to goal_id."""
+        if self.getCount() == 0:
+            return 0
+        to_goal = self.distances[:, goal_id]
+        to_vertex = self.distances[:, vertex_id]
+        # Landmarks that cannot reach both vertices give no information
+        usable = np.isfinite(to_goal) & np.isfinite(to_vertex)
+        if not usable.any():
+            return 0
+        return float(np.max(np.abs(to_goal[usable] - to_vertex[usable])))
@@ -58,6 +58,7 @@ class DSALinkedList:
     def insertLast(self, value):
         """
         Insert a new node with the given value at the end of the list.
+        Returns the node as an opaque handle for removeNode().
         """
         new_node = self._DSAListNode(value)
         
@@ -72,6 +73,7 @@ class DSALinkedList:
             self._tail = new_node
         
         self._count += 1
+        return new_node
     
     def removeFirst(self):
         """
@@ -174,6 +176,13 @@ class DSALinkedList:
         if current is None:
             raise ValueError(f"Value {valueToFind} not found in list")
         
+        return self.removeNode(current)
+    
+    def removeNode(self, current):
+        """
+        Unlink a node handle returned by insertLast() in O(1).
+        Returns the value that was removed.
+        """
         value = current.value
         
         # Remove the node
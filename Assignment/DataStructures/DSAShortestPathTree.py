@@ -0,0 +1,177 @@
+import numpy as np
+from .DSALinkedList import DSALinkedList
+from .DSAHashTable import DSAHashTable
+from .DSAIndexedHeapMin import DSAIndexedHeapMin
+from .AStarPath import AStarPath
+
+
+class DSAShortestPathTree:
+    """
+    Single-source shortest-path tree over a DSACSRGraph snapshot.
+    Stores distance and parent arrays indexed by snapshot vertex id, so the
+    route from the source to any vertex is a walk up the parent pointers.
+
+    A tree registered with its DSAWeightedGraph is kept up to date when
+    corridors are added, removed or reweighted: repairEdge() recomputes only
+    the vertices whose distance can change (Ramalingam-Reps style) instead of
+    rerunning Dijkstra from scratch.
+    """
+
+    def __init__(self, csr, source_label):
+        self.csr = csr
+        self.source = csr.getId(source_label)
+        self.version = csr.version
+        self.dist, self.parent = csr.dijkstra(self.source)
+        self._integral = np.issubdtype(csr.weights.dtype, np.integer)
+        self._valid = True
+        self._last_repair = 0
+
+    def getSource(self):
+        return self.csr.getLabel(self.source)
+
+    def isValid(self):
+        """False once the tree can no longer be repaired (its vertex set changed)."""
+        return self._valid
+
+    def invalidate(self):
+        self._valid = False
+
+    def getLastRepairCount(self):
+        """Number of vertices recomputed by the most recent repairEdge() call."""
+        return self._last_repair
+
+    def getDistance(self, goal_label):
+        return self.csr.asCost(self.dist[self.csr.getId(goal_label)], self._integral)
+
+    def getPath(self, goal_label):
+        """
+        Walk the parent pointers from the goal back to the source.
+
+        Returns:
+            AStarPath: Path as a DSALinkedList of labels and its total cost;
+            an empty path with infinite cost if the goal is unreachable.
+        """
+        goal = self.csr.getId(goal_label)
+        if self.dist[goal] == np.inf:
+            return AStarPath(DSALinkedList(), float('inf'))
+
+        path = DSALinkedList()
+        current = goal
+        while current != -1:
+            path.insertFirst(self.csr.getLabel(current))
+            current = self.parent[current]
+        return AStarPath(path, self.csr.asCost(self.dist[goal], self._integral))
+
+    def repairEdge(self, u, v, old_weight, new_weight, neighbors):
+        """
+        Repair the tree after the corridor between vertex ids u and v changed.
+
+        Args:
+            u, v: Vertex ids of the corridor endpoints
+            old_weight: Previous weight, or None if the corridor was inserted
+            new_weight: New weight, or None if the corridor was removed
+            neighbors: Callable vertex_id -> iterable of (neighbor_id, weight)
+                       pairs describing the graph after the change
+
+        Returns:
+            int: Number of vertices whose distance was recomputed
+        """
+        if new_weight is not None and not isinstance(new_weight, (int, np.integer)):
+            self._integral = False
+
+        if old_weight is None or (new_weight is not None and new_weight < old_weight):
+            touched = self._propagate_decrease(u, v, new_weight, neighbors)
+        elif new_weight is None or new_weight > old_weight:
+            touched = self._repair_increase(u, v, neighbors)
+        else:
+            touched = 0
+        self._last_repair = touched
+        return touched
+
+    def _queue(self, frontier, handles, vertex_id, priority):
+        if handles.hasKey(vertex_id) and handles.get(vertex_id).is_queued():
+            frontier.decrease_key(handles.get(vertex_id), priority)
+        else:
+            handles.put(vertex_id, frontier.add(priority, vertex_id))
+
+    def _propagate_decrease(self, u, v, weight, neighbors):
+        """A cheaper or new corridor can only shorten paths: push the improvement outward."""
+        frontier = DSAIndexedHeapMin()
+        handles = DSAHashTable()
+        for a, b in ((u, v), (v, u)):
+            candidate = self.dist[a] + weight
+            if candidate < self.dist[b]:
+                self.dist[b] = candidate
+                self.parent[b] = a
+                self._queue(frontier, handles, b, candidate)
+
+        touched = 0
+        while not frontier.isEmpty():
+            current = frontier.remove()
+            touched += 1
+            for neighbor, edge_weight in neighbors(current):
+                candidate = self.dist[current] + edge_weight
+                if candidate < self.dist[neighbor]:
+                    self.dist[neighbor] = candidate
+                    self.parent[neighbor] = current
+                    self._queue(frontier, handles, neighbor, candidate)
+        return touched
+
+    def _repair_increase(self, u, v, neighbors):
+        """
+        A dearer or removed corridor only matters if it is a tree edge. Then the
+        subtree hanging below it is reset and re-solved from its unaffected
+        neighbours; every other distance is unchanged.
+        """
+        if self.parent[v] == u:
+            child = v
+        elif self.parent[u] == v:
+            child = u
+        else:
+            return 0
+
+        # Collect the subtree below the changed edge
+        affected = DSAHashTable()
+        members = DSALinkedList()
+        pending = DSALinkedList()
+        affected.put(child, True)
+        pending.insertLast(child)
+        while not pending.isEmpty():
+            current = pending.removeFirst()
+            members.insertLast(current)
+            for neighbor, _ in neighbors(current):
+                if self.parent[neighbor] == current and not affected.hasKey(neighbor):
+                    affected.put(neighbor, True)
+                    pending.insertLast(neighbor)
+
+        for vertex_id in members:
+            self.dist[vertex_id] = np.inf
+            self.parent[vertex_id] = -1
+
+        # Seed each affected vertex with its best entry from outside the subtree
+        frontier = DSAIndexedHeapMin()
+        handles = DSAHashTable()
+        for vertex_id in members:
+            for neighbor, edge_weight in neighbors(vertex_id):
+                if affected.hasKey(neighbor):
+                    continue
+                candidate = self.dist[neighbor] + edge_weight
+                if candidate < self.dist[vertex_id]:
+                    self.dist[vertex_id] = candidate
+                    self.parent[vertex_id] = neighbor
+            if self.dist[vertex_id] != np.inf:
+                self._queue(frontier, handles, vertex_id, self.dist[vertex_id])
+
+        # Dijkstra restricted to the affected subtree
+        while not frontier.isEmpty():
+            current = frontier.remove()
+            for neighbor, edge_weight in neighbors(current):
+                if not affected.hasKey(neighbor):
+                    continue
+                candidate = self.dist[current] + edge_weight
+                if candidate < self.dist[neighbor]:
+                    self.dist[neighbor] = candidate
+                    self.parent[neighbor] = current
+                    self._queue(frontier, handles, neighbor, candidate)
+
+        return members.getCount()
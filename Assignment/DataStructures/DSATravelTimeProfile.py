@@ -0,0 +1,73 @@
+import bisect
+import numpy as np
+
+
+class DSATravelTimeProfile:
+    """
+    Periodic piecewise-linear travel time of a corridor over the day.
+
+    Breakpoints are (minute of day, travel minutes) pairs; between them the
+    travel time is interpolated linearly, and after the last breakpoint it runs
+    back to the first one of the next day. The breakpoints and the slope of
+    every segment live in one (3, n) float array, so a profile costs a single
+    small allocation and evaluation is a bisection plus one multiply-add.
+
+    Profiles must satisfy the FIFO property (leaving later never means arriving
+    earlier, i.e. every slope is at least -1); that is what keeps
+    time-dependent Dijkstra/A* exact.
+    """
+
+    PERIOD = 1440  # minutes in a day
+
+    def __init__(self, times, minutes):
+        times = np.asarray(times, dtype=np.float64)
+        minutes = np.asarray(minutes, dtype=np.float64)
+        if times.ndim != 1 or times.shape != minutes.shape or len(times) == 0:
+            raise ValueError("A profile needs matching, non-empty breakpoint times and minutes")
+        if np.any(times < 0) or np.any(times >= self.PERIOD):
+            raise ValueError(f"Breakpoint times must lie in [0, {self.PERIOD})")
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("Breakpoint times must be strictly increasing")
+        if np.any(minutes < 0) or not np.all(np.isfinite(minutes)):
+            raise ValueError("Travel minutes must be finite and non-negative")
+
+        # Close the day: segment ends are the next breakpoint, wrapping to the first
+        next_times = np.append(times[1:], times[0] + self.PERIOD)
+        next_minutes = np.append(minutes[1:], minutes[0])
+        slopes = (next_minutes - minutes) / (next_times - times)
+        if np.any(slopes < -1):
+            raise ValueError("Profile violates the FIFO property: travel time falls faster "
+                             "than one minute per minute")
+
+        if times[0] > 0:
+            # Start the table at midnight with the value on the wrapping segment
+            start = minutes[-1] + slopes[-1] * (self.PERIOD - times[-1])
+            times = np.insert(times, 0, 0.0)
+            minutes = np.insert(minutes, 0, start)
+            slopes = np.insert(slopes, 0, slopes[-1])
+
+        self._data = np.vstack((times, minutes, slopes))
+        self._times = self._data[0]
+        self._minutes = self._data[1]
+        self._slopes = self._data[2]
+        self._minimum = float(minutes.min())
+
+    def getTravelTime(self, time):
+        """Travel minutes when entering the corridor at a time (minutes, any day)."""
+        offset = time % self.PERIOD
+        i = bisect.bisect_right(self._times, offset) - 1
+        return float(self._minutes[i] + self._slopes[i] * (offset - self._times[i]))
+
+    def getMinimum(self):
+        """Smallest travel time over the day (attained at a breakpoint)."""
+        return self._minimum
+
+    def getBreakpoints(self):
+        """Return the (times, minutes) breakpoint arrays, starting at midnight."""
+        return self._times.copy(), self._minutes.copy()
+
+    def getBreakpointCount(self):
+        return len(self._times)
+
+    def nbytes(self):
+        return self._data.nbytes
@@ -0,0 +1,77 @@
+import numpy as np
+from .DSAHashTable import DSAHashTable
+
+
+class DSAUnionFind:
+    """
+    Disjoint-set forest over string keys (union by size, path compression).
+    Keys are interned to integer ids so the forest itself lives in numpy
+    arrays; find and union run in amortised near-constant time.
+    """
+
+    def __init__(self, capacity=16):
+        self._ids = DSAHashTable(capacity=2 * max(1, capacity))
+        self._parent = np.empty(max(1, capacity), dtype=np.int64)
+        self._size = np.empty(max(1, capacity), dtype=np.int64)
+        self._count = 0
+        self._components = 0
+
+    def add(self, key):
+        """Add a key as a singleton set; existing keys are left alone."""
+        key = str(key)
+        if self._ids.hasKey(key):
+            return
+        if self._count == len(self._parent):
+            self._parent = np.concatenate((self._parent, np.empty(self._count, dtype=np.int64)))
+            self._size = np.concatenate((self._size, np.empty(self._count, dtype=np.int64)))
+        self._ids.put(key, self._count)
+        self._parent[self._count] = self._count
+        self._size[self._count] = 1
+        self._count += 1
+        self._components += 1
+
+    def contains(self, key):
+        return self._ids.hasKey(str(key))
+
+    def _get_id(self, key):
+        try:
+            return self._ids.get(str(key))
+        except KeyError:
+            raise ValueError(f"Key '{key}' not found")
+
+    def _root(self, item):
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        # Path compression: point every vertex on the way straight at the root
+        while self._parent[item] != root:
+            next_item = self._parent[item]
+            self._parent[item] = root
+            item = next_item
+        return root
+
+    def find(self, key):
+        """Get the representative id of the set containing key, raise ValueError if unknown."""
+        return int(self._root(self._get_id(key)))
+
+    def union(self, key1, key2):
+        """Merge the sets of two keys; returns True if they were separate."""
+        root1 = self._root(self._get_id(key1))
+        root2 = self._root(self._get_id(key2))
+        if root1 == root2:
+            return False
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size[root2]
+        self._components -= 1
+        return True
+
+    def connected(self, key1, key2):
+        return self.find(key1) == self.find(key2)
+
+    def getCount(self):
+        return self._count
+
+    def getComponentCount(self):
+        return self._components
@@ -1,14 +1,29 @@
+import math
+import sys
+import threading
+import numpy as np
 from .DSALinkedList import DSALinkedList
-from .DSALinkedList_Queue import DSAQueue
 from .DSALinkedList_Stack import DSAStack
 from .DSAHeap import DSAHeap
 from .DSAHeapMin import DSAHeapMin
+from .DSAIndexedHeapMin import DSAIndexedHeapMin
 from .DSAHashTable import DSAHashTable
+from .DSACSRGraph import DSACSRGraph
+from .DSAAllPairsTable import DSAAllPairsTable
+from .DSAShortestPathTree import DSAShortestPathTree
+from .DSAContractionHierarchy import DSAContractionHierarchy
+from .DSALandmarks import DSALandmarks
+from .DSAUnionFind import DSAUnionFind
+from .DSATravelTimeProfile import DSATravelTimeProfile
+from .AStarPath import AStarPath
 
 class DSAGraphEdge:
     def __init__(self, destination_node, weight):
         self.destination = destination_node
         self.weight = weight
+        self._mirror = None  # the reverse edge of an undirected pair
+        self._list_node = None  # handle in the owner's adjacency list
+        self.profile = None  # optional DSATravelTimeProfile, shared with the mirror
     
     def __eq__(self, other):
         if isinstance(other, DSAGraphEdge):
@@ -23,14 +38,25 @@ class DSAGraphEdge:
     
     def getWeight(self):
         return self.weight
+    
+    def getProfile(self):
+        return self.profile
+    
+    def getTravelTime(self, time):
+        """Travel minutes when entering at a time: the profile if set, else the weight."""
+        return self.weight if self.profile is None else self.profile.getTravelTime(time)
 
 
 class DSAGraphNode:
     
+    # Degree above which edge lookups go through a neighbour-label hash index
+    EDGE_INDEX_THRESHOLD = 16
+    
     def __init__(self, label, value=None):
         self.label = str(label)
         self.value = value
         self._adjacency = DSALinkedList()
+        self._edge_index = None  # neighbour label -> DSAGraphEdge, built for high-degree nodes
         self._visited = False
     
     def __eq__(self, other):
@@ -43,29 +69,82 @@ class DSAGraphNode:
     
     def getValue(self):
         return self.value
+    
+    def getCoordinates(self):
+        """Get (x, y) from the node value, or None if the node has no coordinates."""
+        if isinstance(self.value, dict) and self.value.get("x") is not None and self.value.get("y") is not None:
+            return self.value["x"], self.value["y"]
+        return None
+    
+    def getType(self):
+        """Get the department type tag from the node value, or None if untagged."""
+        if isinstance(self.value, dict):
+            return self.value.get("type")
+        return None
 
     def getAdjacent(self):
         return self._adjacency
     
+    def hasEdgeIndex(self):
+        return self._edge_index is not None
+    
+    def getEdge(self, other_node):
+        """
+        Get the edge to another node, or None if no edge exists.
+        O(1) through the edge index once the node's degree passes
+        EDGE_INDEX_THRESHOLD, otherwise a scan of the adjacency list.
+        """
+        other_label = other_node.label if isinstance(other_node, DSAGraphNode) else str(other_node)
+        if self._edge_index is not None:
+            if self._edge_index.hasKey(other_label):
+                return self._edge_index.get(other_label)
+            return None
+        for edge in self._adjacency:
+            if edge.getDestination().label == other_label:
+                return edge
+        return None
+    
+    def hasEdge(self, other_node):
+        return self.getEdge(other_node) is not None
+    
+    def _attach(self, edge):
+        """Append an edge to the adjacency list, keeping the edge index in step."""
+        edge._list_node = self._adjacency.insertLast(edge)
+        if self._edge_index is not None:
+            self._edge_index.put(edge.getDestination().label, edge)
+        elif self._adjacency.getCount() > self.EDGE_INDEX_THRESHOLD:
+            self._edge_index = DSAHashTable(capacity=4 * self._adjacency.getCount())
+            for indexed in self._adjacency:
+                self._edge_index.put(indexed.getDestination().label, indexed)
+    
     def addWeightedEdge(self, other_node, weight):
         """Add a weighted edge to another node."""
-        if not self._adjacency.find(DSAGraphEdge(other_node, weight)):
-            edge = DSAGraphEdge(other_node, weight)
-            self._adjacency.insertLast(edge)
+        if not self.hasEdge(other_node):
+            self._attach(DSAGraphEdge(other_node, weight))
+    
+    def _detach(self, edge):
+        """Unlink an edge of this node in O(1) through its list handle."""
+        self._adjacency.removeNode(edge._list_node)
+        edge._list_node = None
+        if self._edge_index is not None:
+            self._edge_index.remove(edge.getDestination().label)
     
     def removeEdge(self, other_node):
         """Remove edge to another node."""
-        for edge in self._adjacency:
-            if edge.getDestination() == other_node:
-                self._adjacency.remove(edge)
-                break
+        edge = self.getEdge(other_node)
+        if edge is not None:
+            self._detach(edge)
     
     def getEdgeWeight(self, other_node):
         """Get the weight of edge to another node, or None if no edge exists."""
-        for edge in self._adjacency:
-            if edge.getDestination() == other_node:
-                return edge.getWeight()
-        return None
+        edge = self.getEdge(other_node)
+        return None if edge is None else edge.getWeight()
+    
+    def setEdgeWeight(self, other_node, weight):
+        """Change the weight of the edge to another node."""
+        edge = self.getEdge(other_node)
+        if edge is not None:
+            edge.weight = weight
     
     def setVisited(self):
         self._visited = True
@@ -87,17 +166,87 @@ class DSAWeightedGraph:
     Ensures undirected symmetry (u↔v with same weight).
     """
     
+    HEURISTICS = ("none", "euclidean", "manhattan", "alt")
+    DEFAULT_LANDMARK_COUNT = 4
+    
     def __init__(self):
         self._vertices = DSALinkedList()
+        self._index = DSAHashTable()  # label -> DSAGraphNode, kept in sync with _vertices
         self._vertex_count = 0
         self._edge_count = 0
+        self._version = 0  # bumped by every mutation
+        self._csr = None  # cached read-only snapshot, see freeze()
+        self._all_pairs = None  # precomputed route table, see computeAllPairs()
+        self._hierarchy = None  # contraction hierarchy, see buildContractionHierarchy()
+        self._landmarks = None  # ALT landmark distances, see buildLandmarks()
+        self._landmark_count = self.DEFAULT_LANDMARK_COUNT
+        self._heuristic_mode = "euclidean"
+        self._cost_per_distance = None  # None = calibrate from the edges
+        self._calibration = None  # (version, mode, scale)
+        self._trees = DSAHashTable()  # id(tree) -> shortest-path tree repaired on edge changes
+        self._last_repair = DSALinkedList()  # (source label, touched) per tree for the last change
+        self._components = DSAUnionFind()  # connectivity index, see isConnected()
+        self._components_stale = False  # deletions can split components; rebuild lazily
+        self._cache_lock = threading.RLock()  # guards lazy caches shared by concurrent readers
+        self._profile_count = 0  # corridors with a time-dependent travel profile
+        self._profile_ratio = None  # cached lower bound of travel time / weight, see _get_profile_ratio()
+    
+    def _mark_changed(self):
+        """Record a structural change and drop snapshots derived from the old graph."""
+        self._version += 1
+        self._csr = None
+        self._all_pairs = None
+        self._hierarchy = None
+        self._landmarks = None
+        self._profile_ratio = None
+    
+    def getVersion(self):
+        """Get the mutation counter; it changes whenever vertices or edges change."""
+        return self._version
     
     def _get_node(self, label):
-        """Get node by label, raise ValueError if not found."""
-        for node in self._vertices:
-            if node.label == label:
-                return node
-        raise ValueError(f"Vertex '{label}' not found")
+        """Get node by label in O(1) via the label index, raise ValueError if not found."""
+        try:
+            return self._index.get(str(label))
+        except KeyError:
+            raise ValueError(f"Vertex '{label}' not found")
+    
+    def _repair_trees(self, label1, label2, old_weight, new_weight):
+        """Repair every registered shortest-path tree after the corridor label1-label2 changed."""
+        self._last_repair = DSALinkedList()
+        for _, tree in self._trees.items():
+            csr = tree.csr
+            
+            def neighbors(vertex_id, csr=csr):
+                for edge in self._get_node(csr.getLabel(vertex_id)).getAdjacent():
+                    yield csr.getId(edge.getDestination().label), edge.getWeight()
+            
+            touched = tree.repairEdge(csr.getId(label1), csr.getId(label2),
+                                      old_weight, new_weight, neighbors)
+            tree.version = self._version
+            self._last_repair.insertLast((tree.getSource(), touched))
+    
+    def _invalidate_trees(self):
+        """Vertex changes renumber the snapshot, so registered trees cannot be repaired."""
+        for _, tree in self._trees.items():
+            tree.invalidate()
+        self._trees.clear()
+    
+    def _register_vertex(self, node):
+        """Append a new node to the vertex list and label index, keeping its list handle."""
+        node._list_node = self._vertices.insertLast(node)
+        self._index.put(node.label, node)
+        self._vertex_count += 1
+    
+    @staticmethod
+    def _link(n1, n2, weight):
+        """Attach both directions of an undirected edge as a mirrored pair."""
+        forward = DSAGraphEdge(n2, weight)
+        backward = DSAGraphEdge(n1, weight)
+        forward._mirror = backward
+        backward._mirror = forward
+        n1._attach(forward)
+        n2._attach(backward)
     
     def _ensure_vertex(self, label, value=None):
         """Get existing vertex or create new one."""
@@ -115,19 +264,18 @@ class DSAWeightedGraph:
     
     def hasVertex(self, label):
         """Check if vertex exists."""
-        try:
-            self._get_node(label)
-            return True
-        except ValueError:
-            return False
+        return self._index.hasKey(str(label))
     
     def addVertex(self, label, value=None):
         """Add a new vertex."""
         if self.hasVertex(label):
             raise ValueError(f"Vertex '{label}' already exists")
         node = DSAGraphNode(label, value)
-        self._vertices.insertLast(node)
-        self._vertex_count += 1
+        self._register_vertex(node)
+        if not self._components_stale:
+            self._components.add(node.label)
+        self._invalidate_trees()
+        self._mark_changed()
     
     def getVertex(self, label):
         """Get vertex by label."""
@@ -135,16 +283,14 @@ class DSAWeightedGraph:
     
     def isAdjacent(self, label1, label2):
         """Check if two vertices are connected."""
-        if not (self.hasVertex(label1) and self.hasVertex(label2)):
+        try:
+            n1 = self._get_node(label1)
+            n2 = self._get_node(label2)
+        except ValueError:
             return False
-        n1 = self._get_node(label1)
-        n2 = self._get_node(label2)
         
         # Check if n1 has edge to n2
-        for edge in n1.getAdjacent():
-            if edge.getDestination() == n2:
-                return True
-        return False
+        return n1.hasEdge(n2)
     
     def addWeightedEdge(self, label1, label2, weight):
         """Add weighted edge between two vertices (undirected)."""
@@ -159,9 +305,12 @@ class DSAWeightedGraph:
             return  # Already connected
         
         # Add edge in both directions (undirected)
-        n1.addWeightedEdge(n2, weight)
-        n2.addWeightedEdge(n1, weight)
+        self._link(n1, n2, weight)
         self._edge_count += 1
+        if not self._components_stale:
+            self._components.union(n1.label, n2.label)
+        self._mark_changed()
+        self._repair_trees(label1, label2, None, weight)
     
     def getEdgeWeight(self, label1, label2):
         """Get weight of edge between two vertices."""
@@ -179,28 +328,144 @@ class DSAWeightedGraph:
         n1 = self._get_node(label1)
         n2 = self._get_node(label2)
         
-        if self.isAdjacent(label1, label2):
-            n1.removeEdge(n2)
-            n2.removeEdge(n1)
+        edge = n1.getEdge(n2)
+        if edge is not None:
+            old_weight = edge.getWeight()
+            if edge.profile is not None:
+                self._profile_count -= 1
+            n1._detach(edge)
+            self._detach_mirror(n2, edge, n1)
             self._edge_count = max(0, self._edge_count - 1)
+            self._components_stale = True
+            self._mark_changed()
+            self._repair_trees(label1, label2, old_weight, None)
+    
+    def updateEdgeWeight(self, label1, label2, weight):
+        """Change the weight of an existing corridor, raise ValueError if there is none."""
+        if not self.isAdjacent(label1, label2):
+            raise ValueError(f"No edge between '{label1}' and '{label2}'")
+        
+        n1 = self._get_node(label1)
+        n2 = self._get_node(label2)
+        old_weight = n1.getEdgeWeight(n2)
+        if old_weight == weight:
+            return
+        
+        n1.setEdgeWeight(n2, weight)
+        n2.setEdgeWeight(n1, weight)
+        self._mark_changed()
+        self._repair_trees(label1, label2, old_weight, weight)
+    
+    def setEdgeProfile(self, label1, label2, times, minutes):
+        """
+        Give a corridor a time-dependent travel time (see DSATravelTimeProfile).
+        The static weight is kept for every time-independent algorithm.
+        
+        Args:
+            label1, label2: Corridor endpoints
+            times: Breakpoint times in minutes of the day, increasing, in [0, 1440)
+            minutes: Travel minutes at each breakpoint
+            
+        Raises:
+            ValueError: If there is no such corridor or the profile is invalid
+        """
+        if not self.isAdjacent(label1, label2):
+            raise ValueError(f"No edge between '{label1}' and '{label2}'")
+        profile = DSATravelTimeProfile(times, minutes)
+        edge = self._get_node(label1).getEdge(label2)
+        if edge.profile is None:
+            self._profile_count += 1
+        edge.profile = profile
+        self._get_node(label2).getEdge(label1).profile = profile
+        self._profile_ratio = None
+    
+    def clearEdgeProfile(self, label1, label2):
+        """Return a corridor to its static weight."""
+        if not self.isAdjacent(label1, label2):
+            raise ValueError(f"No edge between '{label1}' and '{label2}'")
+        edge = self._get_node(label1).getEdge(label2)
+        if edge.profile is not None:
+            self._profile_count -= 1
+        edge.profile = None
+        self._get_node(label2).getEdge(label1).profile = None
+        self._profile_ratio = None
+    
+    def getEdgeProfile(self, label1, label2):
+        """Get the travel-time profile of a corridor, or None if it has none."""
+        if not self.isAdjacent(label1, label2):
+            return None
+        return self._get_node(label1).getEdge(label2).getProfile()
+    
+    def hasTimeProfiles(self):
+        return self._profile_count > 0
+    
+    def getProfileCount(self):
+        return self._profile_count
+    
+    def getTravelTime(self, label1, label2, time):
+        """Travel minutes along a corridor when entering it at a time, or None if there is no corridor."""
+        if not self.isAdjacent(label1, label2):
+            return None
+        return self._get_node(label1).getEdge(label2).getTravelTime(time)
+    
+    def _detach_mirror(self, owner, edge, other):
+        """Remove the reverse of edge from owner; O(1) when the pair is mirrored."""
+        if edge._mirror is not None and edge._mirror._list_node is not None:
+            owner._detach(edge._mirror)
+        else:
+            owner.removeEdge(other)
     
     def removeVertex(self, label):
-        """Remove vertex and all its edges."""
+        """
+        Remove vertex and all its edges in O(degree): only the vertex's own
+        adjacency is walked, and each mirrored edge is unlinked via its handle.
+        """
         if not self.hasVertex(label):
             return
         
         target = self._get_node(label)
+        self._invalidate_trees()
         
-        # Remove all edges to this vertex
-        for node in self._vertices:
-            if node == target:
-                continue
-            if self.isAdjacent(node.label, label):
-                self.removeEdge(node.label, label)
+        # Remove the reverse of every edge at this vertex
+        for edge in target.getAdjacent():
+            self._detach_mirror(edge.getDestination(), edge, target)
+            self._edge_count = max(0, self._edge_count - 1)
+            if edge.profile is not None:
+                self._profile_count -= 1
+        target._adjacency = DSALinkedList()
+        target._edge_index = None
         
         # Remove the vertex
-        self._vertices.remove(target)
+        self._vertices.removeNode(target._list_node)
+        target._list_node = None
+        self._index.remove(target.label)
         self._vertex_count = max(0, self._vertex_count - 1)
+        self._components_stale = True
+        self._mark_changed()
+    
+    def _get_components(self):
+        """Get the union-find index, rebuilding it in O(V + E) after deletions."""
+        with self._cache_lock:
+            if self._components_stale:
+                components = DSAUnionFind(self._vertex_count)
+                for node in self._vertices:
+                    components.add(node.label)
+                for node in self._vertices:
+                    for edge in node.getAdjacent():
+                        components.union(node.label, edge.getDestination().label)
+                self._components = components
+                self._components_stale = False
+            return self._components
+    
+    def isConnected(self, label1, label2):
+        """Check whether any path joins two vertices, in near O(1) via the component index."""
+        self._get_node(label1)
+        self._get_node(label2)
+        return self._get_components().connected(label1, label2)
+    
+    def getComponentCount(self):
+        """Get the number of connected components."""
+        return self._get_components().getComponentCount()
     
     def getAdjacent(self, label):
         """Get adjacency list for a vertex."""
@@ -216,170 +481,465 @@ class DSAWeightedGraph:
         node = self._get_node(label)
         return sum(1 for _ in node.getAdjacent())
     
-    def clearVisited(self):
-        """Clear visited flag for all vertices."""
-        for node in self._vertices:
-            node.clearVisited()
+    @classmethod
+    def fromEdgeList(cls, vertices, edges):
+        """Build a new graph in one pass; see loadEdgeList()."""
+        graph = cls()
+        graph.loadEdgeList(vertices, edges)
+        return graph
     
-    def displayAsList(self):
-        """Display graph as adjacency list with weights."""
-        if self.getVertexCount() == 0:
-            print("Empty graph")
-            return
+    def loadEdgeList(self, vertices, edges):
+        """
+        Bulk-fill an empty graph in O(V + E).
         
-        print(f"Weighted Undirected Graph: |V|={self._vertex_count}, |E|={self._edge_count}")
-        for node in self._vertices:
-            edges = DSALinkedList()
-            for edge in node.getAdjacent():
-                edges.insertLast(f"{edge.getDestination().label}({edge.getWeight()})")
-            
-            # Build the output string
-            if edges.isEmpty():
-                print(f"{node.label}: []")
-            else:
-                output_parts = DSALinkedList()
-                for edge_str in edges:
-                    output_parts.insertLast(edge_str)
-                
-                # Convert to comma-separated string
-                result = ""
-                first = True
-                for edge_str in output_parts:
-                    if not first:
-                        result += ", "
-                    result += edge_str
-                    first = False
-                print(f"{node.label}: [{result}]")
-    
-    def displayAsMatrix(self):
-        """Display graph as adjacency matrix with weights."""
-        if self.getVertexCount() == 0:
-            print("Empty graph")
-            return
+        Args:
+            vertices: Iterable of (label, value) pairs
+            edges: Iterable of (label1, label2, weight) triples. Each undirected
+                   edge may appear in either or both directions; repeats are
+                   dropped through a hash of the (u, v) pair (first weight wins).
+                   Endpoints that are not listed in vertices are created.
+        """
+        if self._vertex_count != 0:
+            raise ValueError("Edge lists can only be loaded into an empty graph")
         
-        # Convert vertices to DSALinkedList and build labels list
-        nodes = DSALinkedList()
-        labels = DSALinkedList()
-        index_of = DSAHashTable()
+        for label, value in vertices:
+            if self._index.hasKey(str(label)):
+                raise ValueError(f"Vertex '{label}' already exists")
+            self._register_vertex(DSAGraphNode(label, value))
         
-        # Build nodes list and labels list
+        seen = DSAHashTable()
+        for label1, label2, weight in edges:
+            label1 = str(label1)
+            label2 = str(label2)
+            if label1 == label2:
+                raise ValueError("No self-loops supported")
+            pair = f"{label1}\0{label2}" if label1 < label2 else f"{label2}\0{label1}"
+            if seen.hasKey(pair):
+                continue
+            seen.put(pair, True)
+            
+            self._link(self._bulk_vertex(label1), self._bulk_vertex(label2), weight)
+            self._edge_count += 1
+        
+        self._components_stale = True
+        self._mark_changed()
+    
+    def _bulk_vertex(self, label):
+        """Get or create a vertex without the per-call bookkeeping of addVertex."""
+        if self._index.hasKey(label):
+            return self._index.get(label)
+        node = DSAGraphNode(label)
+        self._register_vertex(node)
+        return node
+    
+    def saveSnapshot(self, file_path):
+        """
+        Save the graph as a binary .npz snapshot: interned labels, node coordinates
+        and type tags, the CSR adjacency (in adjacency-list order) and any
+        corridor travel-time profiles.
+        Node values other than the {"x", "y", "type"} fields are not kept.
+        """
+        csr = self.freeze()
+        vertex_count = csr.getVertexCount()
+        x = np.full(vertex_count, np.nan)
+        y = np.full(vertex_count, np.nan)
+        types = np.empty(vertex_count, dtype=object)
+        vertex_id = 0
         for node in self._vertices:
-            nodes.insertLast(node)
-            labels.insertLast(node.label)
+            coordinates = node.getCoordinates()
+            if coordinates is not None:
+                x[vertex_id], y[vertex_id] = coordinates
+            node_type = node.getType()
+            types[vertex_id] = "" if node_type is None else str(node_type)
+            vertex_id += 1
         
-        # Build index mapping using DSAHashTable
+        # Travel-time profiles, once per corridor: endpoint ids and packed breakpoints
+        profile_ends = DSALinkedList()
+        if self._profile_count > 0:
+            for node in self._vertices:
+                for edge in node.getAdjacent():
+                    other = edge.getDestination()
+                    if edge.profile is not None and node.label < other.label:
+                        profile_ends.insertLast((csr.getId(node.label), csr.getId(other.label), edge.profile))
+        profile_count = profile_ends.getCount()
+        profile_u = np.empty(profile_count, dtype=np.int64)
+        profile_v = np.empty(profile_count, dtype=np.int64)
+        profile_offsets = np.zeros(profile_count + 1, dtype=np.int64)
         index = 0
-        for label in labels:
-            index_of.put(label, index)
+        for u, v, profile in profile_ends:
+            profile_u[index], profile_v[index] = u, v
+            profile_offsets[index + 1] = profile_offsets[index] + profile.getBreakpointCount()
+            index += 1
+        profile_times = np.empty(profile_offsets[-1])
+        profile_minutes = np.empty(profile_offsets[-1])
+        index = 0
+        for _, _, profile in profile_ends:
+            window = slice(profile_offsets[index], profile_offsets[index + 1])
+            profile_times[window], profile_minutes[window] = profile.getBreakpoints()
             index += 1
         
-        size = nodes.getCount()
+        DSACSRGraph.writeArrays(file_path,
+                                labels=csr.labels.astype(str),
+                                types=types.astype(str),
+                                x=x,
+                                y=y,
+                                offsets=csr.offsets,
+                                neighbors=csr.neighbors,
+                                weights=csr.weights,
+                                profile_u=profile_u,
+                                profile_v=profile_v,
+                                profile_offsets=profile_offsets,
+                                profile_times=profile_times,
+                                profile_minutes=profile_minutes)
+    
+    def loadSnapshot(self, file_path):
+        """
+        Fill an empty graph from a snapshot written by saveSnapshot().
+        Adjacency lists are rebuilt directly from the CSR arrays (no per-edge
+        duplicate checks), and the snapshot doubles as the frozen CSR view.
+        """
+        if self._vertex_count != 0:
+            raise ValueError("Snapshots can only be loaded into an empty graph")
         
-        # Initialize matrix with 0s using DSALinkedList
-        matrix = DSALinkedList()
-        for i in range(size):
-            row = DSALinkedList()
-            for j in range(size):
-                row.insertLast(0)
-            matrix.insertLast(row)
+        with np.load(file_path, allow_pickle=False) as data:
+            labels = data["labels"].astype(object)
+            types = data["types"]
+            x = data["x"]
+            y = data["y"]
+            offsets = data["offsets"]
+            neighbors = data["neighbors"]
+            weights = data["weights"]
+            # Snapshots from before travel-time profiles have no profile arrays
+            has_profiles = "profile_offsets" in data.files
+            if has_profiles:
+                profile_u = data["profile_u"]
+                profile_v = data["profile_v"]
+                profile_offsets = data["profile_offsets"]
+                profile_times = data["profile_times"]
+                profile_minutes = data["profile_minutes"]
         
-        # Fill matrix with weights
-        row_index = 0
-        for node in nodes:
-            for edge in node.getAdjacent():
-                col_index = index_of.get(edge.getDestination().label)
-                # Get the row and update the value
-                row = matrix.peekAt(row_index)
-                row.removeAt(col_index)
-                row.insertAt(col_index, edge.getWeight())
-            row_index += 1
+        vertex_count = len(labels)
+        self._check_snapshot_arrays(vertex_count, types, x, y, offsets, neighbors, weights)
+        nodes = np.empty(vertex_count, dtype=object)
+        has_coordinates = ~(np.isnan(x) | np.isnan(y))
+        for vertex_id in range(vertex_count):
+            value = None
+            if has_coordinates[vertex_id] or types[vertex_id]:
+                value = {
+                    "x": self._snapshot_number(x[vertex_id]) if has_coordinates[vertex_id] else None,
+                    "y": self._snapshot_number(y[vertex_id]) if has_coordinates[vertex_id] else None,
+                    "type": str(types[vertex_id]) if types[vertex_id] else None
+                }
+            node = DSAGraphNode(labels[vertex_id], value)
+            labels[vertex_id] = node.label
+            nodes[vertex_id] = node
+            self._register_vertex(node)
         
-        # Display matrix
-        # Build header
-        header_parts = DSALinkedList()
-        header_parts.insertLast(" ")
-        for label in labels:
-            header_parts.insertLast(label)
-        
-        # Print header
-        header_str = ""
-        first = True
-        for part in header_parts:
-            if not first:
-                header_str += "\t"
-            header_str += part
-            first = False
-        print(header_str)
-        
-        # Print matrix rows
-        row_index = 0
-        for row in matrix:
-            # Build row output
-            row_parts = DSALinkedList()
-            row_parts.insertLast(labels.peekAt(row_index))
-            for val in row:
-                row_parts.insertLast(str(val))
+        # tolist() gives plain Python numbers, as when edges are added one by one
+        weight_values = weights.tolist()
+        neighbor_ids = neighbors.tolist()
+        mirrored = 0
+        for vertex_id in range(vertex_count):
+            node = nodes[vertex_id]
+            for slot in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                neighbor_id = neighbor_ids[slot]
+                edge = DSAGraphEdge(nodes[neighbor_id], weight_values[slot])
+                node._attach(edge)
+                if neighbor_id < vertex_id:
+                    # The neighbour's list is complete, so the reverse edge should exist
+                    reverse = nodes[neighbor_id].getEdge(node)
+                    if reverse is None or reverse._mirror is not None:
+                        raise ValueError(f"Snapshot corridor {labels[vertex_id]} - "
+                                         f"{labels[neighbor_id]} has no reverse entry")
+                    edge._mirror = reverse
+                    reverse._mirror = edge
+                    mirrored += 1
+        if 2 * mirrored != len(neighbors):
+            raise ValueError("Snapshot adjacency is not symmetric")
+        
+        self._edge_count = len(neighbors) // 2
+        if has_profiles:
+            for index in range(len(profile_u)):
+                window = slice(profile_offsets[index], profile_offsets[index + 1])
+                self.setEdgeProfile(labels[profile_u[index]], labels[profile_v[index]],
+                                    profile_times[window], profile_minutes[window])
+        self._components_stale = True
+        self._mark_changed()
+        self._csr = DSACSRGraph(labels, offsets, neighbors, weights, self._version)
+    
+    @staticmethod
+    def _check_snapshot_arrays(vertex_count, types, x, y, offsets, neighbors, weights):
+        """Reject snapshot arrays that cannot describe an undirected CSR graph."""
+        if not (len(types) == len(x) == len(y) == vertex_count):
+            raise ValueError("Snapshot vertex arrays have different lengths")
+        if len(offsets) != vertex_count + 1 or offsets[0] != 0 or np.any(np.diff(offsets) < 0):
+            raise ValueError("Snapshot offsets are not monotone from 0")
+        if offsets[-1] != len(neighbors) or len(weights) != len(neighbors):
+            raise ValueError("Snapshot offsets do not match the adjacency arrays")
+        if len(neighbors) % 2 != 0:
+            raise ValueError("Snapshot adjacency has an odd number of entries")
+        if len(neighbors) and (neighbors.min() < 0 or neighbors.max() >= vertex_count):
+            raise ValueError("Snapshot adjacency refers to unknown vertices")
+        owners = np.repeat(np.arange(vertex_count), np.diff(offsets))
+        if np.any(neighbors == owners):
+            raise ValueError("Snapshot adjacency contains a self-loop")
+    
+    @staticmethod
+    def _snapshot_number(value):
+        """Coordinates are stored as floats; give whole numbers back as ints."""
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    
+    def toCSR(self):
+        """Build a fresh compact CSR snapshot (DSACSRGraph) of the current graph."""
+        return DSACSRGraph.fromGraph(self)
+    
+    def freeze(self):
+        """
+        Get a read-only CSR snapshot for read-heavy routing.
+        The snapshot is cached and rebuilt on demand after the graph changes.
+        """
+        with self._cache_lock:
+            if self._csr is None or self._csr.version != self._version:
+                self._csr = self.toCSR()
+            return self._csr
+    
+    def shortestPathTree(self, source_label, maintain=False):
+        """
+        Compute the single-source shortest-path tree (DSAShortestPathTree) from a vertex.
+        With maintain=True the tree is registered and repaired on every edge change.
+        """
+        tree = DSAShortestPathTree(self.freeze(), source_label)
+        if maintain:
+            self.registerShortestPathTree(tree)
+        return tree
+    
+    def registerShortestPathTree(self, tree):
+        """Keep a tree up to date on edge changes, raise ValueError if it is already stale."""
+        if not tree.isValid() or tree.version != self._version:
+            raise ValueError("Shortest-path tree does not match the current graph")
+        self._trees.put(id(tree), tree)
+    
+    def unregisterShortestPathTree(self, tree):
+        """Stop maintaining a tree (e.g. when it is evicted from a cache)."""
+        if self._trees.hasKey(id(tree)):
+            self._trees.remove(id(tree))
+    
+    def getMaintainedTreeCount(self):
+        return self._trees.size()
+    
+    def getLastRepairReport(self):
+        """
+        Get how many vertices each maintained tree recomputed for the last edge change.
+        
+        Returns:
+            DSALinkedList: (source label, touched vertex count) tuples
+        """
+        return self._last_repair
+    
+    def computeAllPairs(self):
+        """
+        Precompute all-pairs shortest paths (repeated Dijkstra over the CSR snapshot).
+        The table is dropped automatically when the graph changes.
+        """
+        self._all_pairs = DSAAllPairsTable.fromSnapshot(self.freeze())
+        return self._all_pairs
+    
+    def getAllPairs(self):
+        """Get the current all-pairs table, or None if not computed or invalidated."""
+        return self._all_pairs
+    
+    def setAllPairs(self, table):
+        """Attach a previously saved table, raise ValueError if it was built from a different graph."""
+        if not table.matchesSnapshot(self.freeze()):
+            raise ValueError("All-pairs table does not match the current graph")
+        self._all_pairs = table
+    
+    def buildContractionHierarchy(self):
+        """
+        Preprocess the graph into a contraction hierarchy for fast point-to-point queries.
+        The hierarchy is dropped automatically when the graph changes.
+        """
+        self._hierarchy = DSAContractionHierarchy.fromSnapshot(self.freeze())
+        return self._hierarchy
+    
+    def getContractionHierarchy(self):
+        """Get the current contraction hierarchy, or None if not built or invalidated."""
+        return self._hierarchy
+    
+    def setContractionHierarchy(self, hierarchy):
+        """Attach a previously saved hierarchy, raise ValueError if it was built from a different graph."""
+        if not hierarchy.matchesSnapshot(self.freeze()):
+            raise ValueError("Contraction hierarchy does not match the current graph")
+        self._hierarchy = hierarchy
+    
+    def contractionHierarchyQuery(self, start_label, goal_label):
+        """Shortest path through the contraction hierarchy, building it first if needed."""
+        hierarchy = self._hierarchy if self._hierarchy is not None else self.buildContractionHierarchy()
+        return hierarchy.query(start_label, goal_label)
+    
+    def clearVisited(self):
+        """Clear visited flag for all vertices."""
+        for node in self._vertices:
+            node.clearVisited()
+    
+    def toAdjacencyMatrix(self, sparse=False):
+        """
+        Export the graph as a NumPy adjacency matrix in O(V + E) from the CSR snapshot.
+        Rows and columns follow vertex insertion order; 0 means no corridor.
+        
+        Args:
+            sparse (bool): Return COO triplets instead of a dense V x V array
             
-            # Print row
-            row_str = ""
-            first = True
-            for part in row_parts:
-                if not first:
-                    row_str += "\t"
-                row_str += part
-                first = False
-            print(row_str)
+        Returns:
+            numpy.ndarray, or tuple (row, col, weight) of arrays when sparse;
+            the triplets can be wrapped as scipy.sparse.coo_matrix((weight, (row, col)))
+        """
+        csr = self.freeze()
+        vertex_count = csr.getVertexCount()
+        rows = np.repeat(np.arange(vertex_count), np.diff(csr.offsets))
+        if sparse:
+            return rows, csr.neighbors.astype(np.int64), csr.weights.copy()
+        matrix = np.zeros((vertex_count, vertex_count), dtype=csr.weights.dtype)
+        matrix[rows, csr.neighbors] = csr.weights
+        return matrix
+    
+    def renderAsList(self):
+        """Render the adjacency list display as one string."""
+        if self.getVertexCount() == 0:
+            return "Empty graph"
+        
+        lines = [f"Weighted Undirected Graph: |V|={self._vertex_count}, |E|={self._edge_count}"]
+        for node in self._vertices:
+            edges = ", ".join(f"{edge.getDestination().label}({edge.getWeight()})"
+                              for edge in node.getAdjacent())
+            lines.append(f"{node.label}: [{edges}]")
+        return "\n".join(lines)
+    
+    def renderAsMatrix(self):
+        """
+        Render the adjacency matrix display as one tab-separated string.
+        Rows are spliced from a shared run of zero cells plus each vertex's
+        corridors, so the work beyond writing the text itself is O(V + E).
+        Cells show the weights as they were added, not the snapshot's dtype.
+        """
+        if self.getVertexCount() == 0:
+            return "Empty graph"
+        
+        csr = self.freeze()
+        labels = csr.labels.astype(str)
+        vertex_count = len(labels)
+        zero_run = "\t0" * vertex_count  # zero_run[:2 * k] is k empty cells
+        lines = ["\t".join(np.concatenate(([" "], labels)))]
+        row_index = 0
+        for node in self._vertices:
+            # Snapshot slots follow the node's edge order (DSACSRGraph.fromGraph)
+            weights = [edge.getWeight() for edge in node.getAdjacent()]
+            neighbors = csr.neighborsOf(row_index)[0]
+            order = np.argsort(neighbors, kind="stable")
+            parts = [labels[row_index]]
+            column = 0
+            for slot in order:
+                target = int(neighbors[slot])
+                parts.append(zero_run[:2 * (target - column)])
+                parts.append(f"\t{weights[slot]}")
+                column = target + 1
+            parts.append(zero_run[:2 * (vertex_count - column)])
+            lines.append("".join(parts))
             row_index += 1
+        return "\n".join(lines)
+    
+    def displayAsList(self, file=None):
+        """Display graph as adjacency list with weights (one buffered write)."""
+        self._write_display(self.renderAsList(), file)
     
-    def breadthFirstSearch(self, source_label):
+    def displayAsMatrix(self, file=None):
+        """Display graph as adjacency matrix with weights (one buffered write)."""
+        self._write_display(self.renderAsMatrix(), file)
+    
+    @staticmethod
+    def _write_display(text, file=None):
+        stream = sys.stdout if file is None else file
+        stream.write(text + "\n")
+    
+    def breadthFirstSearch(self, source_label, max_depth=None, max_nodes=None):
         """
         Breadth-First Search starting from source department.
         Returns reachable departments grouped by traversal level (distance from source).
+        See iterBreadthFirstLevels for the cut-offs and a lazy version.
+        """
+        levels = DSALinkedList()
+        for level in self.iterBreadthFirstLevels(source_label, max_depth, max_nodes):
+            levels.insertLast(level)
+        return levels
+    
+    def iterBreadthFirstLevels(self, source_label, max_depth=None, max_nodes=None):
+        """
+        Lazy breadth-first search: a generator yielding one level (a DSALinkedList
+        of nodes) at a time, starting with the source at level 0. The next level
+        is only expanded when the consumer asks for it, so work and memory track
+        what is actually consumed.
+        
+        Args:
+            source_label: Label of the source vertex (checked immediately)
+            max_depth (int): Stop after this many levels beyond the source
+            max_nodes (int): Stop once this many nodes have been yielded
+                             (the last level is truncated)
         """
         if not self.hasVertex(source_label):
             raise ValueError(f"Source vertex '{source_label}' not found")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must be non-negative")
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("max_nodes must be at least 1")
+        return self._bfs_levels(self._get_node(source_label), max_depth, max_nodes)
+    
+    def _bfs_levels(self, source_node, max_depth, max_nodes):
+        # Per-query visited set, so concurrent searches never share state
+        visited = DSAHashTable()
+        visited.put(source_node.label, True)
         
-        # Clear all visited flags
-        self.clearVisited()
-        
-        # Initialize BFS
-        queue = DSAQueue()
-        source_node = self._get_node(source_label)
-        source_node.setVisited()
-        queue.enqueue(source_node)
-        
-        # Store levels using DSALinkedList
-        levels = DSALinkedList()
         current_level = DSALinkedList()
         current_level.insertLast(source_node)
-        levels.insertLast(current_level)
+        depth = 0
+        remaining = max_nodes
         
-        while not queue.is_empty():
-            current_level = DSALinkedList()
-            level_size = queue.get_count()
+        while not current_level.isEmpty():
+            if remaining is not None:
+                if current_level.getCount() >= remaining:
+                    # Truncate the final level to the node budget
+                    truncated = DSALinkedList()
+                    for node in current_level:
+                        if truncated.getCount() == remaining:
+                            break
+                        truncated.insertLast(node)
+                    yield truncated
+                    return
+                remaining -= current_level.getCount()
+            yield current_level
             
-            # Process all nodes at current level
-            for _ in range(level_size):
-                current_node = queue.dequeue()
-                
-                # Add unvisited neighbors to next level
+            if max_depth is not None and depth >= max_depth:
+                return
+            
+            # Expand the next level only once this one has been consumed
+            next_level = DSALinkedList()
+            for current_node in current_level:
                 for edge in current_node.getAdjacent():
                     neighbor = edge.getDestination()
-                    if not neighbor.getVisited():
-                        neighbor.setVisited()
-                        current_level.insertLast(neighbor)
-                        queue.enqueue(neighbor)
-            
-            # Add level if it has nodes
-            if not current_level.isEmpty():
-                levels.insertLast(current_level)
-        
-        return levels
+                    if not visited.hasKey(neighbor.label):
+                        visited.put(neighbor.label, True)
+                        next_level.insertLast(neighbor)
+            current_level = next_level
+            depth += 1
     
     def depthFirstSearch(self, start):
         """
         Perform depth-first search to find a cycle that includes the starting vertex.
         
+        The search is iterative (an explicit stack of adjacency iterators), so long
+        corridor chains cannot hit the recursion limit, and path membership is an
+        O(1) hash lookup. Every vertex and edge is handled at most once: O(V + E).
+        
         Args:
             start: The label of the vertex to start the search from.
             
@@ -389,115 +949,122 @@ class DSAWeightedGraph:
         if not self.hasVertex(start):
             raise ValueError(f"Source vertex '{start}' not found in the graph.")
         
-        # Clear all visited flags
-        self.clearVisited()
+        start_label = str(start)
+        # Vertices on the current path or fully explored; the path always holds
+        # the labels from the start to the vertex on top of the frame stack
+        visited = DSAHashTable(capacity=2 * self._vertex_count + 1)
+        path = DSALinkedList()  # labels from start to the current vertex
+        frames = DSAStack()  # (label, parent label, adjacency iterator) per path vertex
         
-        # Track the current path
-        self._dfs_path = DSALinkedList()
+        visited.put(start_label, True)
+        path.insertLast(start_label)
+        frames.push((start_label, None, iter(self.getAdjList(start_label))))
         
-        # Start DFS from the given start node
-        result = self._dfs_visit(start, start)
+        while not frames.is_empty():
+            current_label, parent_label, edges = frames.top()
+            edge = next(edges, None)
+            if edge is None:
+                # All neighbours explored, backtrack
+                frames.pop()
+                path.removeLast()
+                continue
+            
+            neighbor_label = edge.getDestination().label
+            
+            # Skip the parent node to avoid going back
+            if neighbor_label == parent_label:
+                continue
+            
+            # A non-tree edge back to the start closes a cycle through it; the
+            # current path (at least 3 vertices) is that cycle
+            if neighbor_label == start_label and path.getCount() >= 3:
+                cycle = DSALinkedList()
+                for node_label in path:
+                    cycle.insertLast(node_label)
+                return cycle
+            
+            # Any other vertex already seen is on the path or fully explored;
+            # neither can extend a new cycle through the start
+            if visited.hasKey(neighbor_label):
+                continue
+            
+            visited.put(neighbor_label, True)
+            path.insertLast(neighbor_label)
+            frames.push((neighbor_label, current_label, iter(self.getAdjList(neighbor_label))))
         
-        # Clean up
-        self.clearVisited()
-        self._dfs_path = None
+        return DSALinkedList()  # Empty list means no cycle found
+
+    def shortestCycle(self, start, weighted=True):
+        """
+        Find the shortest cycle that includes the starting vertex.
+        Unlike depthFirstSearch, which returns the first cycle it meets, this runs
+        one Dijkstra (or BFS when weighted is False) over the CSR snapshot.
         
-        return result
+        Args:
+            start: The label of the vertex the cycle must pass through.
+            weighted (bool): Minimise total corridor time, or number of corridors
+            
+        Returns:
+            AStarPath: Cycle labels starting at the start vertex and its cost;
+            an empty path with infinite cost if no cycle exists.
+        """
+        if not self.hasVertex(start):
+            raise ValueError(f"Source vertex '{start}' not found in the graph.")
+        return self.freeze().shortestCycle(start, weighted)
     
-    def _dfs_visit(self, current_label, start_label, parent_label=None):
-        # Add current node to path
-        self._dfs_path.insertLast(current_label)
+    def kShortestPaths(self, start_label, goal_label, k=3, tree=None):
+        """
+        Find up to k loopless routes from start to goal, cheapest first (Yen),
+        e.g. fallbacks for when a corridor on the primary route is closed.
+        Runs over the CSR snapshot with one reverse shortest-path tree per query.
         
-        # Get adjacent nodes
-        adj_edges = self.getAdjList(current_label)
-        if adj_edges is not None:
-            for edge in adj_edges:
-                neighbor_label = edge.getDestination().label
-                
-                # Skip the parent node to avoid going back
-                if neighbor_label == parent_label:
-                    continue
-                
-                # Check if we've found a cycle (neighbor is already in current path)
-                if self._isInPath(self._dfs_path, neighbor_label):
-                    # Found a cycle! Extract the cycle from the path
-                    cycle = DSALinkedList()
-                    
-                    # Find the position of the neighbor in the path and build cycle
-                    cycle_started = False
-                    for node_label in self._dfs_path:
-                        if node_label == neighbor_label:
-                            cycle_started = True
-                        if cycle_started:
-                            cycle.insertLast(node_label)
-                    
-                    # Add the current node to complete the cycle (only if not already added)
-                    if cycle.isEmpty() or cycle.peekLast() != current_label:
-                        cycle.insertLast(current_label)
-                    
-                    # Only return if it's a valid cycle (at least 3 nodes) AND includes the start vertex
-                    if (cycle.getCount() >= 3 and 
-                        self._isInPath(cycle, start_label)):
-                        # Remove current node from path before returning
-                        self._dfs_path.removeLast()
-                        return cycle
-                
-                # If neighbor not in current path, continue DFS
-                if not self._isInPath(self._dfs_path, neighbor_label):
-                    result = self._dfs_visit(neighbor_label, start_label, current_label)
-                    if not result.isEmpty():
-                        # Found a cycle, return it
-                        self._dfs_path.removeLast()
-                        return result
-        
-        # No cycle found from this node, backtrack
-        self._dfs_path.removeLast()
-        return DSALinkedList()  # Empty list means no cycle found
-
-    def _markVisited(self, visited_list, node):
-        """Mark a node as visited by adding it to the visited list."""
-        if not self._isVisited(visited_list, node):
-            visited_list.insertLast(node)
-    
-    def _isVisited(self, visited_list, node):
-        """Check if a node has been visited."""
-        return visited_list.find(node) is not None
-    
-    def _isInPath(self, path_list, node):
-        """Check if a node is currently in the DFS path."""
-        return path_list.find(node)
-    
-    def _containsCycle(self, cycles, newCycle):
-        """Check if a cycle already exists in the cycles list."""
-        # Avoid duplicates by comparing values (same members)
-        current = cycles._head
-        while current is not None:
-            existing = current.value
-            if self._sameCycle(existing, newCycle):
-                return True
-            current = current.next
-        return False
-
-    def _sameCycle(self, c1, c2):
-        """Check if two cycles are the same (contain the same nodes)."""
-        if c1.getCount() != c2.getCount():
-            return False
-        for v in c1:
-            if not c2.find(v):
-                return False
-        return True
+        Args:
+            start_label: Label of the starting vertex
+            goal_label: Label of the destination vertex
+            k (int): Maximum number of routes
+            tree: Optional shortest-path tree rooted at the goal (e.g. a
+                  maintained one) to reuse; stale trees are ignored
+        
+        Returns:
+            DSALinkedList: AStarPath objects in order of cost; fewer than k if
+            there are not that many distinct routes, empty if none exist.
+        """
+        if not self.hasVertex(start_label):
+            raise ValueError(f"Start vertex '{start_label}' not found")
+        if not self.hasVertex(goal_label):
+            raise ValueError(f"Goal vertex '{goal_label}' not found")
+        if not self.isConnected(start_label, goal_label):
+            return DSALinkedList()
+        if tree is not None and (not tree.isValid() or tree.version != self._version):
+            tree = None
+        return self.freeze().kShortestPaths(start_label, goal_label, k, tree)
     
-    def aStarPathfinding(self, start_label, goal_label):
+    def aStarPathfinding(self, start_label, goal_label, heuristic=None):
         """
         A* pathfinding algorithm implementation.
         
         Args:
             start_label: Label of the starting vertex
             goal_label: Label of the destination vertex
+            heuristic: Optional heuristic override ("none", "euclidean", "manhattan"
+                or a callable); defaults to the heuristic chosen with setHeuristic
             
         Returns:
             AStarPath: Object containing the path (as DSALinkedList) and total cost
         """
+        estimate = self._make_heuristic(heuristic)
+        return self._aStarSearch(start_label, goal_label, estimate,
+                                 lambda edge, arrival_time: edge.getWeight())
+    
+    def _aStarSearch(self, start_label, goal_label, estimate, edge_cost, start_cost=0):
+        """
+        A* main loop shared by the static and time-dependent searches.
+        
+        g_cost is the cost (or arrival time) accumulated since the start, which
+        begins at start_cost; edge_cost(edge, arrival_time) gives the cost of
+        crossing an edge when entering it at arrival_time. The returned cost is
+        the goal's g_cost minus start_cost.
+        """
         if not self.hasVertex(start_label):
             raise ValueError(f"Start vertex '{start_label}' not found")
         if not self.hasVertex(goal_label):
@@ -509,11 +1076,12 @@ class DSAWeightedGraph:
             path.insertLast(start_label)
             return AStarPath(path, 0)
         
-        # Clear visited flags
-        self.clearVisited()
+        # Different components: no path, without draining the open set
+        if not self.isConnected(start_label, goal_label):
+            return AStarPath(DSALinkedList(), float('inf'))
         
-        # Initialize open and closed sets
-        open_set = DSAHeapMin()  # Min-heap priority queue for A* nodes
+        # Initialize open and closed sets (per query, so concurrent searches never share state)
+        open_set = DSAIndexedHeapMin()  # Indexed min-heap so improvements use decrease_key
         closed_set = DSAHashTable()  # Hash table for visited nodes
         open_set_nodes = DSAHashTable()  # Track nodes in open set for efficient lookup
         
@@ -522,16 +1090,18 @@ class DSAWeightedGraph:
         goal_node = self._get_node(goal_label)
         
         # Create initial A* node
-        start_astar = AStarNode(start_node, 0, self._heuristic(start_node, goal_node))
+        start_astar = AStarNode(start_node, start_cost, estimate(start_node, goal_node))
         # Use f_cost directly for min-heap behavior
-        open_set.add(start_astar.f_cost, start_astar)
+        start_astar.handle = open_set.add(start_astar.f_cost, start_astar)
         open_set_nodes.put(start_node.label, start_astar)
+        expanded = 0
         
         # A* main loop
         while not open_set.isEmpty():
             # Get node with lowest f_cost
             current_astar = open_set.remove()
             current_node = current_astar.node
+            expanded += 1
             
             # Remove from open set tracking
             open_set_nodes.remove(current_node.label)
@@ -540,32 +1110,29 @@ class DSAWeightedGraph:
             if current_node == goal_node:
                 # Reconstruct path
                 path = DSALinkedList()
-                total_cost = current_astar.g_cost
+                total_cost = current_astar.g_cost - start_cost
                 
                 # Build path from goal to start
                 while current_astar is not None:
                     path.insertFirst(current_astar.node.label)
                     current_astar = current_astar.parent
                 
-                return AStarPath(path, total_cost)
+                return AStarPath(path, total_cost, expanded)
             
             # Add to closed set
             closed_set.put(current_node.label, current_astar)
-            current_node.setVisited()
+            arrival = current_astar.g_cost
             
             # Explore neighbors
             for edge in current_node.getAdjacent():
                 neighbor = edge.getDestination()
-                edge_weight = edge.getWeight()
                 
-                # Skip if already visited or in closed set
-                if neighbor.getVisited() or closed_set.hasKey(neighbor.label):
+                # Skip if already in closed set
+                if closed_set.hasKey(neighbor.label):
                     continue
                 
                 # Calculate costs
-                tentative_g_cost = current_astar.g_cost + edge_weight
-                h_cost = self._heuristic(neighbor, goal_node)
-                f_cost = tentative_g_cost + h_cost
+                tentative_g_cost = arrival + edge_cost(edge, arrival)
                 
                 # Check if this neighbor is already in open set
                 if open_set_nodes.hasKey(neighbor.label):
@@ -573,55 +1140,337 @@ class DSAWeightedGraph:
                     if tentative_g_cost < neighbor_astar.g_cost:
                         # Found better path to this neighbor
                         neighbor_astar.g_cost = tentative_g_cost
-                        neighbor_astar.f_cost = tentative_g_cost + h_cost
+                        neighbor_astar.f_cost = tentative_g_cost + neighbor_astar.h_cost
                         neighbor_astar.parent = current_astar
-                        # Re-heapify the heap
-                        open_set.heapify()
+                        # Move the entry up to its new priority in O(log n)
+                        open_set.decrease_key(neighbor_astar.handle, neighbor_astar.f_cost)
                 else:
                     # New node, add to open set
+                    h_cost = estimate(neighbor, goal_node)
                     new_astar = AStarNode(neighbor, tentative_g_cost, h_cost, current_astar)
-                    open_set.add(new_astar.f_cost, new_astar)
+                    new_astar.handle = open_set.add(new_astar.f_cost, new_astar)
                     open_set_nodes.put(neighbor.label, new_astar)
         
         # No path found
-        return AStarPath(DSALinkedList(), float('inf'))
+        return AStarPath(DSALinkedList(), float('inf'), expanded)
     
-    def _heuristic(self, current_node, goal_node):
+    def bidirectionalSearch(self, start_label, goal_label, heuristic=None):
         """
-        Heuristic function for A* algorithm.
-        Uses a more conservative heuristic that ensures admissibility.
+        Bidirectional Dijkstra/A*: search forward from the start and backward
+        from the goal with two DSAHeapMin frontiers until they meet.
+        
+        With a heuristic the searches use the average potential
+        p(v) = (h(v, goal) - h(v, start)) / 2 (forward) and -p(v) (backward),
+        which keeps reduced edge costs non-negative, so the standard stopping
+        rule top_forward + top_backward >= best meeting cost stays exact.
+        
+        Args:
+            start_label: Label of the starting vertex
+            goal_label: Label of the destination vertex
+            heuristic: Optional heuristic override, as for aStarPathfinding
+            
+        Returns:
+            AStarPath: Object containing the path (as DSALinkedList) and total cost
         """
-        # If there's a direct connection, use that edge weight
-        if self.isAdjacent(current_node.label, goal_node.label):
-            return self.getEdgeWeight(current_node.label, goal_node.label)
+        if not self.hasVertex(start_label):
+            raise ValueError(f"Start vertex '{start_label}' not found")
+        if not self.hasVertex(goal_label):
+            raise ValueError(f"Goal vertex '{goal_label}' not found")
         
-        # For nodes without direct connection, use a conservative heuristic
-        # that estimates the minimum possible cost to reach the goal
-        # This ensures the heuristic is admissible (never overestimates)
-        return 0  # Conservative heuristic - always underestimate
+        start_node = self._get_node(start_label)
+        goal_node = self._get_node(goal_label)
+        if start_node == goal_node:
+            path = DSALinkedList()
+            path.insertLast(start_node.label)
+            return AStarPath(path, 0)
+        if not self.isConnected(start_label, goal_label):
+            return AStarPath(DSALinkedList(), float('inf'))
+        
+        estimate = self._make_heuristic(heuristic)
+        
+        def potential(node):
+            return (estimate(node, goal_node) - estimate(node, start_node)) / 2
+        
+        # Per-direction state: [frontier, distance, parent, settled, sign of potential]
+        forward = [DSAHeapMin(), DSAHashTable(), DSAHashTable(), DSAHashTable(), 1]
+        backward = [DSAHeapMin(), DSAHashTable(), DSAHashTable(), DSAHashTable(), -1]
+        for side, node in ((forward, start_node), (backward, goal_node)):
+            side[1].put(node.label, 0)
+            side[0].add(side[4] * potential(node), node)
+        
+        best_cost = float('inf')
+        meeting_node = None
+        expanded = 0
+        
+        while True:
+            # Discard entries for vertices already settled on that side
+            for side in (forward, backward):
+                while not side[0].isEmpty() and side[3].hasKey(side[0].peek().label):
+                    side[0].remove()
+            if forward[0].isEmpty() or backward[0].isEmpty():
+                break
+            if forward[0].peek_priority() + backward[0].peek_priority() >= best_cost:
+                break
+            
+            # Expand the side with the smaller frontier key
+            if forward[0].peek_priority() <= backward[0].peek_priority():
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            frontier, distance, parent, settled, sign = side
+            current_node = frontier.remove()
+            settled.put(current_node.label, True)
+            expanded += 1
+            current_cost = distance.get(current_node.label)
+            
+            for edge in current_node.getAdjacent():
+                neighbor = edge.getDestination()
+                if settled.hasKey(neighbor.label):
+                    continue
+                tentative = current_cost + edge.getWeight()
+                if not distance.hasKey(neighbor.label) or tentative < distance.get(neighbor.label):
+                    distance.put(neighbor.label, tentative)
+                    parent.put(neighbor.label, current_node)
+                    frontier.add(tentative + sign * potential(neighbor), neighbor)
+                # A vertex labelled by both searches closes a start-goal route
+                if other[1].hasKey(neighbor.label):
+                    route_cost = distance.get(neighbor.label) + other[1].get(neighbor.label)
+                    if route_cost < best_cost:
+                        best_cost = route_cost
+                        meeting_node = neighbor
+        
+        if meeting_node is None:
+            return AStarPath(DSALinkedList(), float('inf'), expanded)
+        
+        # Stitch start -> meeting node (forward parents) and meeting node -> goal (backward parents)
+        path = DSALinkedList()
+        node = meeting_node
+        while node is not None:
+            path.insertFirst(node.label)
+            node = forward[2].get(node.label) if forward[2].hasKey(node.label) else None
+        node = backward[2].get(meeting_node.label) if backward[2].hasKey(meeting_node.label) else None
+        while node is not None:
+            path.insertLast(node.label)
+            node = backward[2].get(node.label) if backward[2].hasKey(node.label) else None
+        return AStarPath(path, best_cost, expanded)
     
-    def _findInOpenSet(self, open_set, target_node):
+    def timeDependentPathfinding(self, start_label, goal_label, departure_time, heuristic=None):
         """
-        Find an AStarNode in the open set that corresponds to the target node.
-        Returns None if not found.
+        Time-dependent A*: the earliest-arrival route when leaving the start at
+        departure_time. A corridor with a travel profile costs what its profile
+        gives at the moment it is entered; other corridors cost their weight.
+        Profiles are FIFO, so settling vertices in order of arrival time stays
+        exact, as in the static search.
+        
+        The heuristic is scaled by the smallest ratio of profile travel time to
+        static weight over all corridors, which keeps it a lower bound.
+        
+        Args:
+            start_label: Label of the starting vertex
+            goal_label: Label of the destination vertex
+            departure_time: Minutes since midnight (may run past 1440 into the next day)
+            heuristic: Optional heuristic override, as for aStarPathfinding
+            
+        Returns:
+            AStarPath: Path and travel minutes (arrival time - departure_time)
         """
-        # Since we can't directly search the heap, we'll need to rebuild it
-        # This is not the most efficient, but works with our DSAHeap implementation
-        temp_entries = DSALinkedList()
-        found_node = None
+        static_estimate = self._make_heuristic(heuristic)
+        ratio = self._get_profile_ratio()
         
-        # Extract all entries from heap
-        while not open_set.isEmpty():
-            entry = open_set.remove()
-            if entry.node == target_node:
-                found_node = entry
-            temp_entries.insertLast(entry)
+        # g_cost holds the arrival time at each vertex
+        return self._aStarSearch(start_label, goal_label,
+                                 lambda node, goal: ratio * static_estimate(node, goal),
+                                 lambda edge, arrival_time: edge.getTravelTime(arrival_time),
+                                 start_cost=departure_time)
+    
+    def _get_profile_ratio(self):
+        """
+        Lower bound of travel time / static weight over all corridors (at most 1),
+        used to keep static heuristics admissible for time-dependent searches.
+        """
+        if self._profile_count == 0:
+            return 1
+        with self._cache_lock:
+            if self._profile_ratio is None:
+                ratio = 1
+                for node in self._vertices:
+                    for edge in node.getAdjacent():
+                        if edge.profile is not None:
+                            weight = edge.getWeight()
+                            ratio = min(ratio, edge.profile.getMinimum() / weight if weight > 0 else 0)
+                self._profile_ratio = ratio
+            return self._profile_ratio
+    
+    def nearestOfType(self, start_label, department_type, k=1):
+        """
+        Multi-target Dijkstra: find the k nearest vertices whose type tag
+        (DSAGraphNode.getType) equals department_type, stopping as soon as the
+        k-th target is settled instead of running one search per candidate.
         
-        # Rebuild the heap
-        for entry in temp_entries:
-            open_set.add(-entry.f_cost, entry)
+        Args:
+            start_label: Label of the starting vertex
+            department_type: Type tag the targets must carry
+            k: Number of targets to return
+            
+        Returns:
+            DSALinkedList: AStarPath objects ordered by cost (fewer than k if
+            not enough targets are reachable)
+        """
+        if not self.hasVertex(start_label):
+            raise ValueError(f"Start vertex '{start_label}' not found")
+        if k < 1:
+            raise ValueError("k must be at least 1")
         
-        return found_node
+        start_node = self._get_node(start_label)
+        distance = DSAHashTable()
+        parent = DSAHashTable()
+        handles = DSAHashTable()
+        settled = DSAHashTable()
+        frontier = DSAIndexedHeapMin()
+        
+        distance.put(start_node.label, 0)
+        handles.put(start_node.label, frontier.add(0, start_node))
+        results = DSALinkedList()
+        
+        while not frontier.isEmpty() and results.getCount() < k:
+            current_node = frontier.remove()
+            settled.put(current_node.label, True)
+            current_cost = distance.get(current_node.label)
+            
+            if current_node.getType() == department_type:
+                path = DSALinkedList()
+                node = current_node
+                while node is not None:
+                    path.insertFirst(node.label)
+                    node = parent.get(node.label) if parent.hasKey(node.label) else None
+                results.insertLast(AStarPath(path, current_cost))
+            
+            for edge in current_node.getAdjacent():
+                neighbor = edge.getDestination()
+                if settled.hasKey(neighbor.label):
+                    continue
+                tentative = current_cost + edge.getWeight()
+                if not distance.hasKey(neighbor.label):
+                    distance.put(neighbor.label, tentative)
+                    parent.put(neighbor.label, current_node)
+                    handles.put(neighbor.label, frontier.add(tentative, neighbor))
+                elif tentative < distance.get(neighbor.label):
+                    distance.put(neighbor.label, tentative)
+                    parent.put(neighbor.label, current_node)
+                    frontier.decrease_key(handles.get(neighbor.label), tentative)
+        
+        return results
+    
+    def setHeuristic(self, heuristic="euclidean", cost_per_distance=None):
+        """
+        Select the default A* heuristic.
+        
+        Args:
+            heuristic: "none", "euclidean", "manhattan", "alt" (landmarks), or a
+                callable h(node, goal_node)
+            cost_per_distance: Minimum walking cost per unit of coordinate distance.
+                None calibrates it from the corridors so the heuristic stays admissible.
+        """
+        if not callable(heuristic) and heuristic not in self.HEURISTICS:
+            raise ValueError(f"heuristic must be one of {self.HEURISTICS} or a callable")
+        if cost_per_distance is not None and cost_per_distance < 0:
+            raise ValueError("cost_per_distance must be non-negative")
+        self._heuristic_mode = heuristic
+        self._cost_per_distance = cost_per_distance
+        self._calibration = None
+    
+    def getHeuristic(self):
+        return self._heuristic_mode
+    
+    def buildLandmarks(self, count=None):
+        """
+        Preprocess k landmarks (farthest-point selection) for the "alt" heuristic.
+        Landmarks are dropped when the graph changes and rebuilt lazily with the
+        same count the next time the heuristic is used.
+        """
+        if count is not None:
+            if count < 1:
+                raise ValueError("Landmark count must be at least 1")
+            self._landmark_count = int(count)
+        self._landmarks = DSALandmarks.fromSnapshot(self.freeze(), self._landmark_count)
+        return self._landmarks
+    
+    def getLandmarks(self):
+        """Get the current landmarks, or None if not built or invalidated."""
+        return self._landmarks
+    
+    @staticmethod
+    def _distance(a, b, mode):
+        """Coordinate distance between two (x, y) points under the given metric."""
+        if mode == "manhattan":
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        return math.hypot(a[0] - b[0], a[1] - b[1])
+    
+    def calibrateHeuristic(self, mode="euclidean"):
+        """
+        Compute the largest admissible cost-per-distance for a metric, i.e. the
+        minimum over all corridors of weight / coordinate distance. Returns 0 when
+        any department lacks coordinates, which disables the coordinate heuristic.
+        """
+        scale = float('inf')
+        for node in self._vertices:
+            here = node.getCoordinates()
+            if here is None:
+                return 0
+            for edge in node.getAdjacent():
+                there = edge.getDestination().getCoordinates()
+                if there is None:
+                    return 0
+                distance = self._distance(here, there, mode)
+                if distance > 0:
+                    scale = min(scale, edge.getWeight() / distance)
+        return 0 if scale == float('inf') else scale
+    
+    def _cost_scale(self, mode):
+        """Cost-per-distance for a metric, calibrated lazily and cached per graph version."""
+        if self._cost_per_distance is not None:
+            return self._cost_per_distance
+        with self._cache_lock:
+            if self._calibration is None or self._calibration[0] != self._version or self._calibration[1] != mode:
+                self._calibration = (self._version, mode, self.calibrateHeuristic(mode))
+            return self._calibration[2]
+    
+    def _make_heuristic(self, heuristic=None):
+        """Resolve a heuristic name (or the graph default) into a function h(node, goal_node)."""
+        mode = self._heuristic_mode if heuristic is None else heuristic
+        if callable(mode):
+            return mode
+        if mode not in self.HEURISTICS:
+            raise ValueError(f"heuristic must be one of {self.HEURISTICS} or a callable")
+        if mode == "alt":
+            return self._landmark_heuristic()
+        scale = 0 if mode == "none" else self._cost_scale(mode)
+        if scale == 0:
+            return lambda current_node, goal_node: 0
+        
+        def coordinate_heuristic(current_node, goal_node):
+            here = current_node.getCoordinates()
+            goal = goal_node.getCoordinates()
+            if here is None or goal is None:
+                return 0
+            return scale * self._distance(here, goal, mode)
+        return coordinate_heuristic
+    
+    def _landmark_heuristic(self):
+        """ALT heuristic h(node, goal_node) backed by the landmark distance matrix."""
+        with self._cache_lock:
+            landmarks = self._landmarks if self._landmarks is not None else self.buildLandmarks()
+        
+        def landmark_heuristic(current_node, goal_node):
+            return landmarks.estimate(landmarks.getId(current_node.label), landmarks.getId(goal_node.label))
+        return landmark_heuristic
+    
+    def _heuristic(self, current_node, goal_node):
+        """
+        Heuristic function for A* algorithm using the graph's default heuristic.
+        A scaled coordinate distance never overestimates, so it stays admissible.
+        """
+        return self._make_heuristic()(current_node, goal_node)
 
 
 class AStarNode:
@@ -633,6 +1482,7 @@ class AStarNode:
         self.h_cost = h_cost  # Heuristic cost from this node to goal
         self.f_cost = g_cost + h_cost  # Total cost
         self.parent = parent
+        self.handle = None  # Position handle in the open set heap
     
     def __lt__(self, other):
         """For priority queue comparison."""
@@ -647,16 +1497,3 @@ class AStarNode:
     def __str__(self):
         return f"AStarNode({self.node.label}, f={self.f_cost}, g={self.g_cost}, h={self.h_cost})"
 
-
-class AStarPath:
-    """Container for A* pathfinding results."""
-    
-    def __init__(self, path=None, cost=0):
-        self.path = path if path is not None else DSALinkedList()
-        self.cost = cost
-    
-    def getPath(self):
-        return self.path
-    
-    def getCost(self):
-        return self.cost
\ No newline at end of file
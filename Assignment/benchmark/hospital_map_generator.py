@@ -0,0 +1,219 @@
+"""
+Synthetic hospital map generator.
+
+Builds realistic site graphs in the hospital_config.json schema (department,
+x, y, type, corridors) for scaling tests:
+
+    grid    multi-floor grids of departments joined by lifts
+    planar  a jittered random planar corridor network with a chosen V and E
+
+Corridor times are at least the straight-line distance between departments,
+so the coordinate heuristics used by A* stay admissible.
+
+Usage:
+    python benchmark/hospital_map_generator.py grid --floors 4 --rows 30 --cols 30 --lifts 6 -o site.json
+    python benchmark/hospital_map_generator.py planar --vertices 100000 --edges 180000 -o site.json
+"""
+
+import argparse
+import json
+import math
+import numpy as np
+
+SPACING = 10  # coordinate distance between neighbouring departments
+DEPARTMENT_TYPES = np.array(["Ward", "Outpatient", "Laboratory", "Pharmacy", "Radiology",
+                             "Reception", "ICU", "Operating Theatre", "Emergency"], dtype=object)
+TYPE_WEIGHTS = np.array([0.40, 0.15, 0.08, 0.07, 0.07, 0.08, 0.06, 0.05, 0.04])
+
+
+class SiteMap:
+    """
+    Generated site: per-department labels, coordinates and types, and the
+    undirected corridors as parallel (edge_u, edge_v, edge_w) arrays.
+    """
+
+    def __init__(self, labels, x, y, types, edge_u, edge_v, edge_w):
+        self.labels = labels
+        self.x = x
+        self.y = y
+        self.types = types
+        self.edge_u = edge_u
+        self.edge_v = edge_v
+        self.edge_w = edge_w
+
+    def getVertexCount(self):
+        return len(self.labels)
+
+    def getEdgeCount(self):
+        return len(self.edge_u)
+
+    def write_config(self, file_path):
+        """
+        Write the site in the hospital_config.json schema, one department at a
+        time, listing every corridor from both ends as the sample config does.
+        """
+        vertex_count = self.getVertexCount()
+        sources = np.concatenate((self.edge_u, self.edge_v))
+        targets = np.concatenate((self.edge_v, self.edge_u))
+        weights = np.concatenate((self.edge_w, self.edge_w))
+        order = np.argsort(sources, kind="stable")
+        targets = targets[order].tolist()
+        weights = weights[order].tolist()
+        offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=vertex_count), out=offsets[1:])
+        labels = self.labels.tolist()
+        xs = self.x.tolist()
+        ys = self.y.tolist()
+
+        with open(file_path, 'w') as file:
+            file.write("[\n")
+            for vertex_id in range(vertex_count):
+                record = {
+                    "department": labels[vertex_id],
+                    "x": xs[vertex_id],
+                    "y": ys[vertex_id],
+                    "type": self.types[vertex_id],
+                    "corridors": [{"department": labels[targets[slot]], "weight": weights[slot]}
+                                  for slot in range(offsets[vertex_id], offsets[vertex_id + 1])]
+                }
+                file.write(json.dumps(record))
+                file.write(",\n" if vertex_id + 1 < vertex_count else "\n")
+            file.write("]\n")
+
+
+def _corridor_weights(rng, x, y, edge_u, edge_v, slack=1.5):
+    """Walking time: straight-line distance times a random detour factor in [1, slack]."""
+    distance = np.hypot(x[edge_u] - x[edge_v], y[edge_u] - y[edge_v])
+    return np.maximum(1, np.ceil(distance * rng.uniform(1.0, slack, len(edge_u)))).astype(np.int64)
+
+
+def _random_types(rng, count):
+    return rng.choice(DEPARTMENT_TYPES, size=count, p=TYPE_WEIGHTS)
+
+
+def multi_floor_grid(floors=3, rows=10, cols=10, lifts=4, seed=1):
+    """
+    Stack of rows x cols department grids, one per floor, joined by lift shafts
+    at `lifts` random grid positions. Every floor shares the same x/y plan.
+    """
+    if floors < 1 or rows < 1 or cols < 1:
+        raise ValueError("floors, rows and cols must be at least 1")
+    rng = np.random.default_rng(seed)
+    per_floor = rows * cols
+    ids = np.arange(floors * per_floor).reshape(floors, rows, cols)
+
+    floor_of = np.repeat(np.arange(floors), per_floor)
+    row_of = np.tile(np.repeat(np.arange(rows), cols), floors)
+    col_of = np.tile(np.arange(cols), floors * rows)
+    x = col_of * SPACING
+    y = row_of * SPACING
+    labels = np.array([f"F{f} {r}-{c}" for f, r, c in zip(floor_of, row_of, col_of)], dtype=object)
+    types = _random_types(rng, len(labels))
+
+    edge_u = np.concatenate((ids[:, :, :-1].ravel(), ids[:, :-1, :].ravel()))
+    edge_v = np.concatenate((ids[:, :, 1:].ravel(), ids[:, 1:, :].ravel()))
+    edge_w = _corridor_weights(rng, x, y, edge_u, edge_v)
+
+    if floors > 1 and lifts > 0:
+        shafts = rng.choice(per_floor, size=min(lifts, per_floor), replace=False)
+        lift_u = (np.arange(floors - 1)[:, None] * per_floor + shafts[None, :]).ravel()
+        lift_v = lift_u + per_floor
+        types[lift_u] = "Lift"
+        types[lift_v] = "Lift"
+        lift_w = rng.integers(15, 31, len(lift_u))  # waiting plus travel time per floor
+        edge_u = np.concatenate((edge_u, lift_u))
+        edge_v = np.concatenate((edge_v, lift_v))
+        edge_w = np.concatenate((edge_w, lift_w))
+
+    return SiteMap(labels, x, y, types, edge_u, edge_v, edge_w)
+
+
+def planar_site(vertices=1000, edges=None, seed=1):
+    """
+    Connected random planar corridor network on a jittered grid.
+
+    Candidate corridors are the grid edges plus one diagonal per cell, which
+    never cross. A comb (every row edge plus the first column) keeps the site
+    connected; the remaining candidates are sampled to reach `edges`
+    (between V - 1 and about 3V; defaults to 1.5V).
+    """
+    if vertices < 2:
+        raise ValueError("vertices must be at least 2")
+    rng = np.random.default_rng(seed)
+    side = math.ceil(math.sqrt(vertices))
+    vertex_ids = np.arange(vertices)
+    row_of = vertex_ids // side
+    col_of = vertex_ids % side
+    jitter = rng.uniform(-0.3, 0.3, (2, vertices)) * SPACING
+    x = np.round(col_of * SPACING + jitter[0], 1)
+    y = np.round(row_of * SPACING + jitter[1], 1)
+    labels = np.array([f"Dept {r}-{c}" for r, c in zip(row_of, col_of)], dtype=object)
+    types = _random_types(rng, vertices)
+
+    def valid(u, v):
+        keep = v < vertices
+        return u[keep], v[keep]
+
+    # Row edges, then the first-column edges: together a spanning comb
+    row_u, row_v = valid(vertex_ids[col_of < side - 1], vertex_ids[col_of < side - 1] + 1)
+    first_col = vertex_ids[col_of == 0]
+    spine_u, spine_v = valid(first_col, first_col + side)
+
+    # Optional corridors: other column edges and one diagonal per cell
+    other_col = vertex_ids[col_of > 0]
+    column_u, column_v = valid(other_col, other_col + side)
+    cells = vertex_ids[col_of < side - 1]
+    backslash = rng.random(len(cells)) < 0.5
+    diag_u = np.where(backslash, cells, cells + 1)
+    diag_v = np.where(backslash, cells + side + 1, cells + side)
+    diag_u, diag_v = valid(diag_u, diag_v)
+
+    base_u = np.concatenate((row_u, spine_u))
+    base_v = np.concatenate((row_v, spine_v))
+    extra_u = np.concatenate((column_u, diag_u))
+    extra_v = np.concatenate((column_v, diag_v))
+
+    target = int(1.5 * vertices) if edges is None else int(edges)
+    if target < len(base_u):
+        raise ValueError(f"edges must be at least {len(base_u)} to keep the site connected")
+    extra_count = min(target - len(base_u), len(extra_u))
+    if target - len(base_u) > len(extra_u):
+        print(f"Note: a planar site of {vertices} departments has at most "
+              f"{len(base_u) + len(extra_u)} corridors here; using that")
+    chosen = rng.choice(len(extra_u), size=extra_count, replace=False)
+
+    edge_u = np.concatenate((base_u, extra_u[chosen]))
+    edge_v = np.concatenate((base_v, extra_v[chosen]))
+    edge_w = _corridor_weights(rng, x, y, edge_u, edge_v)
+    return SiteMap(labels, x, y, types, edge_u, edge_v, edge_w)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic hospital site configs.")
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+
+    grid = subparsers.add_parser("grid", help="multi-floor grid joined by lifts")
+    grid.add_argument("--floors", type=int, default=3)
+    grid.add_argument("--rows", type=int, default=10)
+    grid.add_argument("--cols", type=int, default=10)
+    grid.add_argument("--lifts", type=int, default=4)
+
+    planar = subparsers.add_parser("planar", help="random planar corridor network")
+    planar.add_argument("--vertices", type=int, default=1000)
+    planar.add_argument("--edges", type=int, default=None)
+
+    for sub in (grid, planar):
+        sub.add_argument("--seed", type=int, default=1)
+        sub.add_argument("-o", "--output", required=True, help="config file to write")
+
+    args = parser.parse_args()
+    if args.kind == "grid":
+        site = multi_floor_grid(args.floors, args.rows, args.cols, args.lifts, args.seed)
+    else:
+        site = planar_site(args.vertices, args.edges, args.seed)
+    site.write_config(args.output)
+    print(f"Wrote {site.getVertexCount()} departments and {site.getEdgeCount()} corridors to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
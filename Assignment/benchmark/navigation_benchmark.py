@@ -0,0 +1,152 @@
+"""
+Navigation benchmark runner.
+
+Loads a hospital config (e.g. one written by hospital_map_generator.py), runs
+a seeded set of random queries through each navigation algorithm and reports
+latency percentiles, vertices expanded and peak traced memory per algorithm.
+Results can be saved as JSON and compared against an earlier run.
+
+Usage:
+    python benchmark/navigation_benchmark.py site.json --queries 200 --save run.json
+    python benchmark/navigation_benchmark.py site.json --compare run.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from model.HospitalModel import HospitalModel  # noqa: E402
+
+ALGORITHMS = ("astar", "bidirectional", "bfs", "dfs")
+PERCENTILES = (50, 90, 99)
+MEMORY_SAMPLE = 20  # queries traced for peak memory (tracing slows everything down)
+
+
+def run_query(graph, algorithm, start, goal, bfs_depth=None):
+    """Run one query; returns vertices expanded, or None if the algorithm does not count them."""
+    if algorithm == "astar":
+        return graph.aStarPathfinding(start, goal).getExpanded()
+    if algorithm == "bidirectional":
+        return graph.bidirectionalSearch(start, goal).getExpanded()
+    if algorithm == "bfs":
+        return sum(level.getCount() for level in graph.iterBreadthFirstLevels(start, bfs_depth))
+    if algorithm == "dfs":
+        graph.depthFirstSearch(start)
+        return None
+    raise ValueError(f"Unknown algorithm '{algorithm}'")
+
+
+def benchmark_algorithm(graph, algorithm, pairs, bfs_depth=None):
+    """Time every query, then trace peak memory over a small sample."""
+    latencies = np.empty(len(pairs))
+    expanded = []
+    for index, (start, goal) in enumerate(pairs):
+        began = time.perf_counter()
+        count = run_query(graph, algorithm, start, goal, bfs_depth)
+        latencies[index] = time.perf_counter() - began
+        if count is not None:
+            expanded.append(count)
+
+    tracemalloc.start()
+    for start, goal in pairs[:MEMORY_SAMPLE]:
+        tracemalloc.reset_peak()
+        run_query(graph, algorithm, start, goal, bfs_depth)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"queries": len(pairs), "mean_ms": float(latencies.mean() * 1000)}
+    for percentile in PERCENTILES:
+        result[f"p{percentile}_ms"] = float(np.percentile(latencies, percentile) * 1000)
+    result["max_ms"] = float(latencies.max() * 1000)
+    result["mean_expanded"] = float(np.mean(expanded)) if expanded else None
+    result["peak_kib"] = peak / 1024
+    return result
+
+
+def print_results(results):
+    columns = ["mean_ms"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms", "mean_expanded", "peak_kib"]
+    print(f"{'algorithm':<14}" + "".join(f"{name:>15}" for name in columns))
+    for algorithm, row in results.items():
+        cells = "".join(f"{'-':>15}" if row[name] is None else f"{row[name]:>15.2f}" for name in columns)
+        print(f"{algorithm:<14}{cells}")
+
+
+def print_comparison(results, baseline):
+    """Show the relative change of each metric against a saved run (negative is better)."""
+    print(f"\nChange against baseline ({baseline['meta']['config']}):")
+    columns = [f"p{p}_ms" for p in PERCENTILES] + ["mean_expanded", "peak_kib"]
+    print(f"{'algorithm':<14}" + "".join(f"{name:>15}" for name in columns))
+    for algorithm, row in results.items():
+        before = baseline["results"].get(algorithm)
+        if before is None:
+            continue
+        cells = ""
+        for name in columns:
+            if row[name] is None or not before.get(name):
+                cells += f"{'-':>15}"
+            else:
+                cells += f"{(row[name] - before[name]) / before[name] * 100:>+14.1f}%"
+        print(f"{algorithm:<14}{cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hospital navigation algorithms.")
+    parser.add_argument("config", help="hospital config JSON")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--algorithms", default=",".join(ALGORITHMS),
+                        help=f"comma-separated subset of {','.join(ALGORITHMS)}")
+    parser.add_argument("--bfs-depth", type=int, default=None, help="limit BFS levels")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    algorithms = [name.strip() for name in args.algorithms.split(",") if name.strip()]
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm '{name}'")
+
+    began = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph = HospitalModel(args.config, use_snapshot=False, spt_cache_size=0).get_graph()
+    load_seconds = time.perf_counter() - began
+    print(f"Loaded {graph.getVertexCount()} departments, {graph.getEdgeCount()} corridors "
+          f"in {load_seconds:.2f} s")
+
+    labels = [node.label for node in graph._vertices]
+    rng = np.random.default_rng(args.seed)
+    picks = rng.integers(0, len(labels), size=(args.queries, 2))
+    pairs = [(labels[a], labels[b]) for a, b in picks]
+
+    results = {}
+    for algorithm in algorithms:
+        results[algorithm] = benchmark_algorithm(graph, algorithm, pairs, args.bfs_depth)
+    print_results(results)
+
+    report = {
+        "meta": {"config": args.config, "vertices": graph.getVertexCount(),
+                 "edges": graph.getEdgeCount(), "queries": args.queries, "seed": args.seed,
+                 "load_seconds": load_seconds},
+        "results": results
+    }
+    if args.compare:
+        with open(args.compare) as file:
+            print_comparison(results, json.load(file))
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
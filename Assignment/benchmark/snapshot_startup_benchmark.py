@@ -0,0 +1,88 @@
+"""
+Cold-start benchmark: HospitalModel built from the JSON config versus from the
+binary graph snapshot.
+
+Generates a synthetic grid-shaped site config, then starts a fresh Python
+process per run (so nothing is cached in memory) and times the model
+construction in each mode.
+
+Usage:
+    python benchmark/snapshot_startup_benchmark.py [--size 60] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+CHILD_SCRIPT = """
+import sys, time, io, contextlib
+sys.path.insert(0, {root!r})
+from model.HospitalModel import HospitalModel
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    HospitalModel({config!r}, use_snapshot={use_snapshot})
+print(time.perf_counter() - start)
+"""
+
+
+def write_grid_config(path, size, seed=1):
+    """Write a size x size grid of departments with random corridor times."""
+    rng = random.Random(seed)
+    departments = []
+    for row in range(size):
+        for col in range(size):
+            corridors = []
+            for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = row + d_row, col + d_col
+                if 0 <= r < size and 0 <= c < size:
+                    corridors.append({"department": f"Dept {r}-{c}", "weight": 0})
+            departments.append({"department": f"Dept {row}-{col}", "x": col * 10, "y": row * 10,
+                                "corridors": corridors})
+    # Give both directions of each corridor the same weight
+    weights = {}
+    for dept in departments:
+        for corridor in dept["corridors"]:
+            key = tuple(sorted((dept["department"], corridor["department"])))
+            weights.setdefault(key, rng.randint(10, 30))
+            corridor["weight"] = weights[key]
+    with open(path, "w") as file:
+        json.dump(departments, file)
+
+
+def time_start(config, use_snapshot):
+    code = CHILD_SCRIPT.format(root=PROJECT_ROOT, config=config, use_snapshot=use_snapshot)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=60, help="grid side; departments = size^2")
+    parser.add_argument("--runs", type=int, default=3, help="cold starts per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "site_config.json")
+        write_grid_config(config, args.size)
+        # Build the snapshot once so the snapshot runs find it up to date
+        time_start(config, True)
+
+        json_times = [time_start(config, False) for _ in range(args.runs)]
+        snapshot_times = [time_start(config, True) for _ in range(args.runs)]
+
+    best_json = min(json_times)
+    best_snapshot = min(snapshot_times)
+    print(f"Departments: {args.size * args.size}, runs per mode: {args.runs}")
+    print(f"JSON cold start:     {best_json * 1000:9.1f} ms (best)")
+    print(f"Snapshot cold start: {best_snapshot * 1000:9.1f} ms (best)")
+    print(f"Speedup:             {best_json / best_snapshot:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
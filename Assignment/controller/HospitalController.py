@@ -37,9 +37,13 @@ class HospitalController:
                 elif choice == 6:
                     self.handle_department_info()
                 elif choice == 7:
+                    self.handle_nearest_department()
+                elif choice == 8:
+                    self.handle_alternative_routes()
+                elif choice == 9:
                     self.handle_exit()
                 else:
-                    self.view.display_error("Invalid choice. Please select 1-7.")
+                    self.view.display_error("Invalid choice. Please select 1-9.")
                 
                 if self.running:
                     self.view.display_separator()
@@ -71,8 +75,22 @@ class HospitalController:
             self.view.display_error("Destination department cannot be empty")
             return
         
+        # With congestion profiles loaded, optionally route for a departure time
+        departure = None
+        if self.model.has_time_profiles():
+            departure_input = self.view.get_time_input("Departure time")
+            if departure_input is not None:
+                try:
+                    departure = self.model.parse_clock_time(departure_input)
+                except ValueError as e:
+                    self.view.display_error(str(e))
+                    return
+        
         # Find shortest path
-        result = self.model.find_shortest_path(start_dept, end_dept)
+        if departure is None:
+            result = self.model.find_shortest_path(start_dept, end_dept)
+        else:
+            result = self.model.find_shortest_path_at(start_dept, end_dept, departure)
         
         # Display results
         if result is None:
@@ -87,7 +105,7 @@ class HospitalController:
             self.view.display_error("No path found between departments")
             return
         
-        self.view.display_shortest_path(path, total_cost, start_dept, end_dept)
+        self.view.display_shortest_path(path, total_cost, start_dept, end_dept, departure)
     
     def handle_reachable_departments(self):
         print("\nGET REACHABLE DEPARTMENTS")
@@ -103,8 +121,9 @@ class HospitalController:
             self.view.display_error("Starting department cannot be empty")
             return
         
-        # Get reachable departments
-        levels = self.model.get_reachable_departments(start_dept)
+        # Get reachable departments, streamed one level at a time
+        max_depth = self.view.get_limit_input("Maximum corridors away")
+        levels = self.model.iter_reachable_departments(start_dept, max_depth)
         
         # Display results
         self.view.display_reachable_departments(levels, start_dept)
@@ -124,7 +143,8 @@ class HospitalController:
             return
         
         # Detect cycles
-        cycles = self.model.detect_cycles(start_dept)
+        mode = "shortest" if self.view.get_confirmation("Find the shortest cycle") else "dfs"
+        cycles = self.model.detect_cycles(start_dept, mode)
         
         # Display results
         self.view.display_cycles(cycles, start_dept)
@@ -175,6 +195,64 @@ class HospitalController:
                     if time:
                         print(f"   → {adj_dept}: {time} minutes")
     
+    def handle_nearest_department(self):
+        print("\nFIND NEAREST DEPARTMENT BY TYPE")
+        print("-" * 30)
+        
+        # Display available departments
+        departments = self.model.get_departments()
+        self.view.display_departments(departments)
+        
+        # Get start department
+        start_dept = self.view.get_department_input("Enter starting department")
+        if not start_dept:
+            self.view.display_error("Starting department cannot be empty")
+            return
+        
+        # Get department type
+        dept_type = self.view.get_department_input("Enter department type (e.g. Radiology)")
+        if not dept_type:
+            self.view.display_error("Department type cannot be empty")
+            return
+        
+        # Get how many results to show
+        count = self.view.get_count_input("How many nearest departments", 1)
+        
+        # Find nearest departments
+        results = self.model.find_nearest_department(start_dept, dept_type, count)
+        
+        # Display results
+        self.view.display_nearest_departments(results, start_dept, dept_type)
+    
+    def handle_alternative_routes(self):
+        print("\nFIND ALTERNATIVE ROUTES")
+        print("-" * 30)
+        
+        # Display available departments
+        departments = self.model.get_departments()
+        self.view.display_departments(departments)
+        
+        # Get start department
+        start_dept = self.view.get_department_input("Enter starting department")
+        if not start_dept:
+            self.view.display_error("Starting department cannot be empty")
+            return
+        
+        # Get end department
+        end_dept = self.view.get_department_input("Enter destination department")
+        if not end_dept:
+            self.view.display_error("Destination department cannot be empty")
+            return
+        
+        # Get how many routes to show
+        count = self.view.get_count_input("How many routes", 3)
+        
+        # Find the cheapest routes
+        routes = self.model.find_alternative_routes(start_dept, end_dept, count)
+        
+        # Display results side by side
+        self.view.display_alternative_routes(routes, start_dept, end_dept)
+    
     def handle_exit(self):
         """Handle exit functionality."""
         if self.view.get_confirmation("Are you sure you want to exit?"):
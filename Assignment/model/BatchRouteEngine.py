@@ -0,0 +1,124 @@
+"""
+Batch route engine for Hospital Management System.
+Answers many (start, goal) route queries at once by grouping them by start
+department, so each group shares one shortest-path tree, and spreading the
+groups across a process pool.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from DataStructures.DSAHashTable import DSAHashTable
+from DataStructures.DSALinkedList import DSALinkedList
+from DataStructures.DSAShortestPathTree import DSAShortestPathTree
+from DataStructures.AStarPath import AStarPath
+
+# Snapshot held by each worker process, installed once by _init_worker
+_worker_snapshot = None
+
+
+def _init_worker(snapshot):
+    """Process pool initializer: receive the pickled CSR snapshot once per worker."""
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+
+def _solve_group(source, goals):
+    """
+    Solve every goal of one start department with a single shortest-path tree.
+    Paths are returned as plain (labels, cost) tuples, which pickle cheaply.
+    """
+    return _solve_with_snapshot(_worker_snapshot, source, goals)
+
+
+def _solve_with_snapshot(snapshot, source, goals):
+    try:
+        tree = DSAShortestPathTree(snapshot, source)
+    except ValueError:
+        return [None] * len(goals)
+
+    answers = []
+    for goal in goals:
+        try:
+            result = tree.getPath(goal)
+            answers.append((tuple(result.getPath()), result.getCost()))
+        except ValueError:
+            answers.append(None)
+    return answers
+
+
+class BatchRouteEngine:
+    """
+    Runs batches of route queries over a DSAWeightedGraph.
+    """
+    
+    def __init__(self, graph, max_workers=None):
+        """
+        Initialize the batch engine.
+        
+        Args:
+            graph (DSAWeightedGraph): Graph to route on
+            max_workers (int): Worker processes; None uses every CPU, 1 runs inline
+        """
+        self.graph = graph
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    
+    def solve(self, pairs):
+        """
+        Find shortest paths for a list of (start, goal) pairs.
+        
+        Args:
+            pairs: Iterable of (start_dept, end_dept) tuples
+            
+        Returns:
+            DSALinkedList: AStarPath per pair in input order; None for pairs
+            naming an unknown department
+        """
+        # Group input positions by start department
+        groups = DSAHashTable()
+        sources = DSALinkedList()
+        count = 0
+        for start, goal in pairs:
+            key = str(start)
+            if not groups.hasKey(key):
+                groups.put(key, DSALinkedList())
+                sources.insertLast(key)
+            groups.get(key).insertLast((count, str(goal)))
+            count += 1
+        
+        snapshot = self.graph.freeze()
+        group_goals = [[goal for _, goal in groups.get(source)] for source in sources]
+        source_list = [source for source in sources]
+        
+        if self.max_workers <= 1 or len(source_list) <= 1:
+            answers = [_solve_with_snapshot(snapshot, source, goals)
+                       for source, goals in zip(source_list, group_goals)]
+        else:
+            workers = min(self.max_workers, len(source_list))
+            # Several groups per task amortises inter-process overhead
+            chunk_size = max(1, len(source_list) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(snapshot,)) as executor:
+                answers = list(executor.map(_solve_group, source_list, group_goals,
+                                            chunksize=chunk_size))
+        
+        # Scatter group answers back to input order
+        ordered = [None] * count
+        for source, group_answers in zip(source_list, answers):
+            index = 0
+            for position, _ in groups.get(source):
+                ordered[position] = self._to_path(group_answers[index])
+                index += 1
+        
+        results = DSALinkedList()
+        for result in ordered:
+            results.insertLast(result)
+        return results
+    
+    def _to_path(self, answer):
+        if answer is None:
+            return None
+        labels, cost = answer
+        path = DSALinkedList()
+        for label in labels:
+            path.insertLast(label)
+        return AStarPath(path, cost)
@@ -0,0 +1,86 @@
+"""
+Streaming reader for hospital JSON configuration files.
+Yields one department record at a time from the top-level JSON array, so a
+multi-megabyte site config never has to be held as a single parsed document.
+"""
+
+import json
+
+
+def iter_departments(config_file, chunk_size=65536):
+    """
+    Yield the department objects of a JSON array config one by one.
+
+    Args:
+        config_file (str): Path to the JSON configuration file
+        chunk_size (int): Characters read from the file at a time
+
+    Raises:
+        json.JSONDecodeError: If the file is not a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(config_file, 'r') as file:
+        buffer = ""
+        position = 0
+        at_eof = False
+        started = False
+        after_record = False  # a record was just read: expect "," or "]"
+        after_comma = False  # a "," was just read: expect another record
+
+        while True:
+            # Skip whitespace, refilling the buffer as needed
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer) or at_eof:
+                    break
+                chunk = file.read(chunk_size)
+                at_eof = chunk == ""
+                buffer = buffer[position:] + chunk
+                position = 0
+
+            if position >= len(buffer):
+                raise json.JSONDecodeError("Unterminated array", buffer, position)
+            if not started:
+                if buffer[position] != "[":
+                    raise json.JSONDecodeError("Expected a JSON array of departments", buffer, position)
+                started = True
+                position += 1
+                continue
+
+            # Exactly one comma between records, none before the first or after the last
+            if after_record:
+                if buffer[position] == "]":
+                    return
+                if buffer[position] != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']' after a department", buffer, position)
+                after_record = False
+                after_comma = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                if after_comma:
+                    raise json.JSONDecodeError("Trailing comma before ']'", buffer, position)
+                return
+            if buffer[position] == ",":
+                raise json.JSONDecodeError("Unexpected ','", buffer, position)
+
+            # Decode the next record, reading more text while it is incomplete
+            while True:
+                try:
+                    record, end = decoder.raw_decode(buffer, position)
+                    break
+                except json.JSONDecodeError:
+                    if at_eof:
+                        raise
+                    chunk = file.read(chunk_size)
+                    at_eof = chunk == ""
+                    buffer = buffer[position:] + chunk
+                    position = 0
+
+            yield record
+            after_record = True
+            after_comma = False
+            # Drop consumed text so memory tracks one record, not the whole file
+            buffer = buffer[end:]
+            position = 0
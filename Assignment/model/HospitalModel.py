@@ -1,53 +1,102 @@
 import json
+import os
+import zipfile
+import numpy as np
 from DataStructures.DSAWeightedGraph import DSAWeightedGraph, AStarPath
+from DataStructures.DSAAllPairsTable import DSAAllPairsTable
+from DataStructures.DSALRUCache import DSALRUCache
+from DataStructures.DSAContractionHierarchy import DSAContractionHierarchy
+from model.BatchRouteEngine import BatchRouteEngine
+from model.HospitalConfigReader import iter_departments
 from DataStructures.DSALinkedList import DSALinkedList
 
+# Errors raised by a missing, truncated or stale cache file (graph snapshot,
+# route table, contraction hierarchy); any of them means "rebuild the cache"
+CACHE_LOAD_ERRORS = (OSError, EOFError, KeyError, ValueError, IndexError, zipfile.BadZipFile)
+
 class HospitalModel:
     """
     Model class for Hospital Management System.
     Manages the hospital graph structure and data operations.
     """
     
-    def __init__(self, config_file="hospital_config.json"):
+    def __init__(self, config_file="hospital_config.json", heuristic="euclidean", cost_per_distance=None,
+                 spt_cache_size=16, use_snapshot=True):
         """
         Initialize the hospital model with configuration file.
         
         Args:
             config_file (str): Path to JSON configuration file
+            heuristic (str): A* heuristic: "none", "euclidean", "manhattan" or "alt"
+            cost_per_distance (float): Minimum walking minutes per coordinate unit;
+                None calibrates it from the corridors so A* stays admissible
+            spt_cache_size (int): Number of per-source shortest-path trees to keep
+                in the LRU cache; 0 disables the cache
+            use_snapshot (bool): Start from the binary graph snapshot when it is
+                newer than the JSON config, and refresh it after parsing the JSON
         """
         self.config_file = config_file
-        self.graph = DSAWeightedGraph()
+        self.use_snapshot = use_snapshot
+        self.heuristic = heuristic
+        self.cost_per_distance = cost_per_distance
+        self.graph = self._new_graph()
         self.load_hospital_data(config_file)
+        self.spt_cache = (DSALRUCache(spt_cache_size, on_evict=self._release_tree)
+                          if spt_cache_size > 0 else None)
+    
+    def _new_graph(self):
+        """Create an empty graph with the configured A* heuristic."""
+        graph = DSAWeightedGraph()
+        graph.setHeuristic(self.heuristic, self.cost_per_distance)
+        return graph
     
     def load_hospital_data(self, config_file):
         """
-        Load hospital departments and corridors from JSON configuration file.
+        Load hospital departments and corridors from JSON configuration file,
+        or from the binary snapshot next to it when that is up to date.
         """
+        snapshot_file = self.get_snapshot_path()
+        if self.use_snapshot and self._snapshot_is_fresh(snapshot_file):
+            try:
+                self.graph.loadSnapshot(snapshot_file)
+                print(f"Loaded {self.graph.getVertexCount()} departments with "
+                      f"{self.graph.getEdgeCount()} corridors from snapshot '{snapshot_file}'")
+                return
+            except CACHE_LOAD_ERRORS as e:
+                print(f"Ignoring unreadable snapshot '{snapshot_file}': {e}")
+                # A snapshot that failed part-way may have left vertices behind
+                self.graph = self._new_graph()
+        
         try:
-            with open(self.config_file, 'r') as file:
-                data = json.load(file)
-            
-            # Add all departments as vertices
-            for dept in data:
+            # Stream the departments once, collecting vertices and corridors;
+            # each corridor is listed from both ends and deduplicated by the graph
+            vertices = DSALinkedList()
+            corridors = DSALinkedList()
+            profiles = DSALinkedList()
+            for dept in iter_departments(self.config_file):
                 department_name = dept["department"]
                 
-                # Add vertex
-                self.graph.addVertex(department_name)
+                # Keep floor-plan coordinates; the type tag defaults to the department name
+                vertices.insertLast((department_name, {
+                    "x": dept.get("x"),
+                    "y": dept.get("y"),
+                    "type": dept.get("type", department_name)
+                }))
+                for corridor in dept.get("corridors", []):
+                    corridors.insertLast((department_name, corridor["department"], corridor["weight"]))
+                    # Optional congestion profile: [[time of day, travel minutes], ...]
+                    if corridor.get("profile"):
+                        profiles.insertLast((department_name, corridor["department"], corridor["profile"]))
             
-            # Add corridors as weighted edges
-            for dept in data:
-                department_name = dept["department"]
-                corridors = dept.get("corridors", [])
-                
-                for corridor in corridors:
-                    target_dept = corridor["department"]
-                    weight = corridor["weight"]
-                    
-                    # Add weighted edge (undirected)
-                    self.graph.addWeightedEdge(department_name, target_dept, weight)
+            self.graph.loadEdgeList(vertices, corridors)
+            for department_name, other_name, breakpoints in profiles:
+                self.set_corridor_profile(department_name, other_name, breakpoints)
             
             print(f"Loaded {self.graph.getVertexCount()} departments with {self.graph.getEdgeCount()} corridors")
             
+            if self.use_snapshot:
+                self.save_snapshot(snapshot_file)
+            
         except FileNotFoundError:
             print(f"Error: Configuration file '{self.config_file}' not found")
             raise
@@ -58,6 +107,57 @@ class HospitalModel:
             print(f"Error loading hospital data: {e}")
             raise
     
+    @staticmethod
+    def parse_clock_time(value):
+        """
+        Convert a time of day to minutes since midnight.
+        
+        Args:
+            value: "HH:MM" string or a number of minutes
+            
+        Returns:
+            float: Minutes since midnight
+            
+        Raises:
+            ValueError: If the value is not a valid time
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        try:
+            hours, minutes = str(value).strip().split(":")
+            hours, minutes = int(hours), int(minutes)
+        except ValueError:
+            raise ValueError(f"Invalid time '{value}', expected HH:MM")
+        if not (0 <= hours < 24 and 0 <= minutes < 60):
+            raise ValueError(f"Invalid time '{value}', expected HH:MM")
+        return float(hours * 60 + minutes)
+    
+    def set_corridor_profile(self, dept1, dept2, breakpoints):
+        """
+        Attach a time-of-day travel profile to a corridor.
+        
+        Args:
+            dept1 (str): First department name
+            dept2 (str): Second department name
+            breakpoints: Sequence of (time of day, travel minutes) pairs; times
+                are "HH:MM" strings or minutes since midnight, in increasing order
+                
+        Raises:
+            ValueError: If the corridor does not exist or the profile is invalid
+        """
+        times = np.empty(len(breakpoints))
+        minutes = np.empty(len(breakpoints))
+        index = 0
+        for time_of_day, travel_minutes in breakpoints:
+            times[index] = self.parse_clock_time(time_of_day)
+            minutes[index] = travel_minutes
+            index += 1
+        self.graph.setEdgeProfile(dept1, dept2, times, minutes)
+    
+    def has_time_profiles(self):
+        """True if any corridor has a time-of-day travel profile."""
+        return self.graph.hasTimeProfiles()
+    
     def get_departments(self):
         """
         Get list of all departments.
@@ -76,51 +176,342 @@ class HospitalModel:
         """
         return self.graph
     
-    def find_shortest_path(self, start_dept, end_dept):
+    def get_snapshot_path(self):
+        """
+        Get the path of the binary graph snapshot, stored next to the config.
+        
+        Returns:
+            str: e.g. config/hospital_config_graph.npz
+        """
+        return os.path.splitext(self.config_file)[0] + "_graph.npz"
+    
+    def _snapshot_is_fresh(self, snapshot_file):
+        """True if the snapshot exists and is at least as new as the JSON config."""
+        try:
+            return os.path.getmtime(snapshot_file) >= os.path.getmtime(self.config_file)
+        except OSError:
+            return False
+    
+    def save_snapshot(self, snapshot_file=None):
+        """
+        Save the current graph as a binary snapshot for fast startup.
+        
+        Args:
+            snapshot_file (str): Optional .npz path, defaults to get_snapshot_path()
+        """
+        snapshot_file = snapshot_file if snapshot_file is not None else self.get_snapshot_path()
+        try:
+            self.graph.saveSnapshot(snapshot_file)
+        except OSError as e:
+            print(f"Could not save graph snapshot: {e}")
+    
+    def get_route_table_path(self):
+        """
+        Get the path of the persisted all-pairs route table, stored next to the config.
+        
+        Returns:
+            str: e.g. config/hospital_config_routes.npz
+        """
+        return os.path.splitext(self.config_file)[0] + "_routes.npz"
+    
+    def enable_route_table(self, table_file=None):
+        """
+        Enable O(path length) route lookups from a precomputed all-pairs table.
+        Loads the persisted table if it matches the current graph, otherwise
+        computes it and saves it for the next start.
+        
+        Args:
+            table_file (str): Optional .npz path, defaults to get_route_table_path()
+            
+        Returns:
+            DSAAllPairsTable: The active route table
+        """
+        table_file = table_file if table_file is not None else self.get_route_table_path()
+        if os.path.exists(table_file):
+            try:
+                self.graph.setAllPairs(DSAAllPairsTable.load(table_file))
+                print(f"Loaded route table from '{table_file}'")
+                return self.graph.getAllPairs()
+            except CACHE_LOAD_ERRORS as e:
+                print(f"Ignoring stale route table '{table_file}': {e}")
+        
+        table = self.graph.computeAllPairs()
+        try:
+            table.save(table_file)
+            print(f"Saved route table to '{table_file}'")
+        except OSError as e:
+            print(f"Could not save route table: {e}")
+        return table
+    
+    def get_hierarchy_path(self):
+        """
+        Get the path of the persisted contraction hierarchy, stored next to the config.
+        
+        Returns:
+            str: e.g. config/hospital_config_ch.npz
+        """
+        return os.path.splitext(self.config_file)[0] + "_ch.npz"
+    
+    def enable_contraction_hierarchy(self, hierarchy_file=None):
+        """
+        Prepare the contraction hierarchy used by the "ch" routing mode.
+        Loads the serialized hierarchy if it matches the current graph,
+        otherwise builds it and saves it for the next start.
+        
+        Args:
+            hierarchy_file (str): Optional .npz path, defaults to get_hierarchy_path()
+            
+        Returns:
+            DSAContractionHierarchy: The active hierarchy
+        """
+        hierarchy_file = hierarchy_file if hierarchy_file is not None else self.get_hierarchy_path()
+        if os.path.exists(hierarchy_file):
+            try:
+                self.graph.setContractionHierarchy(DSAContractionHierarchy.load(hierarchy_file))
+                print(f"Loaded contraction hierarchy from '{hierarchy_file}'")
+                return self.graph.getContractionHierarchy()
+            except CACHE_LOAD_ERRORS as e:
+                print(f"Ignoring stale contraction hierarchy '{hierarchy_file}': {e}")
+        
+        hierarchy = self.graph.buildContractionHierarchy()
+        try:
+            hierarchy.save(hierarchy_file)
+            print(f"Saved contraction hierarchy to '{hierarchy_file}'")
+        except OSError as e:
+            print(f"Could not save contraction hierarchy: {e}")
+        return hierarchy
+    
+    def get_shortest_path_tree(self, source_dept):
+        """
+        Get the shortest-path tree rooted at a department from the LRU cache,
+        computing and caching it on a miss. Cached trees are registered with the
+        graph, which repairs them in place when corridors change; only trees
+        invalidated by added or removed departments are recomputed.
+        
+        Args:
+            source_dept (str): Source department name
+            
+        Returns:
+            DSAShortestPathTree: Distance and parent arrays for the source
+        """
+        tree = self.spt_cache.get(str(source_dept))
+        if tree is None or not tree.isValid() or tree.version != self.graph.getVersion():
+            if tree is not None:
+                self._release_tree(str(source_dept), tree)
+            tree = self.graph.shortestPathTree(source_dept, maintain=True)
+            self.spt_cache.put(str(source_dept), tree)
+        return tree
+    
+    def _release_tree(self, source_dept, tree):
+        """Stop the graph maintaining a tree that left the cache."""
+        self.graph.unregisterShortestPathTree(tree)
+    
+    def get_spt_cache_stats(self):
         """
-        Find shortest path between two departments using A* algorithm.
+        Get shortest-path-tree cache counters.
+        
+        Returns:
+            dict: hits, misses, evictions, size and capacity (None if disabled)
+        """
+        if self.spt_cache is None:
+            return None
+        return {
+            "hits": self.spt_cache.getHits(),
+            "misses": self.spt_cache.getMisses(),
+            "evictions": self.spt_cache.getEvictions(),
+            "size": self.spt_cache.getCount(),
+            "capacity": self.spt_cache.getCapacity()
+        }
+    
+    ROUTING_MODES = ("auto", "astar", "bidirectional", "ch")
+    
+    def find_shortest_path(self, start_dept, end_dept, mode="auto"):
+        """
+        Find shortest path between two departments.
+        In "auto" mode uses the precomputed route table when it is enabled and
+        still valid, then the cached shortest-path tree of the start department,
+        and otherwise runs the A* algorithm.
         
         Args:
             start_dept (str): Starting department name
             end_dept (str): Ending department name
+            mode (str): "auto", "astar", "bidirectional" or "ch" (contraction hierarchy)
             
         Returns:
             AStarPath: Object containing path and cost, or None if no path found
         """
         try:
+            if mode not in self.ROUTING_MODES:
+                raise ValueError(f"Unknown routing mode '{mode}'")
+            if mode == "bidirectional":
+                return self.graph.bidirectionalSearch(start_dept, end_dept)
+            if mode == "ch":
+                return self.graph.contractionHierarchyQuery(start_dept, end_dept)
+            if mode == "astar":
+                return self.graph.aStarPathfinding(start_dept, end_dept)
+            
+            table = self.graph.getAllPairs()
+            if table is not None:
+                return table.getPath(start_dept, end_dept)
+            if self.spt_cache is not None:
+                return self.get_shortest_path_tree(start_dept).getPath(end_dept)
             return self.graph.aStarPathfinding(start_dept, end_dept)
         except ValueError as e:
             print(f"Error finding path: {e}")
             return None
     
-    def get_reachable_departments(self, start_dept):
+    def find_shortest_path_at(self, start_dept, end_dept, departure_time):
+        """
+        Find the fastest route when leaving at a given time of day, using the
+        corridors' travel profiles (time-dependent A*).
+        
+        Args:
+            start_dept (str): Starting department name
+            end_dept (str): Ending department name
+            departure_time: "HH:MM" string or minutes since midnight
+            
+        Returns:
+            AStarPath: Object containing path and travel minutes, or None on error
+        """
+        try:
+            departure = self.parse_clock_time(departure_time)
+            return self.graph.timeDependentPathfinding(start_dept, end_dept, departure)
+        except ValueError as e:
+            print(f"Error finding path: {e}")
+            return None
+    
+    def find_shortest_paths_batch(self, pairs, max_workers=None):
+        """
+        Find shortest paths for many (start, end) department pairs at once.
+        Pairs are grouped by start department to share one shortest-path tree
+        per group, and groups are spread across a process pool.
+        
+        Args:
+            pairs: Iterable of (start_dept, end_dept) tuples
+            max_workers (int): Worker processes; None uses every CPU, 1 runs inline
+            
+        Returns:
+            DSALinkedList: AStarPath per pair in input order (None for unknown departments)
+        """
+        return BatchRouteEngine(self.graph, max_workers).solve(pairs)
+    
+    def find_nearest_department(self, start_dept, department_type, k=1):
+        """
+        Find the nearest departments of a given type (e.g. Radiology, Pharmacy)
+        with a single multi-target Dijkstra search.
+        
+        Args:
+            start_dept (str): Starting department name
+            department_type (str): Department type tag to look for
+            k (int): Number of nearest departments to return
+            
+        Returns:
+            DSALinkedList: AStarPath objects ordered by walking time, or None on error
+        """
+        try:
+            return self.graph.nearestOfType(start_dept, department_type, k)
+        except ValueError as e:
+            print(f"Error finding nearest department: {e}")
+            return None
+    
+    def find_alternative_routes(self, start_dept, end_dept, k=3):
+        """
+        Find the k cheapest loopless routes between two departments, so a
+        fallback is ready when a corridor on the primary route is closed.
+        Reuses the cached shortest-path tree of the destination when the
+        tree cache is enabled.
+        
+        Args:
+            start_dept (str): Starting department name
+            end_dept (str): Ending department name
+            k (int): Number of routes to return
+        
+        Returns:
+            DSALinkedList: AStarPath objects ordered by walking time, or None on error
+        """
+        try:
+            tree = None
+            if self.spt_cache is not None and self.graph.hasVertex(end_dept):
+                tree = self.get_shortest_path_tree(end_dept)
+            return self.graph.kShortestPaths(start_dept, end_dept, k, tree)
+        except ValueError as e:
+            print(f"Error finding alternative routes: {e}")
+            return None
+    
+    def are_connected(self, dept1, dept2):
+        """
+        Check whether any route joins two departments, without a search.
+        
+        Args:
+            dept1 (str): First department name
+            dept2 (str): Second department name
+            
+        Returns:
+            bool: True if a route exists, False otherwise or if a department is unknown
+        """
+        try:
+            return self.graph.isConnected(dept1, dept2)
+        except ValueError as e:
+            print(f"Error checking connectivity: {e}")
+            return False
+    
+    def get_reachable_departments(self, start_dept, max_depth=None, max_nodes=None):
         """
         Get all departments reachable from a starting department using BFS.
         
         Args:
             start_dept (str): Starting department name
+            max_depth (int): Optional limit on corridors away from the start
+            max_nodes (int): Optional limit on departments returned
             
         Returns:
             DSALinkedList: List of levels containing reachable departments
         """
         try:
-            return self.graph.breadthFirstSearch(start_dept)
+            return self.graph.breadthFirstSearch(start_dept, max_depth, max_nodes)
+        except ValueError as e:
+            print(f"Error getting reachable departments: {e}")
+            return None
+    
+    def iter_reachable_departments(self, start_dept, max_depth=None, max_nodes=None):
+        """
+        Lazily yield reachable departments one BFS level at a time.
+        
+        Args:
+            start_dept (str): Starting department name
+            max_depth (int): Optional limit on corridors away from the start
+            max_nodes (int): Optional limit on departments yielded
+            
+        Returns:
+            generator: Levels (DSALinkedList of nodes), or None if the department is unknown
+        """
+        try:
+            return self.graph.iterBreadthFirstLevels(start_dept, max_depth, max_nodes)
         except ValueError as e:
             print(f"Error getting reachable departments: {e}")
             return None
     
-    def detect_cycles(self, start_dept):
+    CYCLE_MODES = ("dfs", "shortest")
+    
+    def detect_cycles(self, start_dept, mode="dfs"):
         """
-        Detect cycles in the hospital graph using DFS.
+        Detect cycles in the hospital graph through a department.
         
         Args:
             start_dept (str): Starting department name
+            mode (str): "dfs" returns the first cycle found by depth-first search,
+                        "shortest" the cycle with the lowest total corridor time
             
         Returns:
             DSALinkedList: List containing one cycle (if found), or empty list if no cycles
         """
         try:
-            cycle = self.graph.depthFirstSearch(start_dept)
+            if mode not in self.CYCLE_MODES:
+                raise ValueError(f"Unknown cycle mode '{mode}'")
+            if mode == "shortest":
+                cycle = self.graph.shortestCycle(start_dept).getPath()
+            else:
+                cycle = self.graph.depthFirstSearch(start_dept)
             
             # Wrap the single cycle in a list for consistent handling
             cycles_list = DSALinkedList()
@@ -145,7 +536,9 @@ class HospitalModel:
         try:
             node = self.graph.getVertex(dept_name)
             return {
-                "name": node.label
+                "name": node.label,
+                "type": node.getType(),
+                "coordinates": node.getCoordinates()
             }
         except ValueError:
             return None
@@ -0,0 +1,15 @@
+import random
+
+from DataStructures.DSAWeightedGraph import DSAWeightedGraph
+
+
+def build_random_graph(vertex_count, edge_count, seed, max_weight=20, prefix="V"):
+    """Random graph (not necessarily connected) with labels prefix0, prefix1, ... and weights 1..max_weight."""
+    rng = random.Random(seed)
+    graph = DSAWeightedGraph()
+    for i in range(vertex_count):
+        graph.addVertex(f"{prefix}{i}")
+    while graph.getEdgeCount() < edge_count:
+        a, b = rng.sample(range(vertex_count), 2)
+        graph.addWeightedEdge(f"{prefix}{a}", f"{prefix}{b}", rng.randint(1, max_weight))
+    return graph
@@ -0,0 +1,53 @@
+import sys
+import os
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from random_graphs import build_random_graph  # noqa: E402
+from DataStructures.DSAAllPairsTable import DSAAllPairsTable  # noqa: E402
+
+
+def test_table_matches_astar_for_every_pair():
+    graph = build_random_graph(25, 50, 11)
+    table = graph.computeAllPairs()
+    for a in range(0, 25, 3):
+        for b in range(25):
+            expected = graph.aStarPathfinding(f"V{a}", f"V{b}", heuristic="none")
+            result = table.getPath(f"V{a}", f"V{b}")
+            assert result.getCost() == expected.getCost()
+            labels = [label for label in result.getPath()]
+            if expected.getCost() != float("inf"):
+                assert labels[0] == f"V{a}" and labels[-1] == f"V{b}"
+                walked = sum(graph.getEdgeWeight(labels[i], labels[i + 1]) for i in range(len(labels) - 1))
+                assert walked == result.getCost()
+
+
+def test_table_invalidated_by_mutations():
+    graph = build_random_graph(25, 50, 11)
+    graph.computeAllPairs()
+    graph.addWeightedEdge("V0", "Annex", 1)
+    assert graph.getAllPairs() is None
+    graph.computeAllPairs()
+    graph.removeEdge("V0", "Annex")
+    assert graph.getAllPairs() is None
+    graph.computeAllPairs()
+    graph.removeVertex("V3")
+    assert graph.getAllPairs() is None
+
+
+def test_save_and_load_round_trip(tmp_path):
+    graph = build_random_graph(25, 50, 11)
+    table = graph.computeAllPairs()
+    file_path = tmp_path / "routes.npz"
+    table.save(file_path)
+
+    loaded = DSAAllPairsTable.load(file_path)
+    assert loaded.matchesSnapshot(graph.freeze())
+    assert loaded.getPath("V1", "V7").getCost() == table.getPath("V1", "V7").getCost()
+
+    graph.addWeightedEdge("V1", "Annex", 1)
+    assert not loaded.matchesSnapshot(graph.freeze())
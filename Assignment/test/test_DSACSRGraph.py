@@ -0,0 +1,115 @@
+import sys
+import os
+import pytest
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from DataStructures.DSAWeightedGraph import DSAWeightedGraph  # noqa: E402
+
+
+def build_sample_graph():
+    graph = DSAWeightedGraph()
+    for label in ("A", "B", "C", "D", "E"):
+        graph.addVertex(label)
+    graph.addWeightedEdge("A", "B", 4)
+    graph.addWeightedEdge("A", "C", 2)
+    graph.addWeightedEdge("B", "C", 1)
+    graph.addWeightedEdge("B", "D", 5)
+    graph.addWeightedEdge("C", "D", 8)
+    return graph
+
+
+def test_snapshot_layout():
+    csr = build_sample_graph().toCSR()
+    assert csr.getVertexCount() == 5
+    assert csr.getEdgeCount() == 5
+    assert list(csr.offsets) == [0, 2, 5, 8, 10, 10]
+    neighbors, weights = csr.neighborsOf(csr.getId("B"))
+    assert [csr.getLabel(n) for n in neighbors] == ["A", "C", "D"]
+    assert list(weights) == [4, 1, 5]
+    with pytest.raises(ValueError):
+        csr.getId("Z")
+
+
+def test_freeze_is_cached_until_graph_changes():
+    graph = build_sample_graph()
+    first = graph.freeze()
+    assert graph.freeze() is first
+    graph.addWeightedEdge("D", "E", 3)
+    second = graph.freeze()
+    assert second is not first
+    assert second.getEdgeCount() == 6
+    # The old snapshot is untouched
+    assert first.getEdgeCount() == 5
+
+
+def test_bfs_levels_match_graph():
+    graph = build_sample_graph()
+    expected = [[node.label for node in level] for level in graph.breadthFirstSearch("A")]
+    actual = [[label for label in level] for level in graph.freeze().breadthFirstSearch("A")]
+    assert actual == expected == [["A"], ["B", "C"], ["D"]]
+
+
+def test_dfs_cycle_contains_start():
+    cycle = [label for label in build_sample_graph().freeze().depthFirstSearch("A")]
+    assert cycle[0] == "A"
+    assert len(cycle) >= 3
+    assert build_sample_graph().freeze().depthFirstSearch("E").isEmpty()
+
+
+def test_astar_on_snapshot():
+    csr = build_sample_graph().freeze()
+    result = csr.aStarPathfinding("A", "D")
+    assert [label for label in result.getPath()] == ["A", "C", "B", "D"]
+    assert result.getCost() == 8
+    assert isinstance(result.getCost(), int)
+    assert csr.aStarPathfinding("A", "E").getCost() == float("inf")
+
+
+def brute_force_shortest_cycle(graph, start, weighted=True):
+    """Cheapest simple cycle through start by exhaustive search (small graphs only)."""
+    best = float("inf")
+    stack = [(start, [start], 0)]
+    while stack:
+        current, path, cost = stack.pop()
+        for edge in graph.getAdjacent(current):
+            neighbor = edge.getDestination().label
+            step = edge.getWeight() if weighted else 1
+            if neighbor == start and len(path) >= 3:
+                best = min(best, cost + step)
+            elif neighbor not in path:
+                stack.append((neighbor, path + [neighbor], cost + step))
+    return best
+
+
+def test_shortest_cycle_matches_brute_force():
+    import random
+    rng = random.Random(11)
+    graph = DSAWeightedGraph()
+    for i in range(12):
+        graph.addVertex(str(i))
+    for _ in range(18):
+        a, b = rng.sample(range(12), 2)
+        graph.addWeightedEdge(str(a), str(b), rng.randint(1, 20))
+    for node in graph._vertices:
+        for weighted in (True, False):
+            result = graph.shortestCycle(node.label, weighted)
+            assert result.getCost() == brute_force_shortest_cycle(graph, node.label, weighted)
+            cycle = [label for label in result.getPath()]
+            if cycle:
+                assert cycle[0] == node.label and len(set(cycle)) == len(cycle) >= 3
+                total = 0
+                for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+                    total += graph.getEdgeWeight(a, b) if weighted else 1
+                assert total == result.getCost()
+
+
+def test_shortest_cycle_sample_graph():
+    graph = build_sample_graph()
+    result = graph.shortestCycle("A")
+    assert result.getCost() == 7  # A-B-C
+    assert graph.shortestCycle("E").getCost() == float("inf")
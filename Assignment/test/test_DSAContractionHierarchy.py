@@ -0,0 +1,56 @@
+import sys
+import os
+import random
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from random_graphs import build_random_graph  # noqa: E402
+from DataStructures.DSAContractionHierarchy import DSAContractionHierarchy  # noqa: E402
+
+
+def assert_valid_route(graph, result, start, goal, expected_cost):
+    labels = [label for label in result.getPath()]
+    assert result.getCost() == expected_cost
+    if expected_cost == float("inf"):
+        assert labels == []
+        return
+    assert labels[0] == start and labels[-1] == goal
+    walked = sum(graph.getEdgeWeight(labels[i], labels[i + 1]) for i in range(len(labels) - 1))
+    assert walked == expected_cost
+
+
+def test_queries_match_dijkstra_and_unpack_to_corridors():
+    rng = random.Random(9)
+    for seed in range(3):
+        graph = build_random_graph(40, 80, seed, max_weight=25, prefix="R")
+        hierarchy = graph.buildContractionHierarchy()
+        for _ in range(40):
+            a, b = rng.sample(range(40), 2)
+            start, goal = f"R{a}", f"R{b}"
+            expected = graph.aStarPathfinding(start, goal, heuristic="none").getCost()
+            assert_valid_route(graph, hierarchy.query(start, goal), start, goal, expected)
+
+
+def test_hierarchy_dropped_on_mutation_and_rebuilt_on_query():
+    graph = build_random_graph(40, 80, 5, max_weight=25, prefix="R")
+    graph.buildContractionHierarchy()
+    graph.addWeightedEdge("R0", "R39", 1)
+    assert graph.getContractionHierarchy() is None
+    assert graph.contractionHierarchyQuery("R0", "R39").getCost() == 1
+    assert graph.getContractionHierarchy() is not None
+
+
+def test_save_and_load(tmp_path):
+    graph = build_random_graph(40, 80, 5, max_weight=25, prefix="R")
+    hierarchy = graph.buildContractionHierarchy()
+    file_path = tmp_path / "hierarchy.npz"
+    hierarchy.save(file_path)
+    loaded = DSAContractionHierarchy.load(file_path)
+    assert loaded.matchesSnapshot(graph.freeze())
+    assert loaded.getShortcutCount() == hierarchy.getShortcutCount()
+    for goal in ("R5", "R17", "R33"):
+        assert loaded.query("R1", goal).getCost() == hierarchy.query("R1", goal).getCost()
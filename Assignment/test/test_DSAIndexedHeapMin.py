@@ -0,0 +1,63 @@
+import sys
+import os
+import random
+import pytest
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from DataStructures.DSAIndexedHeapMin import DSAIndexedHeapMin  # noqa: E402
+
+
+def test_remove_from_empty_raises():
+    heap = DSAIndexedHeapMin()
+    with pytest.raises(IndexError):
+        heap.remove()
+
+
+def test_removes_in_priority_order():
+    heap = DSAIndexedHeapMin(capacity=2)
+    for priority in (5, 1, 4, 2, 3):
+        heap.add(priority, f"v{priority}")
+    assert [heap.remove() for _ in range(5)] == ["v1", "v2", "v3", "v4", "v5"]
+    assert heap.isEmpty()
+
+
+def test_decrease_key_moves_entry_forward():
+    heap = DSAIndexedHeapMin()
+    heap.add(10, "a")
+    handle = heap.add(20, "b")
+    heap.add(15, "c")
+    heap.decrease_key(handle, 5)
+    assert handle.get_priority() == 5
+    assert heap.remove() == "b"
+    assert not handle.is_queued()
+    with pytest.raises(ValueError):
+        heap.decrease_key(handle, 1)
+
+
+def test_decrease_key_rejects_increase():
+    heap = DSAIndexedHeapMin()
+    handle = heap.add(3, "a")
+    with pytest.raises(ValueError):
+        heap.decrease_key(handle, 4)
+
+
+def test_positions_stay_consistent_under_random_updates():
+    rng = random.Random(3)
+    heap = DSAIndexedHeapMin()
+    handles = [heap.add(rng.randint(0, 1000), i) for i in range(200)]
+    for _ in range(300):
+        handle = handles[rng.randrange(len(handles))]
+        if heap.contains(handle):
+            heap.decrease_key(handle, handle.get_priority() - rng.randint(0, 50))
+    for position in range(heap.getCount()):
+        assert heap.heap[position]._position == position
+    priorities = []
+    while not heap.isEmpty():
+        priorities.append(heap.heap[0].get_priority())
+        heap.remove()
+    assert priorities == sorted(priorities)
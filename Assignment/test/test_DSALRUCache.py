@@ -0,0 +1,68 @@
+import sys
+import os
+import pytest
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from DataStructures.DSALRUCache import DSALRUCache  # noqa: E402
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        DSALRUCache(0)
+
+
+def test_hits_and_misses():
+    cache = DSALRUCache(2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.getHits() == 1
+    assert cache.getMisses() == 1
+
+
+def test_evicts_least_recently_used():
+    cache = DSALRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # b is now the least recently used
+    cache.put("c", 3)
+    assert not cache.hasKey("b")
+    assert list(cache.keys()) == ["c", "a"]
+    assert cache.getEvictions() == 1
+    assert cache.getCount() == 2
+
+
+def test_put_existing_key_replaces_without_eviction():
+    cache = DSALRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    assert cache.getEvictions() == 0
+    assert list(cache.keys()) == ["a", "b"]
+    assert cache.get("a") == 10
+
+
+def test_clear_keeps_counters():
+    cache = DSALRUCache(2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.getCount() == 0
+    assert cache.get("a") is None
+    assert cache.getHits() == 1
+    cache.put("b", 2)
+    assert list(cache.keys()) == ["b"]
+
+
+def test_on_evict_callback():
+    evicted = []
+    cache = DSALRUCache(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put("a", 1)
+    cache.put("a", 2)
+    cache.put("b", 3)
+    assert evicted == [("a", 2)]
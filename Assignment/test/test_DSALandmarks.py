@@ -0,0 +1,50 @@
+import sys
+import os
+import pytest
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from random_graphs import build_random_graph  # noqa: E402
+
+
+def test_landmarks_are_distinct_and_cover_components():
+    graph = build_random_graph(30, 60, 2, max_weight=30, prefix="N")
+    graph.addWeightedEdge("Annex A", "Annex B", 2)
+    landmarks = graph.buildLandmarks(3)
+    labels = list(landmarks.getLandmarkLabels())
+    assert len(set(labels)) == 3
+    # The disconnected annex is the farthest region, so it receives a landmark
+    assert "Annex A" in labels or "Annex B" in labels
+
+
+def test_estimate_never_overestimates():
+    graph = build_random_graph(30, 60, 2, max_weight=30, prefix="N")
+    landmarks = graph.buildLandmarks(4)
+    csr = graph.freeze()
+    for source in range(0, 30, 4):
+        dist, _ = csr.dijkstra(source)
+        for target in range(30):
+            assert landmarks.estimate(source, target) <= dist[target] + 1e-9
+
+
+def test_alt_astar_is_exact():
+    graph = build_random_graph(30, 60, 2, max_weight=30, prefix="N")
+    graph.setHeuristic("alt")
+    for goal in ("N3", "N12", "N29"):
+        expected = graph.aStarPathfinding("N0", goal, heuristic="none").getCost()
+        assert graph.aStarPathfinding("N0", goal).getCost() == expected
+
+
+def test_landmarks_rebuilt_lazily_after_mutation():
+    graph = build_random_graph(30, 60, 2, max_weight=30, prefix="N")
+    graph.buildLandmarks(2)
+    graph.addWeightedEdge("N0", "N29", 1)
+    assert graph.getLandmarks() is None
+    assert graph.aStarPathfinding("N0", "N29", heuristic="alt").getCost() == 1
+    assert graph.getLandmarks().getCount() == 2
+    with pytest.raises(ValueError):
+        graph.buildLandmarks(0)
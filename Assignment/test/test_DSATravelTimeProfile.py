@@ -0,0 +1,45 @@
+import sys
+import os
+import pytest
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from DataStructures.DSATravelTimeProfile import DSATravelTimeProfile  # noqa: E402
+
+
+def test_interpolates_and_wraps_around_midnight():
+    profile = DSATravelTimeProfile([420, 450, 480], [4, 12, 4])
+    assert profile.getTravelTime(435) == pytest.approx(8)
+    assert profile.getTravelTime(450) == pytest.approx(12)
+    assert profile.getTravelTime(1000) == pytest.approx(4)
+    # The same time on the next day gives the same travel time
+    assert profile.getTravelTime(1440 + 465) == pytest.approx(8)
+    assert profile.getMinimum() == 4
+
+
+def test_table_starts_at_midnight():
+    profile = DSATravelTimeProfile([600, 1200], [10, 40])
+    times, minutes = profile.getBreakpoints()
+    assert times[0] == 0
+    # Midnight lies on the segment from 20:00 (40 min) back to 10:00 (10 min)
+    assert minutes[0] == pytest.approx(40 - 30 * 240 / 840)
+    assert profile.getTravelTime(0) == pytest.approx(minutes[0])
+    assert profile.getBreakpointCount() == 3
+    assert DSATravelTimeProfile([0], [5]).getTravelTime(777) == 5
+
+
+def test_rejects_invalid_profiles():
+    with pytest.raises(ValueError):
+        DSATravelTimeProfile([], [])
+    with pytest.raises(ValueError):
+        DSATravelTimeProfile([10, 5], [1, 2])
+    with pytest.raises(ValueError):
+        DSATravelTimeProfile([0, 1440], [1, 2])
+    with pytest.raises(ValueError):
+        DSATravelTimeProfile([0, 10], [5, -1])
+    # Dropping from 30 to 5 minutes within 10 minutes would let later departures arrive first
+    with pytest.raises(ValueError):
+        DSATravelTimeProfile([0, 10], [30, 5])
+    DSATravelTimeProfile([0, 25], [30, 5])
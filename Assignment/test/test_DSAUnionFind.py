@@ -0,0 +1,34 @@
+import sys
+import os
+import pytest
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from DataStructures.DSAUnionFind import DSAUnionFind  # noqa: E402
+
+
+def test_union_and_find():
+    sets = DSAUnionFind(capacity=2)
+    for key in ("a", "b", "c", "d", "e"):
+        sets.add(key)
+    assert sets.getComponentCount() == 5
+    assert sets.union("a", "b")
+    assert sets.union("c", "d")
+    assert not sets.union("b", "a")
+    assert sets.union("b", "d")
+    assert sets.connected("a", "c")
+    assert not sets.connected("a", "e")
+    assert sets.getCount() == 5
+    assert sets.getComponentCount() == 2
+
+
+def test_add_is_idempotent_and_unknown_keys_rejected():
+    sets = DSAUnionFind()
+    sets.add("a")
+    sets.add("a")
+    assert sets.getCount() == 1
+    assert sets.contains("a") and not sets.contains("b")
+    with pytest.raises(ValueError):
+        sets.find("b")
@@ -0,0 +1,602 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from DataStructures.DSAWeightedGraph import DSAWeightedGraph  # noqa: E402
+
+
+def build_sample_graph():
+    graph = DSAWeightedGraph()
+    for label in ("A", "B", "C", "D", "E"):
+        graph.addVertex(label)
+    graph.addWeightedEdge("A", "B", 4)
+    graph.addWeightedEdge("A", "C", 2)
+    graph.addWeightedEdge("B", "C", 1)
+    graph.addWeightedEdge("B", "D", 5)
+    graph.addWeightedEdge("C", "D", 8)
+    return graph
+
+
+def path_labels(path):
+    return [label for label in path]
+
+
+def test_label_index_tracks_vertices():
+    graph = build_sample_graph()
+    assert graph.hasVertex("A")
+    assert graph.getVertex("D").getLabel() == "D"
+    assert not graph.hasVertex("Z")
+    with pytest.raises(ValueError):
+        graph.getVertex("Z")
+
+
+def test_duplicate_vertex_rejected():
+    graph = build_sample_graph()
+    with pytest.raises(ValueError):
+        graph.addVertex("A")
+
+
+def test_remove_vertex_updates_index_and_edges():
+    graph = build_sample_graph()
+    graph.removeVertex("B")
+    assert not graph.hasVertex("B")
+    assert graph.getVertexCount() == 4
+    assert graph.getEdgeCount() == 2
+    assert not graph.isAdjacent("A", "B")
+    # The label can be reused after removal
+    graph.addVertex("B")
+    assert graph.hasVertex("B")
+    assert graph.getAdjacentCount("B") == 0
+
+
+def test_add_edge_creates_missing_vertices():
+    graph = DSAWeightedGraph()
+    graph.addWeightedEdge("X", "Y", 3)
+    assert graph.hasVertex("X") and graph.hasVertex("Y")
+    assert graph.getEdgeWeight("Y", "X") == 3
+    assert graph.getEdgeCount() == 1
+
+
+def test_astar_finds_cheapest_path():
+    graph = build_sample_graph()
+    result = graph.aStarPathfinding("A", "B")
+    assert path_labels(result.getPath()) == ["A", "C", "B"]
+    assert result.getCost() == 3
+
+
+def test_astar_unreachable_goal():
+    graph = build_sample_graph()
+    result = graph.aStarPathfinding("A", "E")
+    assert result.getPath().isEmpty()
+    assert result.getCost() == float("inf")
+
+
+def build_grid_graph(size=6, seed=7):
+    """Grid with coordinates and random corridor weights at least the grid spacing."""
+    import random
+    rng = random.Random(seed)
+    graph = DSAWeightedGraph()
+    for row in range(size):
+        for col in range(size):
+            graph.addVertex(f"{row},{col}", {"x": col * 10, "y": row * 10})
+    for row in range(size):
+        for col in range(size):
+            if col + 1 < size:
+                graph.addWeightedEdge(f"{row},{col}", f"{row},{col + 1}", rng.randint(10, 30))
+            if row + 1 < size:
+                graph.addWeightedEdge(f"{row},{col}", f"{row + 1},{col}", rng.randint(10, 30))
+    return graph
+
+
+def test_astar_with_direct_edge_shortcut_is_exact():
+    graph = build_sample_graph()
+    result = graph.aStarPathfinding("A", "D")
+    assert path_labels(result.getPath()) == ["A", "C", "B", "D"]
+    assert result.getCost() == 8
+
+
+def test_calibrated_heuristic_is_admissible():
+    graph = build_grid_graph()
+    scale = graph.calibrateHeuristic("euclidean")
+    assert 1.0 <= scale <= 3.0
+    # Grid corridors are axis-aligned, so both metrics give the same bound
+    assert graph.calibrateHeuristic("manhattan") == pytest.approx(scale)
+    for goal in ("5,5", "0,5", "3,2"):
+        expected = graph.aStarPathfinding("0,0", goal, heuristic="none").getCost()
+        for mode in ("euclidean", "manhattan"):
+            assert graph.aStarPathfinding("0,0", goal, heuristic=mode).getCost() == expected
+
+
+def test_search_reports_expanded_vertices():
+    graph = build_grid_graph()
+    graph.calibrateHeuristic("euclidean")
+    blind = graph.aStarPathfinding("0,0", "5,5", heuristic="none").getExpanded()
+    guided = graph.aStarPathfinding("0,0", "5,5", heuristic="euclidean").getExpanded()
+    assert 0 < guided <= blind <= graph.getVertexCount()
+    assert graph.bidirectionalSearch("0,0", "5,5").getExpanded() > 0
+
+
+def test_k_shortest_paths_in_cost_order():
+    graph = build_sample_graph()
+    routes = graph.kShortestPaths("A", "D", k=10)
+    # Every simple A-D route of the sample graph, cheapest first
+    assert [route.getCost() for route in routes] == [8, 9, 10, 13]
+    assert path_labels(routes.peekFirst().getPath()) == ["A", "C", "B", "D"]
+    labels = [tuple(path_labels(route.getPath())) for route in routes]
+    assert len(set(labels)) == len(labels)
+    for route in labels:
+        assert len(set(route)) == len(route)
+    # A maintained destination tree gives the same routes after a repair
+    tree = graph.shortestPathTree("D", maintain=True)
+    graph.updateEdgeWeight("B", "D", 9)
+    expected = [route.getCost() for route in graph.kShortestPaths("A", "D", k=3)]
+    assert [route.getCost() for route in graph.kShortestPaths("A", "D", k=3, tree=tree)] == expected
+    assert graph.kShortestPaths("A", "E").isEmpty()
+    with pytest.raises(ValueError):
+        graph.kShortestPaths("A", "D", k=0)
+
+
+def test_heuristic_disabled_without_coordinates():
+    graph = build_grid_graph()
+    graph.addWeightedEdge("5,5", "Roof", 1)
+    assert graph.calibrateHeuristic("euclidean") == 0
+
+
+def test_set_heuristic_validation():
+    graph = build_sample_graph()
+    with pytest.raises(ValueError):
+        graph.setHeuristic("chebyshev")
+    with pytest.raises(ValueError):
+        graph.setHeuristic("euclidean", -1)
+    graph.setHeuristic("manhattan", 0.5)
+    assert graph.getHeuristic() == "manhattan"
+
+
+def test_bidirectional_matches_astar():
+    graph = build_grid_graph(size=7)
+    graph.addVertex("Island")
+    for goal in ("6,6", "0,6", "3,4", "0,1"):
+        expected = graph.aStarPathfinding("0,0", goal, heuristic="none").getCost()
+        for mode in ("none", "euclidean"):
+            result = graph.bidirectionalSearch("0,0", goal, heuristic=mode)
+            labels = path_labels(result.getPath())
+            assert result.getCost() == expected
+            assert labels[0] == "0,0" and labels[-1] == goal
+            walked = sum(graph.getEdgeWeight(labels[i], labels[i + 1]) for i in range(len(labels) - 1))
+            assert walked == expected
+    assert graph.bidirectionalSearch("0,0", "Island").getCost() == float("inf")
+    assert path_labels(graph.bidirectionalSearch("0,0", "0,0").getPath()) == ["0,0"]
+
+
+def test_bidirectional_direct_edge_shortcut():
+    graph = build_sample_graph()
+    result = graph.bidirectionalSearch("A", "D")
+    assert path_labels(result.getPath()) == ["A", "C", "B", "D"]
+    assert result.getCost() == 8
+    with pytest.raises(ValueError):
+        graph.bidirectionalSearch("A", "Z")
+
+
+def build_typed_graph():
+    graph = DSAWeightedGraph()
+    tags = {"Lobby": "Reception", "RadA": "Radiology", "RadB": "Radiology",
+            "RadC": "Radiology", "Lab": "Laboratory", "Hall": None}
+    for label, tag in tags.items():
+        graph.addVertex(label, {"type": tag})
+    graph.addWeightedEdge("Lobby", "Hall", 2)
+    graph.addWeightedEdge("Hall", "RadA", 9)
+    graph.addWeightedEdge("Hall", "RadB", 3)
+    graph.addWeightedEdge("Lobby", "Lab", 1)
+    graph.addWeightedEdge("Lab", "RadA", 5)
+    graph.addVertex("RadFar", {"type": "Radiology"})
+    return graph
+
+
+def test_nearest_of_type_returns_closest_first():
+    graph = build_typed_graph()
+    results = [(path_labels(r.getPath()), r.getCost()) for r in graph.nearestOfType("Lobby", "Radiology", k=3)]
+    assert results == [(["Lobby", "Hall", "RadB"], 5), (["Lobby", "Lab", "RadA"], 6)]
+    single = graph.nearestOfType("Lobby", "Radiology")
+    assert single.getCount() == 1
+    assert graph.nearestOfType("Lobby", "Pharmacy").isEmpty()
+
+
+def test_nearest_of_type_includes_start_and_validates():
+    graph = build_typed_graph()
+    first = graph.nearestOfType("RadB", "Radiology").peekFirst()
+    assert path_labels(first.getPath()) == ["RadB"] and first.getCost() == 0
+    with pytest.raises(ValueError):
+        graph.nearestOfType("Nowhere", "Radiology")
+    with pytest.raises(ValueError):
+        graph.nearestOfType("Lobby", "Radiology", k=0)
+
+
+def assert_tree_matches_fresh(graph, tree):
+    fresh = DSAWeightedGraph.shortestPathTree(graph, tree.getSource())
+    for node in graph._vertices:
+        assert tree.getDistance(node.label) == fresh.getDistance(node.label)
+        path = tree.getPath(node.label)
+        assert path.getCost() == fresh.getDistance(node.label)
+
+
+def test_maintained_tree_repaired_on_edge_changes():
+    import random
+    rng = random.Random(3)
+    graph = build_grid_graph(size=5)
+    trees = [graph.shortestPathTree(source, maintain=True) for source in ("0,0", "2,3", "4,4")]
+    labels = [node.label for node in graph._vertices]
+    for _ in range(40):
+        a, b = rng.sample(labels, 2)
+        operation = rng.choice(("update", "remove", "add"))
+        if operation == "add" or not graph.isAdjacent(a, b):
+            graph.addWeightedEdge(a, b, rng.randint(5, 40))
+        elif operation == "remove":
+            graph.removeEdge(a, b)
+        else:
+            graph.updateEdgeWeight(a, b, rng.randint(1, 60))
+        for tree in trees:
+            assert tree.version == graph.getVersion()
+            assert_tree_matches_fresh(graph, tree)
+
+
+def test_repair_touches_only_affected_subtree():
+    graph = build_sample_graph()
+    tree = graph.shortestPathTree("A", maintain=True)
+    # Raising a non-tree edge changes no distances
+    graph.updateEdgeWeight("A", "B", 50)
+    assert [touched for _, touched in graph.getLastRepairReport()] == [0]
+    # Closing a tree edge only resets the vertices below it
+    graph.removeEdge("C", "B")
+    touched = tree.getLastRepairCount()
+    assert 0 < touched < graph.getVertexCount()
+    assert_tree_matches_fresh(graph, tree)
+
+
+def test_update_edge_weight_validation_and_vertex_invalidation():
+    graph = build_sample_graph()
+    with pytest.raises(ValueError):
+        graph.updateEdgeWeight("A", "E", 3)
+    tree = graph.shortestPathTree("A", maintain=True)
+    assert graph.getMaintainedTreeCount() == 1
+    graph.addVertex("F")
+    assert not tree.isValid()
+    assert graph.getMaintainedTreeCount() == 0
+    with pytest.raises(ValueError):
+        graph.registerShortestPathTree(tree)
+
+
+def assert_is_cycle_through(graph, cycle, start):
+    assert cycle[0] == start
+    assert len(cycle) >= 3 and len(set(cycle)) == len(cycle)
+    for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+        assert graph.isAdjacent(a, b)
+
+
+def test_dfs_cycle_through_start():
+    graph = build_sample_graph()
+    assert_is_cycle_through(graph, path_labels(graph.depthFirstSearch("A")), "A")
+    assert graph.depthFirstSearch("E").isEmpty()
+    # D is only on cycles through B and C
+    assert_is_cycle_through(graph, path_labels(graph.depthFirstSearch("D")), "D")
+
+
+def test_dfs_ignores_cycles_not_through_start():
+    graph = build_sample_graph()
+    graph.addWeightedEdge("A", "Z", 1)
+    assert graph.depthFirstSearch("Z").isEmpty()
+
+
+def test_dfs_long_chain_does_not_recurse():
+    graph = DSAWeightedGraph()
+    length = 5000
+    for i in range(length - 1):
+        graph.addWeightedEdge(str(i), str(i + 1), 1)
+    assert graph.depthFirstSearch("0").isEmpty()
+    graph.addWeightedEdge(str(length - 1), "0", 1)
+    cycle = path_labels(graph.depthFirstSearch("0"))
+    assert len(cycle) == length
+    assert_is_cycle_through(graph, cycle, "0")
+
+
+def test_connectivity_index_incremental_and_after_deletions():
+    graph = build_sample_graph()
+    assert graph.getComponentCount() == 2
+    assert graph.isConnected("A", "D")
+    assert not graph.isConnected("A", "E")
+    graph.addWeightedEdge("D", "E", 2)
+    assert graph.isConnected("A", "E") and graph.getComponentCount() == 1
+    graph.removeEdge("D", "E")
+    assert not graph.isConnected("A", "E")
+    graph.removeVertex("B")
+    graph.removeEdge("A", "C")
+    assert not graph.isConnected("A", "D")
+    assert graph.isConnected("C", "D")
+    assert graph.getComponentCount() == 3
+    with pytest.raises(ValueError):
+        graph.isConnected("A", "Missing")
+
+
+def test_astar_exits_early_across_components():
+    graph = build_grid_graph(size=4)
+    graph.addVertex("Island")
+    assert graph.aStarPathfinding("0,0", "Island").getCost() == float("inf")
+    assert graph.bidirectionalSearch("0,0", "Island").getCost() == float("inf")
+
+
+def test_queries_keep_node_flags_and_run_concurrently():
+    from concurrent.futures import ThreadPoolExecutor
+    graph = build_grid_graph(size=6)
+    labels = [node.label for node in graph._vertices]
+    # Queries no longer read or clear the shared per-node visited flags
+    for node in graph._vertices:
+        node.setVisited()
+    expected_levels = sum(1 for _ in graph.breadthFirstSearch("0,0"))
+    assert all(node.getVisited() for node in graph._vertices)
+
+    pairs = [(labels[i], labels[-1 - i]) for i in range(len(labels))]
+    expected = [graph.aStarPathfinding(a, b).getCost() for a, b in pairs]
+
+    def run(pair):
+        a, b = pair
+        levels = sum(1 for _ in graph.breadthFirstSearch(a))
+        cycle = graph.depthFirstSearch(a)
+        return graph.aStarPathfinding(a, b).getCost(), levels, cycle.getCount()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, pairs * 4))
+    assert [cost for cost, _, _ in results] == expected * 4
+    assert all(cycle_length >= 3 for _, _, cycle_length in results)
+    assert [levels for _, levels, _ in results][0] == expected_levels
+
+
+def level_labels(levels):
+    return [[node.label for node in level] for level in levels]
+
+
+def test_bfs_levels_generator_matches_materialized():
+    graph = build_grid_graph(size=4)
+    assert level_labels(graph.iterBreadthFirstLevels("0,0")) == level_labels(graph.breadthFirstSearch("0,0"))
+    assert len(level_labels(graph.breadthFirstSearch("0,0"))) == 7
+
+
+def test_bfs_levels_cutoffs_and_laziness():
+    graph = build_grid_graph(size=4)
+    assert level_labels(graph.iterBreadthFirstLevels("0,0", max_depth=1)) == [["0,0"], ["0,1", "1,0"]]
+    limited = level_labels(graph.iterBreadthFirstLevels("0,0", max_nodes=4))
+    assert [len(level) for level in limited] == [1, 2, 1]
+    # Invalid input is reported when the generator is created, not when consumed
+    with pytest.raises(ValueError):
+        graph.iterBreadthFirstLevels("Missing")
+    levels = graph.iterBreadthFirstLevels("0,0")
+    assert level_labels([next(levels)]) == [["0,0"]]
+    # Mutations before the next level is requested are seen by the expansion
+    graph.addWeightedEdge("0,0", "Annex", 1)
+    assert "Annex" in level_labels([next(levels)])[0]
+
+
+def test_adjacency_matrix_dense_and_sparse():
+    graph = build_sample_graph()
+    matrix = graph.toAdjacencyMatrix()
+    assert matrix.shape == (5, 5)
+    assert matrix[0, 1] == matrix[1, 0] == 4
+    assert matrix[3, 2] == 8
+    assert (matrix == matrix.T).all()
+    assert matrix[4].sum() == 0
+    rows, cols, weights = graph.toAdjacencyMatrix(sparse=True)
+    assert len(rows) == len(cols) == len(weights) == 2 * graph.getEdgeCount()
+    assert (matrix[rows, cols] == weights).all()
+
+
+def test_display_renders_in_one_write():
+    import io
+    graph = build_sample_graph()
+    buffer = io.StringIO()
+    graph.displayAsMatrix(buffer)
+    lines = buffer.getvalue().splitlines()
+    assert lines[0] == " \tA\tB\tC\tD\tE"
+    assert lines[1] == "A\t0\t4\t2\t0\t0"
+    assert lines[5] == "E\t0\t0\t0\t0\t0"
+    buffer = io.StringIO()
+    graph.displayAsList(buffer)
+    lines = buffer.getvalue().splitlines()
+    assert lines[0] == "Weighted Undirected Graph: |V|=5, |E|=5"
+    assert lines[1] == "A: [B(4), C(2)]"
+    assert lines[5] == "E: []"
+    assert DSAWeightedGraph().renderAsMatrix() == "Empty graph"
+
+
+def test_matrix_keeps_integer_weights_beside_floats():
+    graph = build_sample_graph()
+    graph.addWeightedEdge("D", "E", 2.5)
+    lines = graph.renderAsMatrix().splitlines()
+    assert lines[1] == "A\t0\t4\t2\t0\t0"
+    assert lines[4].endswith("\t2.5")
+    assert lines[5] == "E\t0\t0\t0\t2.5\t0"
+
+
+def test_snapshot_round_trip(tmp_path):
+    graph = build_grid_graph(size=4)
+    graph.addVertex("Store")
+    graph.getVertex("0,0").getValue()["type"] = "Entrance"
+    snapshot = str(tmp_path / "grid.npz")
+    graph.saveSnapshot(snapshot)
+
+    loaded = DSAWeightedGraph()
+    loaded.loadSnapshot(snapshot)
+    assert loaded.getVertexCount() == graph.getVertexCount()
+    assert loaded.getEdgeCount() == graph.getEdgeCount()
+    assert loaded.renderAsList() == graph.renderAsList()
+    assert loaded.getVertex("1,2").getCoordinates() == (20, 10)
+    assert loaded.getVertex("0,0").getType() == "Entrance"
+    assert loaded.getVertex("Store").getValue() is None
+    assert loaded.freeze().version == loaded.getVersion()
+    assert loaded.aStarPathfinding("0,0", "3,3").getCost() == graph.aStarPathfinding("0,0", "3,3").getCost()
+    assert not loaded.isConnected("0,0", "Store")
+    with pytest.raises(ValueError):
+        loaded.loadSnapshot(snapshot)
+
+
+def tamper_snapshot(source, target, **changes):
+    with np.load(source, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    arrays.update(changes)
+    np.savez(target, **arrays)
+
+
+def test_malformed_snapshots_rejected(tmp_path):
+    graph = build_sample_graph()
+    snapshot = str(tmp_path / "sample.npz")
+    graph.saveSnapshot(snapshot)
+    with np.load(snapshot) as data:
+        offsets, neighbors, weights = data["offsets"], data["neighbors"], data["weights"]
+
+    asymmetric = neighbors.copy()
+    asymmetric[0] = 3  # A-B becomes A-D, but D keeps no corridor back to A
+    self_loop = neighbors.copy()
+    self_loop[0] = 0
+    backwards = offsets.copy()
+    backwards[1], backwards[2] = offsets[2], offsets[1]
+    cases = [
+        {"neighbors": asymmetric},
+        {"neighbors": self_loop},
+        {"offsets": backwards},
+        {"offsets": offsets[:-1]},
+        {"neighbors": neighbors[:-1], "weights": weights[:-1], "offsets": np.append(offsets[:-1], len(neighbors) - 1)},
+        {"neighbors": np.where(neighbors == neighbors.max(), len(offsets) + 5, neighbors)},
+    ]
+    for index, changes in enumerate(cases):
+        broken = str(tmp_path / f"broken{index}.npz")
+        tamper_snapshot(snapshot, broken, **changes)
+        with pytest.raises(ValueError):
+            DSAWeightedGraph().loadSnapshot(broken)
+
+
+def test_time_dependent_search_follows_congestion(tmp_path):
+    graph = build_sample_graph()
+    # C-B is congested around 08:00 (480): 1 minute at night, 20 at the peak
+    graph.setEdgeProfile("C", "B", [420, 480, 540], [1, 20, 1])
+    assert graph.getEdgeProfile("B", "C") is graph.getEdgeProfile("C", "B")
+    assert graph.getTravelTime("B", "C", 480) == 20
+    assert graph.getTravelTime("A", "B", 480) == 4
+
+    night = graph.timeDependentPathfinding("A", "D", 120)
+    assert path_labels(night.getPath()) == ["A", "C", "B", "D"]
+    assert night.getCost() == pytest.approx(8)
+    peak = graph.timeDependentPathfinding("A", "D", 478)
+    assert path_labels(peak.getPath()) == ["A", "B", "D"]
+    assert peak.getCost() == pytest.approx(9)
+    # Static algorithms keep using the weight
+    assert graph.aStarPathfinding("A", "D").getCost() == 8
+
+    snapshot = str(tmp_path / "profiles.npz")
+    graph.saveSnapshot(snapshot)
+    loaded = DSAWeightedGraph()
+    loaded.loadSnapshot(snapshot)
+    assert loaded.getProfileCount() == 1
+    assert loaded.getTravelTime("B", "C", 450) == pytest.approx(graph.getTravelTime("B", "C", 450))
+
+    graph.clearEdgeProfile("B", "C")
+    assert not graph.hasTimeProfiles()
+    assert graph.timeDependentPathfinding("A", "D", 478).getCost() == 8
+    with pytest.raises(ValueError):
+        graph.setEdgeProfile("A", "D", [0], [1])
+
+
+def test_time_dependent_heuristic_stays_admissible():
+    graph = build_grid_graph()
+    # Profiles far below the static weights at night
+    graph.setEdgeProfile("0,0", "0,1", [0, 600], [2, 40])
+    graph.setEdgeProfile("2,2", "2,3", [0, 600], [2, 40])
+    for departure in (0, 300, 600, 1500):
+        expected = graph.timeDependentPathfinding("0,0", "5,5", departure, heuristic="none").getCost()
+        for mode in ("euclidean", "alt"):
+            result = graph.timeDependentPathfinding("0,0", "5,5", departure, heuristic=mode)
+            assert result.getCost() == pytest.approx(expected)
+    graph.removeVertex("2,2")
+    assert graph.getProfileCount() == 1
+
+
+def test_from_edge_list_dedups_and_matches_incremental_build():
+    edges = [("A", "B", 4), ("B", "A", 4), ("A", "C", 2), ("C", "B", 1), ("B", "C", 1),
+             ("B", "D", 5), ("C", "D", 8), ("D", "C", 8)]
+    graph = DSAWeightedGraph.fromEdgeList([(label, None) for label in "ABCDE"], edges)
+    expected = build_sample_graph()
+    assert graph.getEdgeCount() == 5
+    assert graph.renderAsList() == expected.renderAsList()
+    assert graph.getComponentCount() == 2
+    assert graph.aStarPathfinding("A", "D").getCost() == 8
+
+    # Endpoints missing from the vertex list are created on the fly
+    graph = DSAWeightedGraph.fromEdgeList([], [("X", "Y", 3)])
+    assert graph.getVertexCount() == 2 and graph.isAdjacent("Y", "X")
+    with pytest.raises(ValueError):
+        DSAWeightedGraph.fromEdgeList([], [("X", "X", 3)])
+    with pytest.raises(ValueError):
+        graph.loadEdgeList([], [])
+
+
+def test_edge_index_built_for_hubs_and_kept_consistent():
+    from DataStructures.DSAWeightedGraph import DSAGraphNode
+    graph = DSAWeightedGraph()
+    spokes = DSAGraphNode.EDGE_INDEX_THRESHOLD + 10
+    for i in range(spokes):
+        graph.addWeightedEdge("Hub", f"Ward {i}", i + 1)
+    hub = graph.getVertex("Hub")
+    assert hub.hasEdgeIndex()
+    assert not graph.getVertex("Ward 0").hasEdgeIndex()
+    assert graph.getEdgeWeight("Hub", "Ward 7") == 8
+    graph.addWeightedEdge("Hub", "Ward 7", 99)  # duplicate ignored
+    assert graph.getAdjacentCount("Hub") == spokes
+    graph.updateEdgeWeight("Hub", "Ward 7", 3)
+    assert graph.getEdgeWeight("Ward 7", "Hub") == 3
+    graph.removeEdge("Ward 7", "Hub")
+    assert not graph.isAdjacent("Hub", "Ward 7")
+    assert hub.getEdge("Ward 7") is None
+    graph.addWeightedEdge("Hub", "Ward 7", 4)
+    assert graph.getEdgeWeight("Hub", "Ward 7") == 4
+    # The index mirrors the adjacency list exactly
+    for edge in hub.getAdjacent():
+        assert hub.getEdge(edge.getDestination()) is edge
+
+
+def assert_adjacency_symmetric(graph):
+    edge_ends = 0
+    for node in graph._vertices:
+        for edge in node.getAdjacent():
+            other = edge.getDestination()
+            assert graph.hasVertex(other.label)
+            assert other.getEdgeWeight(node) == edge.getWeight()
+            edge_ends += 1
+    assert edge_ends == 2 * graph.getEdgeCount()
+
+
+def test_remove_vertex_unlinks_mirrored_edges(tmp_path):
+    graph = build_grid_graph(size=5)
+    for i in range(20):
+        graph.addWeightedEdge("2,2", f"Bay {i}", 1)
+    snapshot = str(tmp_path / "grid.npz")
+    graph.saveSnapshot(snapshot)
+    loaded = DSAWeightedGraph()
+    loaded.loadSnapshot(snapshot)
+    bulk = DSAWeightedGraph.fromEdgeList(
+        [], [(node.label, edge.getDestination().label, edge.getWeight())
+             for node in graph._vertices for edge in node.getAdjacent()])
+
+    for candidate in (graph, loaded, bulk):
+        edges_before = candidate.getEdgeCount()
+        candidate.removeVertex("2,2")
+        assert candidate.getEdgeCount() == edges_before - 24
+        assert not candidate.hasVertex("2,2")
+        assert "2,2" not in [node.label for node in candidate._vertices]
+        assert_adjacency_symmetric(candidate)
+        candidate.addWeightedEdge("2,2", "2,1", 5)  # re-adding works
+        assert candidate.isAdjacent("2,1", "2,2")
+        candidate.removeVertex("0,0")
+        assert_adjacency_symmetric(candidate)
@@ -0,0 +1,52 @@
+import sys
+import os
+import json
+import pytest
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from model.HospitalConfigReader import iter_departments  # noqa: E402
+
+CONFIG_FILE = os.path.join(PROJECT_ROOT, "config", "hospital_config.json")
+
+
+def test_streams_same_records_as_json_load():
+    with open(CONFIG_FILE) as file:
+        expected = json.load(file)
+    for chunk_size in (1, 7, 65536):
+        assert list(iter_departments(CONFIG_FILE, chunk_size=chunk_size)) == expected
+
+
+def test_compact_and_empty_arrays(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('[{"department":"A","corridors":[]},{"department":"B"}]')
+    assert [d["department"] for d in iter_departments(str(path), chunk_size=3)] == ["A", "B"]
+    path.write_text("  [ ]  ")
+    assert list(iter_departments(str(path))) == []
+
+
+@pytest.mark.parametrize("text", ['{"department": "A"}', '[{"department": "A"}', '[{"department": ]'])
+def test_invalid_configs_rejected(tmp_path, text):
+    path = tmp_path / "config.json"
+    path.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_departments(str(path), chunk_size=4))
+
+
+@pytest.mark.parametrize("text", [
+    '[{"department": "A"} {"department": "B"}]',
+    '[, {"department": "A"}]',
+    '[{"department": "A"},, {"department": "B"}]',
+    '[{"department": "A"},,,{"department": "B"},]',
+    '[{"department": "A"}, ]',
+    '[,]',
+])
+def test_misplaced_commas_rejected(tmp_path, text):
+    path = tmp_path / "config.json"
+    path.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_departments(str(path), chunk_size=4))
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
@@ -0,0 +1,296 @@
+import sys
+import os
+import json
+import shutil
+import pytest
+
+# Ensure the Assignment directory is importable when running tests from repo root
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from model.HospitalModel import HospitalModel  # noqa: E402
+from view.HospitalView import HospitalView  # noqa: E402
+
+CONFIG_FILE = os.path.join(PROJECT_ROOT, "config", "hospital_config.json")
+
+
+@pytest.fixture
+def config_copy(tmp_path):
+    target = tmp_path / "hospital_config.json"
+    shutil.copy(CONFIG_FILE, target)
+    return str(target)
+
+
+def path_labels(result):
+    return [label for label in result.getPath()]
+
+
+def test_loads_departments_with_coordinates(config_copy):
+    model = HospitalModel(config_copy)
+    assert model.get_graph().getVertexCount() == 10
+    assert model.get_graph().getEdgeCount() == 11
+    assert model.get_department_info("Emergency")["coordinates"] == (50, 40)
+
+
+def test_shortest_path(config_copy):
+    model = HospitalModel(config_copy)
+    result = model.find_shortest_path("Emergency", "Wards")
+    assert path_labels(result) == ["Emergency", "ICU", "Operating Theatre", "Wards"]
+    assert result.getCost() == 24
+    assert model.find_shortest_path("Emergency", "Isolated Department").getCost() == float("inf")
+    assert model.find_shortest_path("Emergency", "Nowhere") is None
+
+
+def test_route_table_is_persisted_and_reused(config_copy):
+    model = HospitalModel(config_copy)
+    model.enable_route_table()
+    assert os.path.exists(model.get_route_table_path())
+    expected = model.find_shortest_path("Outpatient", "Wards")
+
+    reloaded = HospitalModel(config_copy)
+    table = reloaded.enable_route_table()
+    assert reloaded.get_graph().getAllPairs() is table
+    result = reloaded.find_shortest_path("Outpatient", "Wards")
+    assert path_labels(result) == path_labels(expected)
+    assert result.getCost() == expected.getCost() == 35
+
+
+def test_corrupt_route_table_is_recomputed(config_copy, capsys):
+    model = HospitalModel(config_copy)
+    model.enable_route_table()
+    table_file = model.get_route_table_path()
+    with open(table_file, "r+b") as file:
+        file.truncate(100)
+    capsys.readouterr()
+
+    reloaded = HospitalModel(config_copy)
+    reloaded.enable_route_table()
+    assert "Ignoring stale route table" in capsys.readouterr().out
+    assert reloaded.find_shortest_path("Outpatient", "Wards").getCost() == 35
+    # The recomputed table replaced the corrupt file
+    HospitalModel(config_copy).enable_route_table()
+    assert "Loaded route table" in capsys.readouterr().out
+
+
+def test_shortest_path_tree_cache(config_copy):
+    model = HospitalModel(config_copy, spt_cache_size=2)
+    model.find_shortest_path("Reception", "Wards")
+    model.find_shortest_path("Reception", "ICU")
+    model.find_shortest_path("Emergency", "Wards")
+    model.find_shortest_path("Pharmacy", "Wards")  # evicts Reception
+    stats = model.get_spt_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+
+def test_shortest_path_tree_cache_repaired_on_mutation(config_copy):
+    model = HospitalModel(config_copy)
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 24
+    model.get_graph().addWeightedEdge("Emergency", "Wards", 3)
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 3
+    model.get_graph().removeEdge("Emergency", "Wards")
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 24
+    assert model.get_spt_cache_stats()["misses"] == 1
+
+
+def test_shortest_path_tree_cache_rebuilt_after_vertex_change(config_copy):
+    model = HospitalModel(config_copy, spt_cache_size=1)
+    model.find_shortest_path("Emergency", "Wards")
+    model.get_graph().addWeightedEdge("Emergency", "Annex", 2)
+    assert model.find_shortest_path("Emergency", "Annex").getCost() == 2
+    model.find_shortest_path("Reception", "Wards")  # evicts and unregisters Emergency
+    assert model.get_graph().getMaintainedTreeCount() == 1
+
+
+def test_cache_disabled_uses_astar(config_copy):
+    model = HospitalModel(config_copy, spt_cache_size=0)
+    assert model.get_spt_cache_stats() is None
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 24
+
+
+def test_routing_modes_agree(config_copy):
+    model = HospitalModel(config_copy)
+    for mode in ("auto", "astar", "bidirectional"):
+        result = model.find_shortest_path("Outpatient", "Wards", mode=mode)
+        assert result.getCost() == 35
+    assert model.find_shortest_path("Outpatient", "Wards", mode="teleport") is None
+
+
+def test_contraction_hierarchy_mode(config_copy):
+    model = HospitalModel(config_copy)
+    model.enable_contraction_hierarchy()
+    assert os.path.exists(model.get_hierarchy_path())
+    result = model.find_shortest_path("Outpatient", "Wards", mode="ch")
+    assert result.getCost() == 35
+    assert path_labels(result)[0] == "Outpatient"
+    reloaded = HospitalModel(config_copy)
+    hierarchy = reloaded.enable_contraction_hierarchy()
+    assert reloaded.get_graph().getContractionHierarchy() is hierarchy
+    assert reloaded.find_shortest_path("Emergency", "Isolated Department", mode="ch").getCost() == float("inf")
+
+
+def test_corrupt_contraction_hierarchy_is_rebuilt(config_copy, capsys):
+    model = HospitalModel(config_copy)
+    model.enable_contraction_hierarchy()
+    open(model.get_hierarchy_path(), "wb").close()
+    capsys.readouterr()
+
+    reloaded = HospitalModel(config_copy)
+    reloaded.enable_contraction_hierarchy()
+    out = capsys.readouterr().out
+    assert "Ignoring stale contraction hierarchy" in out
+    assert "Saved contraction hierarchy" in out
+    assert reloaded.find_shortest_path("Outpatient", "Wards", mode="ch").getCost() == 35
+
+
+def test_find_nearest_department(config_copy):
+    model = HospitalModel(config_copy)
+    results = model.find_nearest_department("Reception", "Laboratory")
+    assert results.getCount() == 1
+    assert results.peekFirst().getCost() == 14
+    assert model.get_department_info("Pharmacy")["type"] == "Pharmacy"
+    assert model.find_nearest_department("Nowhere", "Laboratory") is None
+
+
+def test_find_alternative_routes(config_copy, capsys):
+    model = HospitalModel(config_copy)
+    routes = model.find_alternative_routes("Emergency", "Wards", 3)
+    costs = [route.getCost() for route in routes]
+    assert costs[0] == model.find_shortest_path("Emergency", "Wards", mode="astar").getCost()
+    assert costs == sorted(costs)
+    assert len({tuple(path_labels(route)) for route in routes}) == len(costs)
+    # Same answer without a cached destination tree
+    uncached = HospitalModel(config_copy, spt_cache_size=0)
+    assert [r.getCost() for r in uncached.find_alternative_routes("Emergency", "Wards", 3)] == costs
+    assert model.find_alternative_routes("Wards", "Isolated Department").isEmpty()
+    assert model.find_alternative_routes("Nowhere", "Wards") is None
+
+    capsys.readouterr()
+    HospitalView().display_alternative_routes(routes, "Emergency", "Wards")
+    output = capsys.readouterr().out
+    assert "Route 1" in output and f"Route {len(costs)}" in output
+
+
+# Shift-change rush hours on two corridors, as (HH:MM, minutes) breakpoints
+RUSH_PROFILES = {
+    ("Emergency", "ICU"): [["06:45", 5], ["07:15", 20], ["07:45", 5],
+                           ["18:45", 5], ["19:15", 20], ["19:45", 5]],
+    ("ICU", "Operating Theatre"): [["07:00", 7], ["07:30", 25], ["08:00", 7],
+                                   ["19:00", 7], ["19:30", 25], ["20:00", 7]],
+}
+
+
+@pytest.fixture
+def congested_config(config_copy):
+    with open(config_copy) as file:
+        departments = json.load(file)
+    for dept in departments:
+        for corridor in dept.get("corridors", []):
+            profile = RUSH_PROFILES.get((dept["department"], corridor["department"]))
+            if profile is not None:
+                corridor["profile"] = profile
+    with open(config_copy, "w") as file:
+        json.dump(departments, file, indent=2)
+    return config_copy
+
+
+def test_congestion_profiles_from_config(congested_config):
+    model = HospitalModel(congested_config)
+    assert model.has_time_profiles()
+    assert model.find_shortest_path_at("Emergency", "Wards", "03:00").getCost() == 24
+    # Shift change congests ICU - Operating Theatre, so the route detours via Radiology
+    rush = model.find_shortest_path_at("Emergency", "Wards", "07:10")
+    assert path_labels(rush)[2] == "Radiology"
+    assert rush.getCost() > 24
+    assert model.find_shortest_path_at("Emergency", "Wards", 430).getCost() == rush.getCost()
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 24
+    assert model.find_shortest_path_at("Emergency", "Wards", "7am") is None
+    assert model.parse_clock_time("19:45") == 1185
+
+    # Profiles survive the binary snapshot
+    from_snapshot = HospitalModel(congested_config)
+    assert from_snapshot.get_graph().getProfileCount() == model.get_graph().getProfileCount()
+    assert from_snapshot.find_shortest_path_at("Emergency", "Wards", "07:10").getCost() == pytest.approx(rush.getCost())
+
+
+def test_batch_routes_in_input_order(config_copy):
+    model = HospitalModel(config_copy)
+    pairs = [("Emergency", "Wards"), ("Reception", "Laboratory"), ("Emergency", "Pharmacy"),
+             ("Nowhere", "Wards"), ("Wards", "Isolated Department"), ("Emergency", "Nowhere")]
+    for workers in (1, 2):
+        results = [r for r in model.find_shortest_paths_batch(pairs, max_workers=workers)]
+        assert len(results) == len(pairs)
+        for (start, end), result in zip(pairs, results):
+            expected = model.find_shortest_path(start, end, mode="astar")
+            if expected is None:
+                assert result is None
+            else:
+                assert result.getCost() == expected.getCost()
+                if expected.getCost() != float("inf"):
+                    assert path_labels(result)[0] == start and path_labels(result)[-1] == end
+
+
+def test_are_connected(config_copy):
+    model = HospitalModel(config_copy)
+    assert model.are_connected("Emergency", "Wards")
+    assert not model.are_connected("Emergency", "Isolated Department")
+    assert not model.are_connected("Emergency", "Nowhere")
+
+
+def test_iter_reachable_departments(config_copy):
+    model = HospitalModel(config_copy)
+    levels = model.iter_reachable_departments("Emergency", max_depth=1)
+    labels = [[node.label for node in level] for level in levels]
+    assert labels[0] == ["Emergency"]
+    assert len(labels) == 2
+    assert model.iter_reachable_departments("Nowhere") is None
+
+
+def test_snapshot_used_when_newer_than_json(config_copy, capsys):
+    first = HospitalModel(config_copy)
+    snapshot = first.get_snapshot_path()
+    assert os.path.exists(snapshot)
+    capsys.readouterr()
+
+    second = HospitalModel(config_copy)
+    assert "from snapshot" in capsys.readouterr().out
+    assert second.get_graph().renderAsList() == first.get_graph().renderAsList()
+    assert second.get_department_info("Emergency") == first.get_department_info("Emergency")
+    assert second.find_shortest_path("Emergency", "Wards").getCost() == 24
+
+    # An edited config is newer than the snapshot, so JSON is parsed again
+    stamp = os.path.getmtime(config_copy)
+    os.utime(snapshot, (stamp - 10, stamp - 10))
+    HospitalModel(config_copy)
+    assert "from snapshot" not in capsys.readouterr().out
+    assert os.path.getmtime(snapshot) >= os.path.getmtime(config_copy)
+
+
+def test_snapshot_disabled(config_copy):
+    model = HospitalModel(config_copy, use_snapshot=False)
+    assert not os.path.exists(model.get_snapshot_path())
+
+
+@pytest.mark.parametrize("keep_bytes", [0, 200])
+def test_corrupt_snapshot_falls_back_to_json(config_copy, capsys, keep_bytes):
+    snapshot = HospitalModel(config_copy).get_snapshot_path()
+    with open(snapshot, "rb") as file:
+        data = file.read()
+    # A zero-byte or truncated snapshot that still looks newer than the JSON
+    with open(snapshot, "wb") as file:
+        file.write(data[:keep_bytes])
+    capsys.readouterr()
+
+    model = HospitalModel(config_copy)
+    assert "Ignoring unreadable snapshot" in capsys.readouterr().out
+    assert model.get_graph().getVertexCount() == 10
+    assert model.get_graph().getEdgeCount() == 11
+    assert model.find_shortest_path("Emergency", "Wards").getCost() == 24
+    # The JSON parse rewrote a readable snapshot in place
+    assert HospitalModel(config_copy).get_graph().getVertexCount() == 10
+    assert "from snapshot" in capsys.readouterr().out
+    assert [name for name in os.listdir(os.path.dirname(snapshot)) if name.endswith(".tmp")] == []
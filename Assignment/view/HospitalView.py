@@ -1,4 +1,5 @@
 from DataStructures.DSALinkedList import DSALinkedList
+from DataStructures.DSAHashTable import DSAHashTable
 
 class HospitalView:
     """
@@ -28,13 +29,15 @@ class HospitalView:
         print("4. Display Hospital Map")
         print("5. Display Distance Matrix")
         print("6. Department Information")
-        print("7. Exit")
+        print("7. Find Nearest Department by Type")
+        print("8. Find Alternative Routes")
+        print("9. Exit")
         print("-" * 30)
     
     def get_user_choice(self):
         """Get user menu choice."""
         try:
-            choice = input("Enter your choice (1-7): ").strip()
+            choice = input("Enter your choice (1-9): ").strip()
             return int(choice)
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -44,6 +47,40 @@ class HospitalView:
         """Get department name from user."""
         return input(f"{prompt}: ").strip()
     
+    def get_count_input(self, prompt, default):
+        """Get a positive count from user, falling back to the default."""
+        response = input(f"{prompt} [{default}]: ").strip()
+        if not response:
+            return default
+        try:
+            count = int(response)
+            return count if count > 0 else default
+        except ValueError:
+            print(f"Invalid number. Using {default}.")
+            return default
+    
+    def get_limit_input(self, prompt):
+        """Get an optional positive limit from user; blank or invalid means no limit."""
+        response = input(f"{prompt} (blank for no limit): ").strip()
+        if not response:
+            return None
+        try:
+            limit = int(response)
+            return limit if limit > 0 else None
+        except ValueError:
+            print("Invalid number. Showing everything.")
+            return None
+    
+    def get_time_input(self, prompt):
+        """Get an optional time of day as "HH:MM"; blank means no time given."""
+        response = input(f"{prompt} (HH:MM, blank to ignore congestion): ").strip()
+        return response if response else None
+    
+    def format_clock_time(self, minutes):
+        """Format minutes since midnight as HH:MM, wrapping past midnight."""
+        minutes = int(round(minutes)) % 1440
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+    
     def display_departments(self, departments):
         """Display list of departments."""
         print("\nAvailable Departments:")
@@ -54,8 +91,8 @@ class HospitalView:
             i += 1
         print("-" * 40)
     
-    def display_shortest_path(self, path, total_cost, start_dept, end_dept):
-        """Display shortest path results."""
+    def display_shortest_path(self, path, total_cost, start_dept, end_dept, departure=None):
+        """Display shortest path results; with a departure time (minutes) also show the arrival."""
         print(f"\nSHORTEST PATH: {start_dept} → {end_dept}")
         print("=" * 50)
         
@@ -86,6 +123,10 @@ class HospitalView:
             path_count += 1
         
         print(f"Path: {path_string}")
+        if departure is not None:
+            total_cost = round(total_cost, 1)
+            print(f"Departure: {self.format_clock_time(departure)}  "
+                  f"Arrival: {self.format_clock_time(departure + total_cost)}")
         print(f"Total Walking Time: {total_cost} minutes")
         print(f"Number of Corridors: {path_count - 1}")
         
@@ -100,8 +141,99 @@ class HospitalView:
                 step_num += 1
             prev_node = node
     
+    def display_nearest_departments(self, results, start_dept, dept_type):
+        """Display the nearest departments of a type with their routes."""
+        print(f"\nNEAREST {dept_type.upper()} FROM: {start_dept}")
+        print("=" * 50)
+        
+        if results is None:
+            print("Error finding nearest departments")
+            return
+        
+        if results.isEmpty():
+            print(f"No reachable department of type '{dept_type}'")
+            return
+        
+        rank = 1
+        for result in results:
+            # Build path string using DSA-compliant iteration
+            path_string = ""
+            destination = None
+            for node in result.getPath():
+                path_string = str(node) if destination is None else path_string + f" → {node}"
+                destination = node
+            print(f"   {rank}. {destination} ({result.getCost()} minutes)")
+            print(f"      Path: {path_string}")
+            rank += 1
+    
+    def display_alternative_routes(self, routes, start_dept, end_dept):
+        """
+        Display alternative routes side by side, one column per route.
+        Departments that are not on the primary route are marked with *.
+        """
+        print(f"\nALTERNATIVE ROUTES: {start_dept} → {end_dept}")
+        print("=" * 50)
+        
+        if routes is None:
+            print("Error finding alternative routes")
+            return
+        
+        if routes.isEmpty():
+            print("No path found between departments")
+            return
+        
+        # Collect each route's steps and the departments of the primary route
+        columns = DSALinkedList()
+        primary = None
+        longest = 0
+        for route in routes:
+            steps = DSALinkedList()
+            for node in route.getPath():
+                steps.insertLast(str(node))
+            if primary is None:
+                primary = DSAHashTable()
+                for name in steps:
+                    primary.put(name, True)
+            longest = max(longest, steps.getCount())
+            columns.insertLast((route, steps))
+        
+        width = 12
+        for _, steps in columns:
+            for name in steps:
+                width = max(width, len(name) + 2)
+        
+        best_cost = routes.peekFirst().getCost()
+        header = f"{'':<12}"
+        times = f"{'Time':<12}"
+        corridors = f"{'Corridors':<12}"
+        number = 1
+        for route, steps in columns:
+            extra = route.getCost() - best_cost
+            header += f"{'Route ' + str(number):<{width}}"
+            times += f"{str(route.getCost()) + (f' (+{extra})' if extra else ''):<{width}}"
+            corridors += f"{steps.getCount() - 1:<{width}}"
+            number += 1
+        print(header.rstrip())
+        print(times.rstrip())
+        print(corridors.rstrip())
+        print("-" * (12 + width * columns.getCount()))
+        
+        # One row per step; walk every column's list in step with the others
+        iterators = DSALinkedList()
+        for _, steps in columns:
+            iterators.insertLast(iter(steps))
+        for step in range(1, longest + 1):
+            row = f"{str(step) + '.':<12}"
+            for iterator in iterators:
+                name = next(iterator, "")
+                marked = f"{name}*" if name and not primary.hasKey(name) else name
+                row += f"{marked:<{width}}"
+            print(row.rstrip())
+        if columns.getCount() > 1:
+            print("\n* not on route 1")
+    
     def display_reachable_departments(self, levels, start_dept):
-        """Display reachable departments by level."""
+        """Display reachable departments by level (levels may be a lazy generator)."""
         print(f"\nREACHABLE DEPARTMENTS FROM: {start_dept}")
         print("=" * 50)
         
@@ -109,10 +241,6 @@ class HospitalView:
             print("Error getting reachable departments")
             return
         
-        if levels.isEmpty():
-            print("No reachable departments found")
-            return
-        
         level_num = 0
         for level in levels:
             if not level.isEmpty():
@@ -130,6 +258,9 @@ class HospitalView:
                 
                 print(f"   Departments: {dept_string}")
                 level_num += 1
+        
+        if level_num == 0:
+            print("No reachable departments found")
     
     def display_cycles(self, cycles, start_dept):
         """Display detected cycles."""
@@ -189,6 +320,11 @@ class HospitalView:
             return
         
         print(f"Name: {dept_info['name']}")
+        if dept_info.get('type') is not None:
+            print(f"Type: {dept_info['type']}")
+        if dept_info.get('coordinates') is not None:
+            x, y = dept_info['coordinates']
+            print(f"Location: ({x}, {y})")
     
     def display_adjacent_departments(self, adjacent_depts, dept_name):
         """Display adjacent departments."""